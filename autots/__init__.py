@@ -3,32 +3,37 @@ Automated Time Series Model Selection for Python
 
 https://github.com/winedarksea/AutoTS
 """
-from autots.datasets import (
-    load_hourly,
-    load_daily,
-    load_monthly,
-    load_yearly,
-    load_weekly,
-    load_weekdays,
-    load_live_daily,
-    load_linear,
-    load_artificial,
-    load_sine,
-)
-
-from autots.evaluator.auto_ts import AutoTS
-from autots.evaluator.event_forecasting import EventRiskForecast
-from autots.tools.transform import GeneralTransformer, RandomTransform
-from autots.tools.shaping import long_to_wide
-from autots.tools.regressor import create_lagged_regressor, create_regressor
-from autots.evaluator.auto_model import model_forecast
-from autots.evaluator.anomaly_detector import AnomalyDetector, HolidayDetector
-from autots.models.cassandra import Cassandra
-
+import importlib
 
 __version__ = '0.5.2'
 
-TransformTS = GeneralTransformer
+# public names are imported on first access, so `import autots` stays fast
+_lazy_imports = {
+    'load_hourly': ('autots.datasets', 'load_hourly'),
+    'load_daily': ('autots.datasets', 'load_daily'),
+    'load_monthly': ('autots.datasets', 'load_monthly'),
+    'load_yearly': ('autots.datasets', 'load_yearly'),
+    'load_weekly': ('autots.datasets', 'load_weekly'),
+    'load_weekdays': ('autots.datasets', 'load_weekdays'),
+    'load_live_daily': ('autots.datasets', 'load_live_daily'),
+    'load_linear': ('autots.datasets', 'load_linear'),
+    'load_artificial': ('autots.datasets', 'load_artificial'),
+    'load_sine': ('autots.datasets', 'load_sine'),
+    'AutoTS': ('autots.evaluator.auto_ts', 'AutoTS'),
+    'load_artifact': ('autots.evaluator.auto_ts', 'load_artifact'),
+    'EventRiskForecast': ('autots.evaluator.event_forecasting', 'EventRiskForecast'),
+    'GeneralTransformer': ('autots.tools.transform', 'GeneralTransformer'),
+    'TransformTS': ('autots.tools.transform', 'GeneralTransformer'),
+    'RandomTransform': ('autots.tools.transform', 'RandomTransform'),
+    'long_to_wide': ('autots.tools.shaping', 'long_to_wide'),
+    'create_lagged_regressor': ('autots.tools.regressor', 'create_lagged_regressor'),
+    'create_regressor': ('autots.tools.regressor', 'create_regressor'),
+    'model_forecast': ('autots.evaluator.auto_model', 'model_forecast'),
+    'AnomalyDetector': ('autots.evaluator.anomaly_detector', 'AnomalyDetector'),
+    'HolidayDetector': ('autots.evaluator.anomaly_detector', 'HolidayDetector'),
+    'Cassandra': ('autots.models.cassandra', 'Cassandra'),
+}
+_subpackages = ['datasets', 'evaluator', 'models', 'templates', 'tools']
 
 __all__ = [
     'load_daily',
@@ -42,6 +47,7 @@ __all__ = [
     'load_artificial',
     'load_sine',
     'AutoTS',
+    'load_artifact',
     'TransformTS',
     'GeneralTransformer',
     'RandomTransform',
@@ -54,3 +60,18 @@ __all__ = [
     'HolidayDetector',
     'Cassandra',
 ]
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        module, attr = _lazy_imports[name]
+        value = getattr(importlib.import_module(module), attr)
+        globals()[name] = value
+        return value
+    elif name in _subpackages:
+        return importlib.import_module(f"autots.{name}")
+    raise AttributeError(f"module 'autots' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_subpackages))
@@ -1,4 +1,5 @@
 """Mid-level helper functions for AutoTS."""
+import os
 import sys
 import traceback as tb
 import random
@@ -9,7 +10,11 @@ import datetime
 import json
 from hashlib import md5
 from autots.tools.transform import RandomTransform, GeneralTransformer, shared_trans
-from autots.models.base import PredictionObject
+from autots.models.base import (
+    PredictionObject,
+    combine_interval_predictions,
+    interval_quantiles,
+)
 from autots.models.ensemble import (
     EnsembleForecast,
     generalize_horizontal,
@@ -23,37 +28,10 @@ from autots.models.model_list import (
     no_shared,
     superfast,
     model_lists,
+    float32_models,
+    interval_fit_models,
 )
 from itertools import zip_longest
-from autots.models.basics import (
-    MotifSimulation,
-    LastValueNaive,
-    AverageValueNaive,
-    SeasonalNaive,
-    ConstantNaive,
-    Motif,
-    SectionalMotif,
-    NVAR,
-    KalmanStateSpace,
-    MetricMotif,
-    SeasonalityMotif,
-)
-from autots.models.statsmodels import (
-    GLS,
-    GLM,
-    ETS,
-    ARIMA,
-    UnobservedComponents,
-    DynamicFactor,
-    VAR,
-    VECM,
-    VARMAX,
-    Theta,
-    ARDL,
-    DynamicFactorMQ,
-)
-from autots.models.arch import ARCH
-from autots.models.matrix_var import RRVAR, MAR, TMF, LATC
 
 
 def create_model_id(
@@ -101,29 +79,41 @@ def ModelMonster(
     model_lower = model.lower()
 
     if model in ['ZeroesNaive', 'ConstantNaive']:
+        from autots.models.basics import ConstantNaive
+
         return ConstantNaive(
             frequency=frequency, prediction_interval=prediction_interval, **parameters
         )
 
     elif model == 'LastValueNaive':
+        from autots.models.basics import LastValueNaive
+
         return LastValueNaive(
             frequency=frequency, prediction_interval=prediction_interval
         )
 
     elif model == 'AverageValueNaive':
+        from autots.models.basics import AverageValueNaive
+
         return AverageValueNaive(
             frequency=frequency, prediction_interval=prediction_interval, **parameters
         )
 
     elif model == 'SeasonalNaive':
+        from autots.models.basics import SeasonalNaive
+
         return SeasonalNaive(
             frequency=frequency, prediction_interval=prediction_interval, **parameters
         )
 
     elif model == 'GLS':
+        from autots.models.statsmodels import GLS
+
         return GLS(frequency=frequency, prediction_interval=prediction_interval)
 
     elif model == 'GLM':
+        from autots.models.statsmodels import GLM
+
         model = GLM(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -136,6 +126,8 @@ def ModelMonster(
         return model
 
     elif model == 'ETS':
+        from autots.models.statsmodels import ETS
+
         model = ETS(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -147,6 +139,8 @@ def ModelMonster(
         return model
 
     elif model == 'ARIMA':
+        from autots.models.statsmodels import ARIMA
+
         model = ARIMA(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -216,6 +210,8 @@ def ModelMonster(
         return model
 
     elif model == 'UnobservedComponents':
+        from autots.models.statsmodels import UnobservedComponents
+
         model = UnobservedComponents(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -228,6 +224,8 @@ def ModelMonster(
         return model
 
     elif model == 'DynamicFactor':
+        from autots.models.statsmodels import DynamicFactor
+
         model = DynamicFactor(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -239,6 +237,8 @@ def ModelMonster(
         return model
 
     elif model == 'VAR':
+        from autots.models.statsmodels import VAR
+
         model = VAR(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -250,6 +250,8 @@ def ModelMonster(
         return model
 
     elif model == 'VECM':
+        from autots.models.statsmodels import VECM
+
         model = VECM(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -261,6 +263,8 @@ def ModelMonster(
         return model
 
     elif model == 'VARMAX':
+        from autots.models.statsmodels import VARMAX
+
         model = VARMAX(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -287,6 +291,8 @@ def ModelMonster(
         return model
 
     elif model == 'MotifSimulation':
+        from autots.models.basics import MotifSimulation
+
         model = MotifSimulation(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -419,6 +425,8 @@ def ModelMonster(
 
         return model
     elif model == 'MultivariateMotif':
+        from autots.models.basics import Motif
+
         return Motif(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -429,6 +437,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == 'UnivariateMotif':
+        from autots.models.basics import Motif
+
         return Motif(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -439,6 +449,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == 'SectionalMotif':
+        from autots.models.basics import SectionalMotif
+
         return SectionalMotif(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -447,6 +459,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == 'NVAR':
+        from autots.models.basics import NVAR
+
         return NVAR(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -455,6 +469,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == 'Theta':
+        from autots.models.statsmodels import Theta
+
         return Theta(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -465,6 +481,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == 'ARDL':
+        from autots.models.statsmodels import ARDL
+
         return ARDL(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -487,6 +505,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == 'DynamicFactorMQ':
+        from autots.models.statsmodels import DynamicFactorMQ
+
         return DynamicFactorMQ(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -508,6 +528,8 @@ def ModelMonster(
             **parameters,
         )
     elif model_lower == 'arch':
+        from autots.models.arch import ARCH
+
         return ARCH(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -519,6 +541,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == 'RRVAR':
+        from autots.models.matrix_var import RRVAR
+
         return RRVAR(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -530,6 +554,8 @@ def ModelMonster(
             **parameters,
         )
     elif model_lower == 'mar':
+        from autots.models.matrix_var import MAR
+
         return MAR(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -541,6 +567,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == 'TMF':
+        from autots.models.matrix_var import TMF
+
         return TMF(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -552,6 +580,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == 'LATC':
+        from autots.models.matrix_var import LATC
+
         return LATC(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -563,6 +593,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == "KalmanStateSpace":
+        from autots.models.basics import KalmanStateSpace
+
         return KalmanStateSpace(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -573,6 +605,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == "MetricMotif":
+        from autots.models.basics import MetricMotif
+
         return MetricMotif(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -583,6 +617,8 @@ def ModelMonster(
             **parameters,
         )
     elif model == "SeasonalityMotif":
+        from autots.models.basics import SeasonalityMotif
+
         return SeasonalityMotif(
             frequency=frequency,
             prediction_interval=prediction_interval,
@@ -609,6 +645,159 @@ def ModelMonster(
         )
 
 
+def _forecast_to_float32(prediction):
+    """Cast point and bound forecasts of a PredictionObject to float32."""
+    prediction.forecast = prediction.forecast.astype(np.float32)
+    prediction.lower_forecast = prediction.lower_forecast.astype(np.float32)
+    prediction.upper_forecast = prediction.upper_forecast.astype(np.float32)
+    return prediction
+
+
+def _fit_transformer(df_train, transformation_dict: dict, model_str: str, n_jobs=None):
+    """Fit GeneralTransformer, returning (transformer, df_train_transformed, is_float32)."""
+    transformer_object = GeneralTransformer(**transformation_dict, n_jobs=n_jobs)
+    df_train_transformed = transformer_object._fit(df_train)
+    # float32 input is kept only for models which support it, outputs match input
+    is_float32 = (df_train.dtypes == np.float32).all()
+    if (
+        is_float32
+        and model_str not in float32_models
+        and (df_train_transformed.dtypes == np.float32).any()
+    ):
+        df_train_transformed = df_train_transformed.astype(float)
+    return transformer_object, df_train_transformed, is_float32
+
+
+def _finalize_prediction(
+    df_forecast,
+    transformer_object,
+    df_train,
+    forecast_length: int,
+    transformation_dict: dict,
+    model_str: str,
+    no_negatives: bool = False,
+    constraint: float = None,
+    fail_on_forecast_nan: bool = True,
+    is_float32: bool = False,
+    transformation_runtime=datetime.timedelta(0),
+    verbose: int = 0,
+):
+    """Inverse transform, check and constrain the raw PredictionObject of a fitted model."""
+    # THIS CHECKS POINT FORECAST FOR NULLS BUT NOT UPPER/LOWER FORECASTS
+    # can maybe remove this eventually and just keep the later one
+    if fail_on_forecast_nan:
+        if df_forecast.forecast.isnull().any().astype(int).sum() > 0:
+            raise ValueError(
+                "Model {} returned NaN for one or more series. fail_on_forecast_nan=True".format(
+                    model_str
+                )
+            )
+
+    transformationStartTime = datetime.datetime.now()
+    # Inverse the transformations, NULL FILLED IN UPPER/LOWER ONLY
+    forecasts = [
+        df_forecast.forecast,
+        df_forecast.lower_forecast,
+        df_forecast.upper_forecast,
+    ]
+    if hasattr(transformer_object, "inverse_transform_stacked") and all(
+        isinstance(x, pd.DataFrame)
+        and x.shape == forecasts[0].shape
+        and x.index.equals(forecasts[0].index)
+        and x.columns.equals(forecasts[0].columns)
+        for x in forecasts
+    ):
+        # one pass per transformer for point, lower and upper forecasts
+        index = df_forecast.forecast.index
+        result = transformer_object.inverse_transform_stacked(
+            np.stack([x.to_numpy() for x in forecasts]),
+            index=index,
+            columns=df_forecast.forecast.columns,
+            bounds=[False, True, True],
+        )
+        columns = transformer_object.df_colnames
+        df_forecast.forecast = pd.DataFrame(result[0], index=index, columns=columns)
+        df_forecast.lower_forecast = pd.DataFrame(
+            result[1], index=index, columns=columns
+        )
+        df_forecast.upper_forecast = pd.DataFrame(
+            result[2], index=index, columns=columns
+        )
+    else:
+        df_forecast.forecast = pd.DataFrame(
+            transformer_object.inverse_transform(df_forecast.forecast)
+        )
+        df_forecast.lower_forecast = pd.DataFrame(
+            transformer_object.inverse_transform(
+                df_forecast.lower_forecast, fillzero=True, bounds=True
+            )
+        )
+        df_forecast.upper_forecast = pd.DataFrame(
+            transformer_object.inverse_transform(
+                df_forecast.upper_forecast, fillzero=True, bounds=True
+            )
+        )
+    if is_float32:
+        df_forecast = _forecast_to_float32(df_forecast)
+    # CHECK Forecasts are proper length!
+    if df_forecast.forecast.shape[0] != forecast_length:
+        raise ValueError(f"Model {model_str} returned improper forecast_length")
+
+    if df_forecast.forecast.shape[1] != df_train.shape[1]:
+        raise ValueError("Model failed to return correct number of series.")
+
+    df_forecast.transformation_parameters = transformation_dict
+    # Remove negatives if desired
+    # There's df.where(df_forecast.forecast > 0, 0) or  df.clip(lower = 0), not sure which faster
+    if no_negatives:
+        df_forecast.lower_forecast = df_forecast.lower_forecast.clip(lower=0)
+        df_forecast.forecast = df_forecast.forecast.clip(lower=0)
+        df_forecast.upper_forecast = df_forecast.upper_forecast.clip(lower=0)
+
+    if constraint is not None:
+        if isinstance(constraint, dict):
+            constraint_method = constraint.get("constraint_method", "quantile")
+            constraint_regularization = constraint.get("constraint_regularization", 1)
+            lower_constraint = constraint.get("lower_constraint", 0)
+            upper_constraint = constraint.get("upper_constraint", 1)
+            bounds = constraint.get("bounds", False)
+        else:
+            constraint_method = "stdev_min"
+            lower_constraint = float(constraint)
+            upper_constraint = float(constraint)
+            constraint_regularization = 1
+            bounds = False
+        if verbose > 3:
+            print(
+                f"Using constraint with method: {constraint_method}, {constraint_regularization}, {lower_constraint}, {upper_constraint}, {bounds}"
+            )
+
+        df_forecast = df_forecast.apply_constraints(
+            constraint_method,
+            constraint_regularization,
+            upper_constraint,
+            lower_constraint,
+            bounds,
+            df_train,
+        )
+
+    transformation_runtime = transformation_runtime + (
+        datetime.datetime.now() - transformationStartTime
+    )
+    df_forecast.transformation_runtime = transformation_runtime
+
+    # THIS CHECKS POINT FORECAST FOR NULLS BUT NOT UPPER/LOWER FORECASTS
+    if fail_on_forecast_nan:
+        if df_forecast.forecast.isnull().any().astype(int).sum() > 0:
+            raise ValueError(
+                "Model returned NaN due to a preprocessing transformer {}. fail_on_forecast_nan=True".format(
+                    str(transformation_dict)
+                )
+            )
+
+    return df_forecast
+
+
 def ModelPrediction(
     df_train,
     forecast_length: int,
@@ -641,6 +830,7 @@ def ModelPrediction(
         model_str (str): a string to be direct to the appropriate model, used in ModelMonster
         frequency (str): str representing frequency alias of time series
         prediction_interval (float): width of errors (note: rarely do the intervals accurately match the % asked for...)
+            if a list of floats, the model is fit once and the PredictionObject has .quantile_forecast for all intervals
         no_negatives (bool): whether to force all forecasts to be > 0
         constraint (float): when not None, use this value * data st dev above max or below min for constraining forecast values.
         future_regressor_train (pd.Series): with datetime index, of known in advance data, section matching train data
@@ -677,8 +867,9 @@ def ModelPrediction(
                 pass
             print(error_msg)
 
-    transformer_object = GeneralTransformer(**transformation_dict, n_jobs=n_jobs)
-    df_train_transformed = transformer_object._fit(df_train)
+    transformer_object, df_train_transformed, is_float32 = _fit_transformer(
+        df_train, transformation_dict, model_str, n_jobs=n_jobs
+    )
 
     # make sure regressor has same length. This could be a problem if wrong size regressor is passed.
     if future_regressor_train is not None:
@@ -690,7 +881,11 @@ def ModelPrediction(
         model_str,
         parameters=parameter_dict,
         frequency=frequency,
-        prediction_interval=prediction_interval,
+        prediction_interval=(
+            prediction_interval[0]
+            if isinstance(prediction_interval, list)
+            else prediction_interval
+        ),
         holiday_country=holiday_country,
         random_seed=random_seed,
         verbose=verbose,
@@ -698,107 +893,146 @@ def ModelPrediction(
         n_jobs=n_jobs,
     )
     model = model.fit(df_train_transformed, future_regressor=future_regressor_train)
-    df_forecast = model.predict(
-        forecast_length=forecast_length, future_regressor=future_regressor_forecast
-    )
-
-    # THIS CHECKS POINT FORECAST FOR NULLS BUT NOT UPPER/LOWER FORECASTS
-    # can maybe remove this eventually and just keep the later one
-    if fail_on_forecast_nan:
-        if df_forecast.forecast.isnull().any().astype(int).sum() > 0:
-            raise ValueError(
-                "Model {} returned NaN for one or more series. fail_on_forecast_nan=True".format(
-                    model_str
+    finalize_args = {
+        'transformer_object': transformer_object,
+        'df_train': df_train,
+        'forecast_length': forecast_length,
+        'transformation_dict': transformation_dict,
+        'model_str': model_str,
+        'no_negatives': no_negatives,
+        'constraint': constraint,
+        'fail_on_forecast_nan': fail_on_forecast_nan,
+        'is_float32': is_float32,
+        'transformation_runtime': transformation_runtime,
+        'verbose': verbose,
+    }
+    if isinstance(prediction_interval, list):
+        # fit once, then predict for each interval, only a few models need a refit
+        predictions = []
+        for interval in prediction_interval:
+            if predictions and model_str in interval_fit_models:
+                model = ModelMonster(
+                    model_str,
+                    parameters=parameter_dict,
+                    frequency=frequency,
+                    prediction_interval=interval,
+                    holiday_country=holiday_country,
+                    random_seed=random_seed,
+                    verbose=verbose,
+                    forecast_length=forecast_length,
+                    n_jobs=n_jobs,
+                ).fit(df_train_transformed, future_regressor=future_regressor_train)
+            else:
+                model.prediction_interval = interval
+            predictions.append(
+                _finalize_prediction(
+                    model.predict(
+                        forecast_length=forecast_length,
+                        future_regressor=future_regressor_forecast,
+                    ),
+                    **finalize_args,
                 )
             )
-
-    transformationStartTime = datetime.datetime.now()
-    # Inverse the transformations, NULL FILLED IN UPPER/LOWER ONLY
-    df_forecast.forecast = pd.DataFrame(
-        transformer_object.inverse_transform(df_forecast.forecast)
-    )
-    df_forecast.lower_forecast = pd.DataFrame(
-        transformer_object.inverse_transform(
-            df_forecast.lower_forecast, fillzero=True, bounds=True
-        )
-    )
-    df_forecast.upper_forecast = pd.DataFrame(
-        transformer_object.inverse_transform(
-            df_forecast.upper_forecast, fillzero=True, bounds=True
+        df_forecast = combine_interval_predictions(predictions, prediction_interval)
+    else:
+        df_forecast = _finalize_prediction(
+            model.predict(
+                forecast_length=forecast_length,
+                future_regressor=future_regressor_forecast,
+            ),
+            **finalize_args,
         )
-    )
-    # CHECK Forecasts are proper length!
-    if df_forecast.forecast.shape[0] != forecast_length:
-        raise ValueError(f"Model {model_str} returned improper forecast_length")
 
-    if df_forecast.forecast.shape[1] != df_train.shape[1]:
-        raise ValueError("Model failed to return correct number of series.")
-
-    df_forecast.transformation_parameters = transformation_dict
-    # Remove negatives if desired
-    # There's df.where(df_forecast.forecast > 0, 0) or  df.clip(lower = 0), not sure which faster
-    if no_negatives:
-        df_forecast.lower_forecast = df_forecast.lower_forecast.clip(lower=0)
-        df_forecast.forecast = df_forecast.forecast.clip(lower=0)
-        df_forecast.upper_forecast = df_forecast.upper_forecast.clip(lower=0)
+    if return_model:
+        df_forecast.model = model
+        df_forecast.transformer = transformer_object
 
-    if constraint is not None:
-        if isinstance(constraint, dict):
-            constraint_method = constraint.get("constraint_method", "quantile")
-            constraint_regularization = constraint.get("constraint_regularization", 1)
-            lower_constraint = constraint.get("lower_constraint", 0)
-            upper_constraint = constraint.get("upper_constraint", 1)
-            bounds = constraint.get("bounds", False)
-        else:
-            constraint_method = "stdev_min"
-            lower_constraint = float(constraint)
-            upper_constraint = float(constraint)
-            constraint_regularization = 1
-            bounds = False
-        if verbose > 3:
-            print(
-                f"Using constraint with method: {constraint_method}, {constraint_regularization}, {lower_constraint}, {upper_constraint}, {bounds}"
-            )
+    return df_forecast
 
-        df_forecast = df_forecast.apply_constraints(
-            constraint_method,
-            constraint_regularization,
-            upper_constraint,
-            lower_constraint,
-            bounds,
-            df_train,
-        )
 
-    transformation_runtime = transformation_runtime + (
-        datetime.datetime.now() - transformationStartTime
-    )
-    df_forecast.transformation_runtime = transformation_runtime
+class _ChunkedFrame(object):
+    """DataFrame attribute accumulated as a list of chunks, concatenated once on access.
 
-    if return_model:
-        df_forecast.model = model
-        df_forecast.transformer = transformer_object
+    Appending is then cheap, instead of copying all accumulated results each time.
+    The concatenated frame is kept as the only chunk, so repeated reads return the same
+    DataFrame until the next append. Reading after every append, as AutoTS.fit does once
+    per generation, still costs one concat of all rows per read.
+    """
 
-    # THIS CHECKS POINT FORECAST FOR NULLS BUT NOT UPPER/LOWER FORECASTS
-    if fail_on_forecast_nan:
-        if df_forecast.forecast.isnull().any().astype(int).sum() > 0:
-            raise ValueError(
-                "Model returned NaN due to a preprocessing transformer {}. fail_on_forecast_nan=True".format(
-                    str(transformation_dict)
-                )
+    def __init__(self, ignore_index: bool = False):
+        self.ignore_index = ignore_index
+
+    def __set_name__(self, owner, name):
+        self.parts_name = '_' + name + '_parts'
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        parts = obj.__dict__.get(self.parts_name, [])
+        if len(parts) == 1:
+            return parts[0]
+        if parts:
+            combined = pd.concat(
+                parts, axis=0, ignore_index=self.ignore_index, sort=False
             )
+        else:
+            combined = pd.DataFrame()
+        # replace the list rather than edit, so copy.copy of the owner is unaffected
+        obj.__dict__[self.parts_name] = [combined]
+        return combined
+
+    def __set__(self, obj, value):
+        if isinstance(value, list):
+            obj.__dict__[self.parts_name] = list(value)
+        elif value.empty and value.shape[1] == 0:
+            obj.__dict__[self.parts_name] = []
+        else:
+            obj.__dict__[self.parts_name] = [value]
 
-    return df_forecast
+    def append(self, obj, value):
+        obj.__dict__[self.parts_name] = obj.__dict__.get(self.parts_name, []) + [value]
 
 
 class TemplateEvalObject(object):
     """Object to contain all the failures!.
 
+    Result DataFrames are accumulated in chunks and only concatenated when accessed.
+
     Attributes:
         full_mae_ids (list): list of model_ids corresponding to full_mae_errors
         full_mae_errors (list): list of numpy arrays of shape (rows, columns) appended in order of validation
             only provided for 'mosaic' ensembling
     """
 
+    frame_names = [
+        'model_results',
+        'per_timestamp_smape',
+        'per_series_mae',
+        'per_series_rmse',
+        'per_series_made',
+        'per_series_contour',
+        'per_series_spl',
+        'per_series_mle',
+        'per_series_imle',
+        'per_series_maxe',
+        'per_series_oda',
+        'per_series_mqae',
+        'per_series_dwae',
+    ]
+    model_results = _ChunkedFrame(ignore_index=True)
+    per_timestamp_smape = _ChunkedFrame()
+    per_series_mae = _ChunkedFrame()
+    per_series_rmse = _ChunkedFrame()
+    per_series_made = _ChunkedFrame()
+    per_series_contour = _ChunkedFrame()
+    per_series_spl = _ChunkedFrame()
+    per_series_mle = _ChunkedFrame()
+    per_series_imle = _ChunkedFrame()
+    per_series_maxe = _ChunkedFrame()
+    per_series_oda = _ChunkedFrame()
+    per_series_mqae = _ChunkedFrame()
+    per_series_dwae = _ChunkedFrame()
+
     def __init__(
         self,
         model_results=pd.DataFrame(),
@@ -839,54 +1073,24 @@ class TemplateEvalObject(object):
         """Print."""
         return 'Results objects, result table at self.model_results (pd.df)'
 
+    def __setstate__(self, state):
+        """Load, including pickles from before results were chunked."""
+        for name in self.frame_names:
+            if name in state:
+                state['_' + name + '_parts'] = [state.pop(name)]
+        self.__dict__.update(state)
+
+    def append_frame(self, name, frame):
+        """Add a DataFrame of new rows to one of the result frames, such as 'model_results'."""
+        getattr(type(self), name).append(self, frame)
+
     def concat(self, another_eval):
         """Merge another TemplateEvalObject onto this one."""
-        self.model_results = pd.concat(
-            [self.model_results, another_eval.model_results],
-            axis=0,
-            ignore_index=True,
-            sort=False,
-        ).reset_index(drop=True)
-        self.per_series_mae = pd.concat(
-            [self.per_series_mae, another_eval.per_series_mae], axis=0, sort=False
-        )
-        self.per_series_made = pd.concat(
-            [self.per_series_made, another_eval.per_series_made], axis=0, sort=False
-        )
-        self.per_series_contour = pd.concat(
-            [self.per_series_contour, another_eval.per_series_contour],
-            axis=0,
-            sort=False,
-        )
-        self.per_series_rmse = pd.concat(
-            [self.per_series_rmse, another_eval.per_series_rmse], axis=0, sort=False
-        )
-        self.per_series_spl = pd.concat(
-            [self.per_series_spl, another_eval.per_series_spl], axis=0, sort=False
-        )
-        self.per_timestamp_smape = pd.concat(
-            [self.per_timestamp_smape, another_eval.per_timestamp_smape],
-            axis=0,
-            sort=False,
-        )
-        self.per_series_mle = pd.concat(
-            [self.per_series_mle, another_eval.per_series_mle], axis=0, sort=False
-        )
-        self.per_series_imle = pd.concat(
-            [self.per_series_imle, another_eval.per_series_imle], axis=0, sort=False
-        )
-        self.per_series_maxe = pd.concat(
-            [self.per_series_maxe, another_eval.per_series_maxe], axis=0, sort=False
-        )
-        self.per_series_oda = pd.concat(
-            [self.per_series_oda, another_eval.per_series_oda], axis=0, sort=False
-        )
-        self.per_series_mqae = pd.concat(
-            [self.per_series_mqae, another_eval.per_series_mqae], axis=0, sort=False
-        )
-        self.per_series_dwae = pd.concat(
-            [self.per_series_dwae, another_eval.per_series_dwae], axis=0, sort=False
-        )
+        for name in self.frame_names:
+            new = getattr(another_eval, name)
+            if not (new.empty and new.shape[1] == 0):
+                # copy so later edits of another_eval don't change these results
+                self.append_frame(name, new.copy())
         self.full_mae_errors.extend(another_eval.full_mae_errors)
         self.full_pl_errors.extend(another_eval.full_pl_errors)
         self.squared_errors.extend(another_eval.squared_errors)
@@ -969,6 +1173,59 @@ def unpack_ensemble_models(
     return template
 
 
+def _ensemble_from_components(
+    model_name,
+    model_param_dict,
+    component_forecasts,
+    forecasts_runtime,
+    prediction_interval,
+    df_train,
+    prematched_series=None,
+):
+    """Combine PredictionObjects of ensemble components, {model_id: prediction}, with EnsembleForecast."""
+    forecasts = {k: v.forecast for k, v in component_forecasts.items()}
+    if isinstance(prediction_interval, list):
+        # components were fit once, ensemble bounds of each interval
+        ens_predictions = []
+        for interval in prediction_interval:
+            lower_q, upper_q = interval_quantiles(interval)
+            ens_predictions.append(
+                EnsembleForecast(
+                    model_name,
+                    model_param_dict,
+                    forecasts_list=list(forecasts.keys()),
+                    forecasts=forecasts,
+                    lower_forecasts={
+                        k: v.quantile(lower_q) for k, v in component_forecasts.items()
+                    },
+                    upper_forecasts={
+                        k: v.quantile(upper_q) for k, v in component_forecasts.items()
+                    },
+                    forecasts_runtime=forecasts_runtime,
+                    prediction_interval=interval,
+                    df_train=df_train,
+                    prematched_series=prematched_series,
+                )
+            )
+        ens_forecast = combine_interval_predictions(ens_predictions, prediction_interval)
+    else:
+        ens_forecast = EnsembleForecast(
+            model_name,
+            model_param_dict,
+            forecasts_list=list(forecasts.keys()),
+            forecasts=forecasts,
+            lower_forecasts={k: v.lower_forecast for k, v in component_forecasts.items()},
+            upper_forecasts={k: v.upper_forecast for k, v in component_forecasts.items()},
+            forecasts_runtime=forecasts_runtime,
+            prediction_interval=prediction_interval,
+            df_train=df_train,
+            prematched_series=prematched_series,
+        )
+    if (df_train.dtypes == np.float32).all():
+        ens_forecast = _forecast_to_float32(ens_forecast)
+    return ens_forecast
+
+
 def model_forecast(
     model_name,
     model_param_dict,
@@ -1018,6 +1275,7 @@ def model_forecast(
         forecast_length (int): number of periods to forecast
         frequency (str): str representing frequency alias of time series
         prediction_interval (float): width of errors (note: rarely do the intervals accurately match the % asked for...)
+            if a list of floats, models are fit once and the PredictionObject has .quantile_forecast for all intervals
         no_negatives (bool): whether to force all forecasts to be > 0
         constraint (float): when not None, use this value * data st dev above max or below min for constraining forecast values.
         future_regressor_train (pd.Series): with datetime index, of known in advance data, section matching train data
@@ -1052,9 +1310,7 @@ def model_forecast(
     # if an ensemble
     if model_name == 'Ensemble':
         forecasts_runtime = {}
-        forecasts = {}
-        upper_forecasts = {}
-        lower_forecasts = {}
+        component_forecasts = {}
         horizontal_flag = (
             2 if model_param_dict['model_name'].lower() in horizontal_aliases else 1
         )
@@ -1122,9 +1378,7 @@ def model_forecast(
                     + df_forecast.transformation_runtime
                 )
                 forecasts_runtime[model_id] = total_runtime
-                forecasts[model_id] = df_forecast.forecast
-                upper_forecasts[model_id] = df_forecast.upper_forecast
-                lower_forecasts[model_id] = df_forecast.lower_forecast
+                component_forecasts[model_id] = df_forecast
                 # print(f"{model_param_dict['model_name']} with shape {df_forecast.forecast.shape}")
                 if verbose >= 2:
                     p = f"Ensemble {model_param_dict['model_name']} component {index + 1} of {total_ens} {row['Model']} succeeded"
@@ -1135,19 +1389,15 @@ def model_forecast(
                     print(tb.format_exc())
                     p = f"FAILED: Ensemble {model_param_dict['model_name']} component {index + 1} of {total_ens} {row['Model']} with error: {repr(e)}"
                     print(p)
-        ens_forecast = EnsembleForecast(
+        return _ensemble_from_components(
             model_name,
             model_param_dict,
-            forecasts_list=list(forecasts.keys()),
-            forecasts=forecasts,
-            lower_forecasts=lower_forecasts,
-            upper_forecasts=upper_forecasts,
-            forecasts_runtime=forecasts_runtime,
-            prediction_interval=prediction_interval,
-            df_train=df_train,
+            component_forecasts,
+            forecasts_runtime,
+            prediction_interval,
+            df_train,
             prematched_series=all_series,
         )
-        return ens_forecast
     # if not an ensemble
     else:
         # model_str = row_upper['Model']
@@ -1202,6 +1452,366 @@ def model_forecast(
         return df_forecast
 
 
+class FittedTemplate(object):
+    """One model template, including ensembles, fit once to forecast repeatedly without refitting.
+
+    Holds the fitted GeneralTransformer and model, or for an ensemble a FittedTemplate per component.
+    Can be pickled, see AutoTS.export_artifact for a full serving artifact.
+    Forecasts always follow the end of the training data.
+
+    Args:
+        model_name (str): a string to be direct to the appropriate model, used in ModelMonster
+        model_param_dict (dict): dictionary of parameters to be passed into the model.
+        model_transform_dict (dict): a dictionary of fillNA and transformation methods to be used
+        forecast_length (int): number of periods to forecast, models such as WindowRegression fit to this horizon
+        frequency (str): str representing frequency alias of time series
+        prediction_interval (float): default width of upper/lower forecasts, may be changed at predict
+        no_negatives (bool): whether to force all forecasts to be > 0
+        constraint (float): when not None, use this value * data st dev above max or below min for constraining forecast values.
+        holiday_country (str): passed through to holiday package, used by a few models as 0/1 regressor.
+        fail_on_forecast_nan (bool): if True, raises error if any nan in forecast
+        n_jobs (int): number of CPUs to use when available.
+        template_cols (list): column names of columns used as model template
+        horizontal_subset (list): columns of df_train to use for forecast, meant for internal use for horizontal ensembling
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        model_param_dict: dict,
+        model_transform_dict: dict,
+        forecast_length: int,
+        frequency: str = 'infer',
+        prediction_interval: float = 0.9,
+        no_negatives: bool = False,
+        constraint: float = None,
+        holiday_country: str = 'US',
+        fail_on_forecast_nan: bool = True,
+        random_seed: int = 2020,
+        verbose: int = 0,
+        n_jobs: int = None,
+        template_cols: list = [
+            'Model',
+            'ModelParameters',
+            'TransformationParameters',
+            'Ensemble',
+        ],
+        horizontal_subset: list = None,
+    ):
+        if isinstance(model_param_dict, str):
+            model_param_dict = json.loads(model_param_dict)
+        if isinstance(model_transform_dict, str):
+            model_transform_dict = json.loads(model_transform_dict)
+        self.model_name = model_name
+        self.model_param_dict = model_param_dict
+        self.model_transform_dict = model_transform_dict
+        self.forecast_length = forecast_length
+        self.frequency = frequency
+        self.prediction_interval = prediction_interval
+        self.no_negatives = no_negatives
+        self.constraint = constraint
+        self.holiday_country = holiday_country
+        self.fail_on_forecast_nan = fail_on_forecast_nan
+        self.random_seed = random_seed
+        self.verbose = verbose
+        self.n_jobs = n_jobs
+        self.template_cols = template_cols
+        self.horizontal_subset = horizontal_subset
+        self.components = []
+        self.prematched_series = None
+        self.model = None
+        self.transformer = None
+
+    def __repr__(self):
+        """Print."""
+        return f"FittedTemplate of {self.model_name}"
+
+    def fit(self, df_train, future_regressor_train=None):
+        """Fit transformer and model, or all ensemble components, on df_train.
+
+        Args:
+            df_train (pandas.DataFrame): numeric training dataset of DatetimeIndex and series as cols
+            future_regressor_train (pd.DataFrame): with datetime index, of known in advance data, section matching train data
+        """
+        if self.frequency == "infer":
+            self.frequency = infer_frequency(df_train)
+        if self.n_jobs == 'auto':
+            from autots.tools import cpu_count
+
+            self.n_jobs = cpu_count(modifier=0.75)
+        self.is_float32 = (df_train.dtypes == np.float32).all()
+        if self.model_name == 'Ensemble':
+            horizontal_flag = (
+                2
+                if self.model_param_dict['model_name'].lower() in horizontal_aliases
+                else 1
+            )
+            template = pd.DataFrame(
+                {
+                    'Model': self.model_name,
+                    'ModelParameters': json.dumps(self.model_param_dict),
+                    'TransformationParameters': json.dumps(self.model_transform_dict),
+                    'Ensemble': horizontal_flag,
+                },
+                index=[0],
+            )
+            ens_template = unpack_ensemble_models(
+                template, self.template_cols, keep_ensemble=False, recursive=False
+            )
+            if horizontal_flag == 2:
+                self.prematched_series = generalize_horizontal(
+                    df_train,
+                    self.model_param_dict['series'],
+                    list(self.model_param_dict['models'].keys()),
+                )
+            self.df_train = df_train
+            for index, row in ens_template.iterrows():
+                horizontal_subset = None
+                if self.prematched_series is not None:
+                    horizontal_subset = parse_horizontal(
+                        self.prematched_series, model_id=row['ID']
+                    )
+                try:
+                    component = FittedTemplate(
+                        row['Model'],
+                        row['ModelParameters'],
+                        row['TransformationParameters'],
+                        forecast_length=self.forecast_length,
+                        frequency=self.frequency,
+                        prediction_interval=self.prediction_interval,
+                        no_negatives=self.no_negatives,
+                        constraint=self.constraint,
+                        holiday_country=self.holiday_country,
+                        fail_on_forecast_nan=self.fail_on_forecast_nan,
+                        random_seed=self.random_seed,
+                        verbose=self.verbose,
+                        n_jobs=self.n_jobs,
+                        template_cols=self.template_cols,
+                        horizontal_subset=horizontal_subset,
+                    )
+                    self.components.append(
+                        component.fit(
+                            df_train, future_regressor_train=future_regressor_train
+                        )
+                    )
+                except Exception as e:
+                    if self.verbose >= 1:
+                        print(
+                            f"FAILED: Ensemble {self.model_param_dict['model_name']} component {index + 1} {row['Model']} with error: {repr(e)}"
+                        )
+            return self
+
+        # subset for horizontal ensembles, as in model_forecast
+        if (
+            self.horizontal_subset is not None
+            and self.model_name in no_shared
+            and all(
+                trs not in shared_trans
+                for trs in self.model_transform_dict.get('transformations', {}).values()
+            )
+            and self.model_name not in superfast
+        ):
+            df_train = df_train.reindex(copy=True, columns=self.horizontal_subset)
+        self.df_train = df_train
+        if future_regressor_train is not None:
+            future_regressor_train = future_regressor_train.reindex(df_train.index)
+        transformationStartTime = datetime.datetime.now()
+        self.transformer, df_train_transformed, _ = _fit_transformer(
+            df_train.copy(), self.model_transform_dict, self.model_name, self.n_jobs
+        )
+        self.transformation_runtime = datetime.datetime.now() - transformationStartTime
+        self.model = ModelMonster(
+            self.model_name,
+            parameters=self.model_param_dict,
+            frequency=self.frequency,
+            prediction_interval=self.prediction_interval,
+            holiday_country=self.holiday_country,
+            random_seed=self.random_seed,
+            verbose=self.verbose,
+            forecast_length=self.forecast_length,
+            n_jobs=self.n_jobs,
+        ).fit(df_train_transformed, future_regressor=future_regressor_train)
+        return self
+
+    def predict(
+        self, forecast_length: int = None, future_regressor=None, prediction_interval=None
+    ):
+        """Generate forecast from the fitted transformer and model, without refitting.
+
+        Args:
+            forecast_length (int): number of periods, defaults to the forecast_length of fit
+            future_regressor (pd.DataFrame): with datetime index, of known in advance data, section matching forecast
+            prediction_interval (float): interval or list of intervals, defaults to that of fit
+                models in interval_fit_models can only forecast the interval they were fit with
+
+        Returns:
+            PredictionObject (autots.PredictionObject)
+        """
+        if forecast_length is None:
+            forecast_length = self.forecast_length
+        if prediction_interval is None:
+            prediction_interval = self.prediction_interval
+        if self.model_name == 'Ensemble':
+            forecasts_runtime = {}
+            component_forecasts = {}
+            for component in self.components:
+                try:
+                    df_forecast = component.predict(
+                        forecast_length=forecast_length,
+                        future_regressor=future_regressor,
+                        prediction_interval=prediction_interval,
+                    )
+                except Exception as e:
+                    if self.verbose >= 1:
+                        print(
+                            f"FAILED: Ensemble component {component.model_name} predict with error: {repr(e)}"
+                        )
+                    continue
+                model_id = create_model_id(
+                    df_forecast.model_name,
+                    df_forecast.model_parameters,
+                    df_forecast.transformation_parameters,
+                )
+                forecasts_runtime[model_id] = df_forecast.total_runtime()
+                component_forecasts[model_id] = df_forecast
+            return _ensemble_from_components(
+                self.model_name,
+                self.model_param_dict,
+                component_forecasts,
+                forecasts_runtime,
+                prediction_interval,
+                self.df_train,
+                prematched_series=self.prematched_series,
+            )
+
+        intervals = (
+            prediction_interval
+            if isinstance(prediction_interval, list)
+            else [prediction_interval]
+        )
+        if self.model_name in interval_fit_models and any(
+            x != self.prediction_interval for x in intervals
+        ):
+            raise ValueError(
+                f"{self.model_name} uses prediction_interval in fit, refit to change interval"
+            )
+        finalize_args = {
+            'transformer_object': self.transformer,
+            'df_train': self.df_train,
+            'forecast_length': forecast_length,
+            'transformation_dict': self.model_transform_dict,
+            'model_str': self.model_name,
+            'no_negatives': self.no_negatives,
+            'constraint': self.constraint,
+            'fail_on_forecast_nan': self.fail_on_forecast_nan,
+            'is_float32': self.is_float32,
+            'transformation_runtime': self.transformation_runtime,
+            'verbose': self.verbose,
+        }
+        predictions = []
+        for interval in intervals:
+            self.model.prediction_interval = interval
+            predictions.append(
+                _finalize_prediction(
+                    self.model.predict(
+                        forecast_length=forecast_length,
+                        future_regressor=future_regressor,
+                    ),
+                    **finalize_args,
+                )
+            )
+        self.model.prediction_interval = self.prediction_interval
+        if isinstance(prediction_interval, list):
+            return combine_interval_predictions(predictions, prediction_interval)
+        return predictions[0]
+
+
+def _model_forecast_worker(conn, kwargs):
+    """Run model_forecast and send (success, result or exception) through conn."""
+    if hasattr(os, "setsid"):
+        # lead a new process group, so a timeout also stops any workers the model starts
+        os.setsid()
+    try:
+        conn.send((True, model_forecast(**kwargs)))
+    except BaseException as e:
+        try:
+            conn.send((False, e))
+        except Exception:
+            # exception could not be pickled
+            conn.send((False, RuntimeError(repr(e))))
+    finally:
+        conn.close()
+
+
+def _model_forecast_timeout(timeout: float, **kwargs):
+    """Run model_forecast in a separate process which is killed if not done in timeout seconds.
+
+    Args:
+        timeout (float): seconds to wait before terminating the model, raising TimeoutError
+        **kwargs passed to model_forecast
+
+    Returns:
+        PredictionObject (autots.PredictionObject)
+    """
+    import multiprocessing
+
+    # not fork, which can deadlock on locks held by BLAS or joblib threads of this process
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    ctx = multiprocessing.get_context(start_method)
+    receiver, sender = ctx.Pipe(duplex=False)
+    # not daemonic, as models may start their own processes
+    process = ctx.Process(target=_model_forecast_worker, args=(sender, kwargs))
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(max(timeout, 0)):
+            raise TimeoutError(f"model exceeded timeout of {timeout} seconds")
+        try:
+            success, result = receiver.recv()
+        except EOFError:
+            process.join(1)
+            raise RuntimeError(
+                f"model worker process ended without result, exit code {process.exitcode}"
+            )
+    finally:
+        if process.is_alive():
+            _stop_process_group(process)
+        process.join()
+        receiver.close()
+    if success:
+        return result
+    raise result
+
+
+def _stop_process_group(process, grace: float = 5):
+    """Terminate a worker process and every process in its group, kill any left after grace seconds."""
+    import signal
+
+    def signal_group(sig):
+        try:
+            os.killpg(process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            # group gone, or worker had not yet started its own group
+            pass
+
+    if not hasattr(os, "killpg"):
+        process.terminate()
+        process.join(grace)
+        if process.is_alive():
+            process.kill()
+        return
+    signal_group(signal.SIGTERM)
+    process.terminate()
+    process.join(grace)
+    signal_group(signal.SIGKILL)
+    if process.is_alive():
+        process.kill()
+
+
 def _ps_metric(per_series_metrics, metric, model_id):
     cur_mae = per_series_metrics.loc[metric]
     cur_mae = pd.DataFrame(cur_mae).transpose()
@@ -1241,6 +1851,8 @@ def TemplateWizard(
     ],
     traceback: bool = False,
     current_model_file: str = None,
+    per_model_timeout: float = None,
+    deadline=None,
 ):
     """
     Take Template, returns Results.
@@ -1271,24 +1883,15 @@ def TemplateWizard(
         template_cols (list): column names of columns used as model template
         traceback (bool): include tracebook over just error representation
         current_model_file (str): file path to write to disk of current model params (for debugging if computer crashes). .json is appended
+        per_model_timeout (float): if not None, seconds after which a model is terminated, recorded as a TimeoutError.
+            models are run in a separate process when this is used
+        deadline (datetime.datetime): if not None, no new models are started after this time
 
     Returns:
         TemplateEvalObject
     """
     best_smape = float("inf")
-    template_result = TemplateEvalObject(
-        per_series_mae=[],
-        per_series_made=[],
-        per_series_contour=[],
-        per_series_rmse=[],
-        per_series_spl=[],
-        per_series_mle=[],
-        per_series_imle=[],
-        per_series_maxe=[],
-        per_series_oda=[],
-        per_series_mqae=[],
-        per_series_dwae=[],
-    )
+    template_result = TemplateEvalObject()
     template_result.model_count = model_count
     if isinstance(template, pd.Series):
         template = template.to_frame()
@@ -1316,6 +1919,10 @@ def TemplateWizard(
     template_dict = template.to_dict('records')
     for row in template_dict:
         template_start_time = datetime.datetime.now()
+        if deadline is not None and template_start_time >= deadline:
+            if verbose > 0:
+                print("Time budget reached, skipping remaining models.")
+            break
         try:
             model_str = row['Model']
             parameter_dict = json.loads(row['ModelParameters'])
@@ -1351,26 +1958,36 @@ def TemplateWizard(
                     )
                 else:
                     print(base_print)
-            df_forecast = model_forecast(
-                model_name=row['Model'],
-                model_param_dict=row['ModelParameters'],
-                model_transform_dict=row['TransformationParameters'],
-                df_train=df_train,
-                forecast_length=forecast_length,
-                frequency=frequency,
-                prediction_interval=prediction_interval,
-                no_negatives=no_negatives,
-                constraint=constraint,
-                future_regressor_train=future_regressor_train,
-                future_regressor_forecast=future_regressor_forecast,
-                holiday_country=holiday_country,
-                random_seed=random_seed,
-                verbose=verbose,
-                n_jobs=n_jobs,
-                template_cols=template_cols,
-                current_model_file=current_model_file,
-                model_count=template_result.model_count,
-            )
+            forecast_args = {
+                'model_name': row['Model'],
+                'model_param_dict': row['ModelParameters'],
+                'model_transform_dict': row['TransformationParameters'],
+                'df_train': df_train,
+                'forecast_length': forecast_length,
+                'frequency': frequency,
+                'prediction_interval': prediction_interval,
+                'no_negatives': no_negatives,
+                'constraint': constraint,
+                'future_regressor_train': future_regressor_train,
+                'future_regressor_forecast': future_regressor_forecast,
+                'holiday_country': holiday_country,
+                'random_seed': random_seed,
+                'verbose': verbose,
+                'n_jobs': n_jobs,
+                'template_cols': template_cols,
+                'current_model_file': current_model_file,
+                'model_count': template_result.model_count,
+            }
+            # a deadline alone only stops new models, a subprocess is needed to stop a running one
+            if per_model_timeout is not None:
+                timeout = per_model_timeout
+                if deadline is not None:
+                    timeout = min(
+                        timeout, (deadline - template_start_time).total_seconds()
+                    )
+                df_forecast = _model_forecast_timeout(timeout, **forecast_args)
+            else:
+                df_forecast = model_forecast(**forecast_args)
             if verbose > 1:
                 post_memory_percent = virtual_memory().percent
 
@@ -1434,55 +2051,48 @@ def TemplateWizard(
             result = pd.concat(
                 [result, pd.DataFrame(model_error.avg_metrics).transpose(), a], axis=1
             )
-            template_result.model_results = pd.concat(
-                [template_result.model_results, result],
-                axis=0,
-                ignore_index=True,
-                sort=False,
-            ).reset_index(drop=True)
+            template_result.append_frame('model_results', result)
 
             ps_metric = model_error.per_series_metrics
 
-            template_result.per_series_mae.append(
-                _ps_metric(ps_metric, 'mae', model_id)
+            template_result.append_frame(
+                'per_series_mae', _ps_metric(ps_metric, 'mae', model_id)
             )
-            template_result.per_series_made.append(
-                _ps_metric(ps_metric, 'made', model_id)
+            template_result.append_frame(
+                'per_series_made', _ps_metric(ps_metric, 'made', model_id)
             )
-            template_result.per_series_contour.append(
-                _ps_metric(ps_metric, 'contour', model_id)
+            template_result.append_frame(
+                'per_series_contour', _ps_metric(ps_metric, 'contour', model_id)
             )
-            template_result.per_series_rmse.append(
-                _ps_metric(ps_metric, 'rmse', model_id)
+            template_result.append_frame(
+                'per_series_rmse', _ps_metric(ps_metric, 'rmse', model_id)
             )
-            template_result.per_series_spl.append(
-                _ps_metric(ps_metric, 'spl', model_id)
+            template_result.append_frame(
+                'per_series_spl', _ps_metric(ps_metric, 'spl', model_id)
             )
-            template_result.per_series_mle.append(
-                _ps_metric(ps_metric, 'mle', model_id)
+            template_result.append_frame(
+                'per_series_mle', _ps_metric(ps_metric, 'mle', model_id)
             )
-            template_result.per_series_imle.append(
-                _ps_metric(ps_metric, 'imle', model_id)
+            template_result.append_frame(
+                'per_series_imle', _ps_metric(ps_metric, 'imle', model_id)
             )
-            template_result.per_series_maxe.append(
-                _ps_metric(ps_metric, 'maxe', model_id)
+            template_result.append_frame(
+                'per_series_maxe', _ps_metric(ps_metric, 'maxe', model_id)
             )
-            template_result.per_series_oda.append(
-                _ps_metric(ps_metric, 'oda', model_id)
+            template_result.append_frame(
+                'per_series_oda', _ps_metric(ps_metric, 'oda', model_id)
             )
-            template_result.per_series_mqae.append(
-                _ps_metric(ps_metric, 'mqae', model_id)
+            template_result.append_frame(
+                'per_series_mqae', _ps_metric(ps_metric, 'mqae', model_id)
             )
-            template_result.per_series_dwae.append(
-                _ps_metric(ps_metric, 'dwae', model_id)
+            template_result.append_frame(
+                'per_series_dwae', _ps_metric(ps_metric, 'dwae', model_id)
             )
             if 'distance' in ensemble:
                 cur_smape = model_error.per_timestamp.loc['weighted_smape']
                 cur_smape = pd.DataFrame(cur_smape).transpose()
                 cur_smape.index = [model_id]
-                template_result.per_timestamp_smape = pd.concat(
-                    [template_result.per_timestamp_smape, cur_smape], axis=0
-                )
+                template_result.append_frame('per_timestamp_smape', cur_smape)
             if 'mosaic' in ensemble or 'mosaic-window' in ensemble:
                 template_result.full_mae_errors.extend([model_error.full_mae_errors])
                 template_result.squared_errors.extend([model_error.squared_errors])
@@ -1514,12 +2124,7 @@ def TemplateWizard(
                     },
                     index=[0],
                 )
-                template_result.model_results = pd.concat(
-                    [template_result.model_results, result],
-                    axis=0,
-                    ignore_index=True,
-                    sort=False,
-                ).reset_index(drop=True)
+                template_result.append_frame('model_results', result)
                 if model_interrupt == "end_generation" and current_generation > 0:
                     break
             else:
@@ -1562,58 +2167,8 @@ def TemplateWizard(
                 },
                 index=[0],
             )
-            template_result.model_results = pd.concat(
-                [template_result.model_results, result],
-                axis=0,
-                ignore_index=True,
-                sort=False,
-            ).reset_index(drop=True)
-    if template_result.per_series_mae:
-        template_result.per_series_mae = pd.concat(
-            template_result.per_series_mae, axis=0
-        )
-        template_result.per_series_made = pd.concat(
-            template_result.per_series_made, axis=0
-        )
-        template_result.per_series_contour = pd.concat(
-            template_result.per_series_contour, axis=0
-        )
-        template_result.per_series_rmse = pd.concat(
-            template_result.per_series_rmse, axis=0
-        )
-        template_result.per_series_spl = pd.concat(
-            template_result.per_series_spl, axis=0
-        )
-        template_result.per_series_mle = pd.concat(
-            template_result.per_series_mle, axis=0
-        )
-        template_result.per_series_imle = pd.concat(
-            template_result.per_series_imle, axis=0
-        )
-        template_result.per_series_maxe = pd.concat(
-            template_result.per_series_maxe, axis=0
-        )
-        template_result.per_series_oda = pd.concat(
-            template_result.per_series_oda, axis=0
-        )
-        template_result.per_series_mqae = pd.concat(
-            template_result.per_series_mqae, axis=0
-        )
-        template_result.per_series_dwae = pd.concat(
-            template_result.per_series_dwae, axis=0
-        )
-    else:
-        template_result.per_series_mae = pd.DataFrame()
-        template_result.per_series_made = pd.DataFrame()
-        template_result.per_series_contour = pd.DataFrame()
-        template_result.per_series_rmse = pd.DataFrame()
-        template_result.per_series_spl = pd.DataFrame()
-        template_result.per_series_mle = pd.DataFrame()
-        template_result.per_series_imle = pd.DataFrame()
-        template_result.per_series_maxe = pd.DataFrame()
-        template_result.per_series_oda = pd.DataFrame()
-        template_result.per_series_mqae = pd.DataFrame()
-        template_result.per_series_dwae = pd.DataFrame()
+            template_result.append_frame('model_results', result)
+    if template_result.per_series_mae.empty:
         if verbose > 0 and not template.empty:
             print(f"Generation {current_generation} had all new models fail")
     return template_result
@@ -2058,6 +2613,86 @@ def NewGeneticTemplate(
             )
 
 
+def _template_features(template):
+    """Flatten template rows to dicts of features for a surrogate model."""
+    features = []
+    for model, params, trans in zip(
+        template['Model'],
+        template['ModelParameters'],
+        template['TransformationParameters'],
+    ):
+        feat = {'Model': model}
+        params = json.loads(params) if isinstance(params, str) else params
+        for key, value in params.items():
+            if isinstance(value, bool) or value is None:
+                feat[f"{model}_{key}"] = str(value)
+            elif isinstance(value, (int, float, str)):
+                feat[f"{model}_{key}"] = value
+        trans = json.loads(trans) if isinstance(trans, str) else trans
+        feat['fillna'] = str(trans.get('fillna'))
+        transformations = trans.get('transformations', {})
+        feat['n_transformations'] = len(transformations)
+        for transformer in transformations.values():
+            key = f"transformer_{transformer}"
+            feat[key] = feat.get(key, 0) + 1
+        features.append(feat)
+    return features
+
+
+def surrogate_screen_template(
+    candidates,
+    model_results,
+    n: int,
+    explore_fraction: float = 0.2,
+    min_results: int = 20,
+    random_seed: int = 2020,
+):
+    """Select the most promising candidates using a surrogate model trained on past results.
+
+    A tree ensemble learns the rank of Score from model, parameter, and transformer features.
+    Failed models are treated as the worst score. A fraction of candidates is chosen at random to keep exploring.
+
+    Args:
+        candidates (pd.DataFrame): template of proposed models, larger than n
+        model_results (pd.DataFrame): TemplateEvalObject.model_results of models already run
+        n (int): number of candidates to return
+        explore_fraction (float): fraction of n chosen at random instead of by surrogate
+        min_results (int): if fewer past results, candidates are chosen at random
+        random_seed (int): random seed
+
+    Returns:
+        pd.DataFrame template of n candidates
+    """
+    if candidates.shape[0] <= n:
+        return candidates
+    past = model_results[model_results['Ensemble'] == 0]
+    past = past[past['ValidationRound'] == 0]
+    if past.shape[0] < min_results:
+        return candidates.sample(n, random_state=random_seed)
+    from sklearn.feature_extraction import DictVectorizer
+    from sklearn.ensemble import ExtraTreesRegressor
+
+    # rank is robust to the very large scores of poor models
+    target = past['Score'].rank(pct=True).where(past['Exceptions'].isna(), 1.0)
+    target = target.fillna(1.0)
+    vectorizer = DictVectorizer(sparse=False)
+    X = vectorizer.fit_transform(_template_features(past))
+    surrogate = ExtraTreesRegressor(
+        n_estimators=100, min_samples_leaf=2, random_state=random_seed, n_jobs=1
+    )
+    surrogate.fit(X, target.to_numpy())
+    predicted = surrogate.predict(vectorizer.transform(_template_features(candidates)))
+    n_explore = int(n * explore_fraction)
+    order = np.argsort(predicted, kind='stable')
+    chosen = candidates.iloc[order[: n - n_explore]]
+    if n_explore > 0:
+        remaining = candidates.iloc[order[n - n_explore :]]
+        chosen = pd.concat(
+            [chosen, remaining.sample(n_explore, random_state=random_seed)], axis=0
+        )
+    return chosen
+
+
 def validation_aggregation(validation_results):
     """Aggregate a TemplateEvalObject."""
     groupby_cols = [
@@ -2122,6 +2757,105 @@ def validation_aggregation(validation_results):
     return validation_results
 
 
+def estimate_template_runtime(template, model_results):
+    """Expected runtime in seconds of each template row, learned from past results.
+
+    Uses the median TotalRuntime of the same model, parameters, and transformations where already run,
+    falling back to the same model and parameters, then to the model class overall.
+    Timed out models contribute their timeout, a lower bound on their runtime.
+
+    Args:
+        template (pd.DataFrame): template with Model, ModelParameters, TransformationParameters
+        model_results (pd.DataFrame): TemplateEvalObject.model_results
+
+    Returns:
+        pd.Series of seconds, NaN where no similar model has been run
+    """
+    key_cols = ['Model', 'ModelParameters', 'TransformationParameters']
+    past = model_results[key_cols].copy()
+    past['Runtime'] = pd.to_timedelta(model_results['TotalRuntime']).dt.total_seconds()
+    expected = np.full(template.shape[0], np.nan)
+    for i in range(1, len(key_cols) + 1):
+        cols = key_cols[:i]
+        medians = past.groupby(cols)['Runtime'].median()
+        if i == 1:
+            keys = template['Model']
+        else:
+            keys = pd.MultiIndex.from_frame(template[cols].astype(str))
+        found = medians.reindex(keys).to_numpy(dtype=float)
+        expected = np.where(np.isnan(found), expected, found)
+    return pd.Series(expected, index=template.index)
+
+
+def schedule_template(template, model_results, time_limit: float = None, verbose=0):
+    """Order a template cheapest first and skip models expected to exceed the time limit.
+
+    Model classes take turns, each running its cheapest remaining model,
+    so expensive model families are still reached before a deadline.
+    Within each turn, and within each class, models are ordered cheapest first.
+
+    Args:
+        template (pd.DataFrame): template of models to be run
+        model_results (pd.DataFrame): TemplateEvalObject.model_results of past runs
+        time_limit (float): seconds, models expected to take longer are dropped
+        verbose (int): if > 0, print the number of models skipped
+
+    Returns:
+        pd.DataFrame template
+    """
+    expected = estimate_template_runtime(template, model_results)
+    if time_limit is not None:
+        too_slow = expected > time_limit
+        if verbose > 0 and too_slow.any():
+            print(f"Skipping {too_slow.sum()} models expected to exceed time limit")
+        template = template[~too_slow]
+        expected = expected[~too_slow]
+    # unseen models last in their class and turn, as their cost is unknown
+    turn = expected.groupby(template['Model'].to_numpy()).rank(
+        method='first', na_option='bottom'
+    )
+    order = np.lexsort((expected.to_numpy(), turn.to_numpy()))
+    return template.iloc[order]
+
+
+def prune_validation_template(
+    validation_template,
+    model_results,
+    prune_fraction: float = 0.5,
+    protected_ids: list = None,
+    min_models: int = 1,
+):
+    """Successive halving of validation candidates, keeping only the best scoring fraction.
+
+    Candidates are ranked by their mean Score across all rounds run so far.
+    Candidates which failed the most recent round are always dropped.
+
+    Args:
+        validation_template (pd.DataFrame): candidates still being validated, must include 'ID'
+        model_results (pd.DataFrame): TemplateEvalObject.model_results, including the latest round
+        prune_fraction (float): fraction of candidates to drop, between 0 and 1
+        protected_ids (list): IDs kept regardless of score, unless they failed
+        min_models (int): minimum number of candidates to keep
+
+    Returns:
+        pd.DataFrame of the surviving candidates
+    """
+    results = model_results[model_results['ID'].isin(validation_template['ID'])]
+    last_round = results['ValidationRound'].max()
+    failed = results.loc[
+        (results['ValidationRound'] == last_round) & results['Exceptions'].notna(),
+        'ID',
+    ]
+    scores = results[results['Exceptions'].isna()].groupby('ID')['Score'].mean()
+    scores = scores[~scores.index.isin(failed)]
+    n_keep = int(np.ceil(validation_template.shape[0] * (1 - prune_fraction)))
+    keep = scores.sort_values(ascending=True).head(max(n_keep, min_models))
+    keep = keep.index.tolist()
+    if protected_ids is not None:
+        keep.extend([x for x in protected_ids if x not in failed.tolist()])
+    return validation_template[validation_template['ID'].isin(keep)]
+
+
 def generate_score(
     model_results, metric_weighting: dict = {}, prediction_interval: float = 0.9
 ):
@@ -2412,6 +3146,75 @@ def generate_score_per_series(
     return overall_score.astype(float)  # need to handle complex values (!)
 
 
+def _back_forecast_split(
+    df,
+    n,
+    chunk_size,
+    eval_start=None,
+    future_regressor_train=None,
+    **kwargs,
+):
+    """Forecast one chunk of history for back_forecast.
+
+    Returns:
+        tuple of (PredictionObject, forecast, upper_forecast, lower_forecast)
+    """
+    int_idx = int(n * chunk_size)
+    int_idx_1 = int((n + 1) * chunk_size)
+    inner_forecast_length = int_idx_1 - int_idx
+    if eval_start is not None:
+        int_idx = int_idx + eval_start
+        int_idx_1 = int_idx_1 + eval_start
+    # flip to forecast backwards for the first split
+    flip = n == 0 and eval_start is None
+    if flip:
+        df_split = df.iloc[int_idx_1:].copy()
+        df_split = df_split.iloc[::-1]
+        df_split.index = df_split.index[::-1]
+        result_idx = df.iloc[0:int_idx_1].index
+    else:
+        df_split = df.iloc[0:int_idx].copy()
+    # handle appropriate regressors
+    if isinstance(future_regressor_train, pd.DataFrame):
+        if flip:
+            split_regr = future_regressor_train.reindex(df_split.index[::-1])
+            split_regr_future = future_regressor_train.reindex(result_idx)
+        else:
+            split_regr = future_regressor_train.reindex(df_split.index)
+            split_regr_future = future_regressor_train.reindex(
+                df.index[int_idx:int_idx_1]
+            )
+    else:
+        split_regr = None
+        split_regr_future = None
+    try:
+        df_forecast = model_forecast(
+            df_train=df_split,
+            forecast_length=inner_forecast_length,
+            future_regressor_train=split_regr,
+            future_regressor_forecast=split_regr_future,
+            **kwargs,
+        )
+        forecasts = [
+            df_forecast.forecast,
+            df_forecast.upper_forecast,
+            df_forecast.lower_forecast,
+        ]
+        # handle index being wrong for the flipped forecast which comes first
+        if flip:
+            forecasts = [x.iloc[::-1] for x in forecasts]
+            for x in forecasts:
+                x.index = result_idx
+    except Exception as e:
+        print(f"back_forecast split {n} failed with {repr(e)}")
+        df_forecast = PredictionObject()
+        b_df = pd.DataFrame(
+            np.nan, index=df.index[int_idx:int_idx_1], columns=df.columns
+        )
+        forecasts = [b_df, b_df, b_df]
+    return (df_forecast, *forecasts)
+
+
 def back_forecast(
     df,
     model_name,
@@ -2430,6 +3233,7 @@ def back_forecast(
     verbose=0,
     eval_periods: int = None,
     current_model_file: str = None,
+    parallel: bool = False,
     **kwargs,
 ):
     """Create forecasts for the historical training data, ie. backcast or back forecast.
@@ -2445,8 +3249,10 @@ def back_forecast(
 
     Args:
         eval_period (int): if passed, only returns results for this many time steps of recent history
+        parallel (bool): if True, run the splits concurrently across n_jobs processes, each model then using n_jobs=1
     """
     df_train_shape = df.index.shape[0]
+    eval_start = None
     if eval_periods is not None:
         assert (
             eval_periods < df_train_shape
@@ -2464,83 +3270,56 @@ def back_forecast(
         n_splits = int(n_splits)
 
     chunk_size = fore_length / n_splits
-    b_forecast, b_forecast_up, b_forecast_low = (
-        pd.DataFrame(),
-        pd.DataFrame(),
-        pd.DataFrame(),
-    )
-    for n in range(n_splits):
-        int_idx = int(n * chunk_size)
-        int_idx_1 = int((n + 1) * chunk_size)
-        inner_forecast_length = int_idx_1 - int_idx
-        if eval_periods is not None:
-            int_idx = int_idx + eval_start
-            int_idx_1 = int_idx_1 + eval_start
-        # flip to forecast backwards for the first split
-        if n == 0 and eval_periods is None:
-            df_split = df.iloc[int_idx_1:].copy()
-            df_split = df_split.iloc[::-1]
-            df_split.index = df_split.index[::-1]
-            result_idx = df.iloc[0:int_idx_1].index
-        else:
-            df_split = df.iloc[0:int_idx].copy()
-        # handle appropriate regressors
-        if isinstance(future_regressor_train, pd.DataFrame):
-            if n == 0 and eval_periods is None:
-                split_regr = future_regressor_train.reindex(df_split.index[::-1])
-                split_regr_future = future_regressor_train.reindex(result_idx)
-            else:
-                split_regr = future_regressor_train.reindex(df_split.index)
-                split_regr_future = future_regressor_train.reindex(
-                    df.index[int_idx:int_idx_1]
-                )
-        else:
-            split_regr = None
-            split_regr_future = None
+    split_args = {
+        'df': df,
+        'chunk_size': chunk_size,
+        'eval_start': eval_start,
+        'future_regressor_train': future_regressor_train,
+        'model_name': model_name,
+        'model_param_dict': model_param_dict,
+        'model_transform_dict': model_transform_dict,
+        'frequency': frequency,
+        'prediction_interval': prediction_interval,
+        'no_negatives': no_negatives,
+        'constraint': constraint,
+        'holiday_country': holiday_country,
+        'random_seed': random_seed,
+        'verbose': verbose,
+        'current_model_file': current_model_file,
+    }
+    split_jobs = n_jobs
+    if n_jobs == "auto":
+        from autots.tools import cpu_count
+
+        split_jobs = cpu_count(modifier=0.75)
+    if parallel and split_jobs not in [0, 1] and n_splits > 1:
         try:
-            df_forecast = model_forecast(
-                model_name=model_name,
-                model_param_dict=model_param_dict,
-                model_transform_dict=model_transform_dict,
-                df_train=df_split,
-                forecast_length=inner_forecast_length,
-                frequency=frequency,
-                prediction_interval=prediction_interval,
-                no_negatives=no_negatives,
-                constraint=constraint,
-                future_regressor_train=split_regr,
-                future_regressor_forecast=split_regr_future,
-                holiday_country=holiday_country,
-                random_seed=random_seed,
-                verbose=verbose,
-                n_jobs=n_jobs,
-                current_model_file=current_model_file,
-            )
-            b_forecast = pd.concat([b_forecast, df_forecast.forecast])
-            b_forecast_up = pd.concat([b_forecast_up, df_forecast.upper_forecast])
-            b_forecast_low = pd.concat([b_forecast_low, df_forecast.lower_forecast])
-            # handle index being wrong for the flipped forecast which comes first
-            if n == 0 and eval_periods is None:
-                b_forecast = b_forecast.iloc[::-1]
-                b_forecast_up = b_forecast_up.iloc[::-1]
-                b_forecast_low = b_forecast_low.iloc[::-1]
-                b_forecast.index = result_idx
-                b_forecast_up.index = result_idx
-                b_forecast_low.index = result_idx
-        except Exception as e:
-            print(f"back_forecast split {n} failed with {repr(e)}")
-            df_forecast = PredictionObject()
-            b_df = pd.DataFrame(
-                np.nan, index=df.index[int_idx:int_idx_1], columns=df.columns
-            )
-            b_forecast = pd.concat([b_forecast, b_df])
-            b_forecast_up = pd.concat([b_forecast_up, b_df])
-            b_forecast_low = pd.concat([b_forecast_low, b_df])
+            from joblib import Parallel, delayed
+        except Exception:
+            parallel = False
+    else:
+        parallel = False
+    if parallel:
+        # split the worker budget across splits instead of within models
+        results = Parallel(n_jobs=split_jobs)(
+            delayed(_back_forecast_split)(n=n, n_jobs=1, **split_args)
+            for n in range(n_splits)
+        )
+    else:
+        results = [
+            _back_forecast_split(n=n, n_jobs=n_jobs, **split_args)
+            for n in range(n_splits)
+        ]
 
+    df_forecast = results[-1][0]
     # interpolation may hide errors in backcast
-    df_forecast.forecast = b_forecast.interpolate('linear')
-    df_forecast.upper_forecast = b_forecast_up.interpolate('linear')
-    df_forecast.lower_forecast = b_forecast_low.interpolate('linear')
+    df_forecast.forecast = pd.concat([x[1] for x in results]).interpolate('linear')
+    df_forecast.upper_forecast = pd.concat([x[2] for x in results]).interpolate(
+        'linear'
+    )
+    df_forecast.lower_forecast = pd.concat([x[3] for x in results]).interpolate(
+        'linear'
+    )
     return df_forecast
 
 
@@ -6,6 +6,8 @@ import copy
 import json
 import sys
 import time
+import datetime
+import warnings
 
 from autots.tools.shaping import (
     long_to_wide,
@@ -27,9 +29,13 @@ from autots.evaluator.auto_model import (
     generate_score_per_series,
     model_forecast,
     validation_aggregation,
+    prune_validation_template,
+    schedule_template,
+    surrogate_screen_template,
     back_forecast,
     remove_leading_zeros,
     horizontal_template_to_model_list,
+    FittedTemplate,
 )
 from autots.models.ensemble import (
     EnsembleTemplateGenerator,
@@ -40,6 +46,7 @@ from autots.models.model_list import model_lists, no_shared
 from autots.tools import cpu_count
 from autots.tools.window_functions import retrieve_closest_indices
 from autots.tools.seasonal import seasonal_window_match
+from autots.tools.cache import train_stat_cache
 
 
 class AutoTS(object):
@@ -119,6 +126,23 @@ class AutoTS(object):
         current_model_file (str): file path to write to disk of current model params (for debugging if computer crashes). .json is appended
         verbose (int): setting to 0 or lower should reduce most output. Higher numbers give more output.
         n_jobs (int): Number of cores available to pass to parallel processing. A joblib context manager can be used instead (pass None in this case). Also 'auto'.
+        dtype (str): 'float64' or 'float32'. float32 halves memory of data, forecasts, and errors.
+            transformers and models which are not float32 safe still run on float64 internally.
+        time_budget (float): seconds of wall clock time allowed for the model search (initial template, generations, and ensembles).
+            once exceeded, no new search models are started and fit proceeds to validation. Validation is not limited.
+        per_model_timeout (float): seconds after which any single model evaluation is terminated.
+            timed out models are recorded in results as a TimeoutError, like other model failures.
+            when used, each model runs in a separate spawned (or forkserver) process, which adds some overhead per model.
+            scripts using it need the usual `if __name__ == "__main__":` guard of multiprocessing.
+        validation_pruning (float): if not None, fraction of validation candidates dropped after each validation round (successive halving).
+            0.5 halves the models remaining each round, ranked by Score so far. Only models run through all validations are used for selection and ensembles.
+        surrogate_pool (int): if > 1, each generation proposes this many times the usual number of new models,
+            and a surrogate model trained on results so far chooses which of them to run.
+        fidelity_levels (list): if not None, fractions such as [0.1, 0.3] of series and history on which new models of each generation are first run.
+            the better half by Score at each level is promoted to the next level, then to the full data.
+            lower fidelity results are kept in `fidelity_results`, with the level in the 'Fidelity' column of model_results.
+        parallel_validation (bool): if True, validation splits run concurrently, with n_jobs divided between splits and models.
+            not used with validation_pruning, which needs the results of each round before the next.
 
     Attributes:
         best_model (pd.DataFrame): DataFrame containing template for the best ranked model
@@ -187,6 +211,13 @@ class AutoTS(object):
         current_model_file: str = None,
         verbose: int = 1,
         n_jobs: int = -2,
+        dtype: str = "float64",
+        time_budget: float = None,
+        per_model_timeout: float = None,
+        validation_pruning: float = None,
+        surrogate_pool: int = None,
+        fidelity_levels: list = None,
+        parallel_validation: bool = False,
     ):
         assert forecast_length > 0, "forecast_length must be greater than 0"
         # assert transformer_max_depth > 0, "transformer_max_depth must be greater than 0"
@@ -219,6 +250,13 @@ class AutoTS(object):
         self.model_interrupt = model_interrupt
         self.verbose = int(verbose)
         self.n_jobs = n_jobs
+        self.dtype = dtype
+        self.time_budget = time_budget
+        self.per_model_timeout = per_model_timeout
+        self.validation_pruning = validation_pruning
+        self.surrogate_pool = surrogate_pool
+        self.fidelity_levels = fidelity_levels
+        self.parallel_validation = parallel_validation
         self.models_mode = models_mode
         self.current_model_file = current_model_file
         random.seed(self.random_seed)
@@ -293,6 +331,16 @@ class AutoTS(object):
                 self.n_jobs = core_count if core_count > 1 else 1
         if self.n_jobs == 0:
             self.n_jobs = 1
+        if self.parallel_validation and self.validation_pruning:
+            warnings.warn(
+                "parallel_validation is not used with validation_pruning, which needs the results of each round. Validations will run sequentially."
+            )
+        elif self.parallel_validation and not isinstance(
+            self.n_jobs, (int, np.integer)
+        ):
+            warnings.warn(
+                f"parallel_validation requires an integer n_jobs to divide between splits, not {self.n_jobs}. Validations will run sequentially."
+            )
 
         # convert shortcuts of model lists to actual lists of models
         if model_list in list(model_lists.keys()):
@@ -409,6 +457,7 @@ class AutoTS(object):
             else ['ID'] + self.template_cols
         )
         self.initial_results = TemplateEvalObject()
+        self.fidelity_results = TemplateEvalObject()
         self.best_model_name = ""
         self.best_model_params = ""
         self.best_model_transformation_params = ""
@@ -643,6 +692,7 @@ class AutoTS(object):
 
         Args:
             df (pandas.DataFrame): Datetime Indexed dataframe of series, or dataframe of three columns as below.
+                long data may also be a pyarrow.Table or path to a Parquet file, see `long_to_wide`
             date_col (str): name of datetime column
             value_col (str): name of column containing the data of series.
             id_col (str): name of column identifying different series.
@@ -730,6 +780,7 @@ class AutoTS(object):
                 value_col=self.value_col,
                 id_col=self.id_col,
                 aggfunc=self.aggfunc,
+                dtype=self.dtype,
             )
 
         df_wide = df_cleanup(
@@ -744,7 +795,9 @@ class AutoTS(object):
         )
 
         # handle categorical data if present
-        self.categorical_transformer = NumericTransformer(verbose=self.verbose)
+        self.categorical_transformer = NumericTransformer(
+            dtype=self.dtype, verbose=self.verbose
+        )
         df_wide_numeric = self.categorical_transformer.fit_transform(df_wide)
         del df_wide
 
@@ -967,6 +1020,12 @@ class AutoTS(object):
             self.initial_template = self.initial_template[
                 self.initial_template['Ensemble'] <= 1
             ]
+        # wall clock limit for the model search
+        search_deadline = (
+            datetime.datetime.now() + datetime.timedelta(seconds=self.time_budget)
+            if self.time_budget is not None
+            else None
+        )
         # run the initial template
         submitted_parameters = self.initial_template.copy()
         template_result = TemplateWizard(
@@ -994,6 +1053,8 @@ class AutoTS(object):
             max_generations=self.max_generations,
             traceback=self.traceback,
             current_model_file=self.current_model_file,
+            per_model_timeout=self.per_model_timeout,
+            deadline=search_deadline,
         )
         model_count = template_result.model_count
 
@@ -1012,6 +1073,13 @@ class AutoTS(object):
         num_mod_types = len(self.model_list)
         max_per_model_class_g = 5
         while current_generation < self.max_generations:
+            if (
+                search_deadline is not None
+                and datetime.datetime.now() >= search_deadline
+            ):
+                if verbose > 0:
+                    print("Time budget reached, ending new generations.")
+                break
             current_generation += 1
             if verbose > 0:
                 print(
@@ -1038,26 +1106,72 @@ class AutoTS(object):
                 self.score_per_series = generate_score_per_series(
                     self.initial_results, self.metric_weighting, 1
                 )
+            genetic_params = {
+                'submitted_parameters': submitted_parameters,
+                'sort_column': "Score",
+                'sort_ascending': True,
+                'max_results': top_n,
+                'max_per_model_class': max_per_model_class_g,
+                'top_n': top_n,
+                'template_cols': template_cols,
+                'transformer_list': self.transformer_list,
+                'transformer_max_depth': self.transformer_max_depth,
+                'models_mode': self.models_mode,
+                'score_per_series': self.score_per_series,
+            }
             new_template = NewGeneticTemplate(
-                self.initial_results.model_results,
-                submitted_parameters=submitted_parameters,
-                sort_column="Score",
-                sort_ascending=True,
-                max_results=top_n,
-                max_per_model_class=max_per_model_class_g,
-                top_n=top_n,
-                template_cols=template_cols,
-                transformer_list=self.transformer_list,
-                transformer_max_depth=self.transformer_max_depth,
-                models_mode=self.models_mode,
-                score_per_series=self.score_per_series,
+                self.initial_results.model_results, **genetic_params
             )
+            # propose a larger pool and only run those the surrogate rates best
+            if self.surrogate_pool is not None and self.surrogate_pool > 1:
+                pool = [new_template] + [
+                    NewGeneticTemplate(
+                        self.initial_results.model_results, **genetic_params
+                    )
+                    for _ in range(int(self.surrogate_pool) - 1)
+                ]
+                pool = pd.concat(pool, axis=0, ignore_index=True).drop_duplicates(
+                    subset=template_cols
+                )
+                new_template = surrogate_screen_template(
+                    pool,
+                    self.initial_results.model_results,
+                    n=new_template.shape[0],
+                    random_seed=random_seed + current_generation,
+                )
             submitted_parameters = pd.concat(
                 [submitted_parameters, new_template],
                 axis=0,
                 ignore_index=True,
                 sort=False,
             ).reset_index(drop=True)
+            # screen new models on cheaper samples of the data first
+            if self.fidelity_levels is not None:
+                new_template = self._fidelity_screen(
+                    new_template,
+                    df_train,
+                    df_test,
+                    weights=current_weights,
+                    future_regressor_train=future_regressor_train,
+                    future_regressor_forecast=future_regressor_test,
+                    current_generation=current_generation,
+                    deadline=search_deadline,
+                )
+            # with limited time, run cheapest first and skip expected timeouts
+            if search_deadline is not None or self.per_model_timeout is not None:
+                time_limit = self.per_model_timeout
+                if search_deadline is not None:
+                    remaining = search_deadline - datetime.datetime.now()
+                    remaining = remaining.total_seconds()
+                    time_limit = (
+                        remaining if time_limit is None else min(time_limit, remaining)
+                    )
+                new_template = schedule_template(
+                    new_template,
+                    self.initial_results.model_results,
+                    time_limit=time_limit,
+                    verbose=verbose,
+                )
 
             template_result = TemplateWizard(
                 new_template,
@@ -1085,6 +1199,8 @@ class AutoTS(object):
                 max_generations=self.max_generations,
                 traceback=self.traceback,
                 current_model_file=self.current_model_file,
+                per_model_timeout=self.per_model_timeout,
+                deadline=search_deadline,
             )
             model_count = template_result.model_count
 
@@ -1136,6 +1252,8 @@ class AutoTS(object):
                     n_jobs=self.n_jobs,
                     traceback=self.traceback,
                     current_model_file=self.current_model_file,
+                    per_model_timeout=self.per_model_timeout,
+                    deadline=search_deadline,
                 )
                 model_count = template_result.model_count
                 # capture results from lower-level template run
@@ -1193,6 +1311,7 @@ class AutoTS(object):
             'Score', ascending=True, na_position='last'
         ).head(self.models_to_validate)
         # add on best per_series models (which may not be in the top scoring)
+        per_series_ids = []
         if any(x in ensemble for x in self.h_ens_list):
             model_results = self.initial_results.model_results
             if self.models_to_validate < 50:
@@ -1218,11 +1337,26 @@ class AutoTS(object):
             validation_template = validation_template.drop_duplicates(
                 subset=['Model', 'ModelParameters', 'TransformationParameters']
             )
-        validation_template = validation_template[self.template_cols]
+            per_series_ids = per_series_val['ID'].unique().tolist()
+        validation_template = validation_template[['ID'] + self.template_cols]
 
         # run validations
         if num_validations > 0:
             model_count = 0
+            # share the n_jobs budget between concurrent splits and their models
+            split_jobs, model_jobs = 1, self.n_jobs
+            if (
+                self.parallel_validation
+                and not self.validation_pruning
+                and num_validations > 1
+                and isinstance(self.n_jobs, (int, np.integer))
+            ):
+                total_jobs = self.n_jobs
+                if total_jobs < 0:
+                    total_jobs = max(cpu_count() + 1 + total_jobs, 1)
+                split_jobs = min(num_validations, total_jobs)
+                model_jobs = max(total_jobs // split_jobs, 1)
+            parallel_runs = []
             for y in range(num_validations):
                 if verbose > 0:
                     print("Validation Round: {}".format(str(y + 1)))
@@ -1322,30 +1456,37 @@ class AutoTS(object):
                     ] = np.nan
 
                 # run validation template on current slice
+                validation_args = {
+                    'df_train': val_df_train,
+                    'df_test': val_df_test,
+                    'weights': current_weights,
+                    'forecast_length': forecast_length,
+                    'frequency': frequency,
+                    'prediction_interval': prediction_interval,
+                    'no_negatives': no_negatives,
+                    'constraint': self.constraint,
+                    'ensemble': ensemble,
+                    'future_regressor_train': val_future_regressor_train,
+                    'future_regressor_forecast': val_future_regressor_test,
+                    'holiday_country': holiday_country,
+                    'startTimeStamps': self.startTimeStamps,
+                    'template_cols': self.template_cols,
+                    'model_interrupt': self.model_interrupt,
+                    'grouping_ids': self.grouping_ids,
+                    'random_seed': random_seed,
+                    'verbose': verbose,
+                    'n_jobs': model_jobs,
+                    'validation_round': (y + 1),
+                    'traceback': self.traceback,
+                    'current_model_file': self.current_model_file,
+                    'per_model_timeout': self.per_model_timeout,
+                }
+                if split_jobs > 1:
+                    # run once all splits are prepared
+                    parallel_runs.append(validation_args)
+                    continue
                 template_result = TemplateWizard(
-                    validation_template,
-                    df_train=val_df_train,
-                    df_test=val_df_test,
-                    weights=current_weights,
-                    forecast_length=forecast_length,
-                    frequency=frequency,
-                    prediction_interval=prediction_interval,
-                    no_negatives=no_negatives,
-                    constraint=self.constraint,
-                    ensemble=ensemble,
-                    future_regressor_train=val_future_regressor_train,
-                    future_regressor_forecast=val_future_regressor_test,
-                    holiday_country=holiday_country,
-                    startTimeStamps=self.startTimeStamps,
-                    template_cols=self.template_cols,
-                    model_interrupt=self.model_interrupt,
-                    grouping_ids=self.grouping_ids,
-                    random_seed=random_seed,
-                    verbose=verbose,
-                    n_jobs=self.n_jobs,
-                    validation_round=(y + 1),
-                    traceback=self.traceback,
-                    current_model_file=self.current_model_file,
+                    validation_template[self.template_cols], **validation_args
                 )
                 model_count = template_result.model_count
                 # gather results of template run
@@ -1355,6 +1496,35 @@ class AutoTS(object):
                     metric_weighting=metric_weighting,
                     prediction_interval=prediction_interval,
                 )
+                # successive halving, only the leaders continue to further rounds
+                if self.validation_pruning and (y + 1) < num_validations:
+                    validation_template = prune_validation_template(
+                        validation_template,
+                        self.initial_results.model_results,
+                        prune_fraction=self.validation_pruning,
+                        protected_ids=per_series_ids,
+                    )
+                    if verbose > 0:
+                        print(
+                            f"{validation_template.shape[0]} models continuing to further validation"
+                        )
+            if parallel_runs:
+                from joblib import Parallel, delayed
+
+                template_results = Parallel(n_jobs=split_jobs)(
+                    delayed(TemplateWizard)(
+                        validation_template[self.template_cols], **validation_args
+                    )
+                    for validation_args in parallel_runs
+                )
+                # merge in order of validation round, so results match sequential runs
+                for template_result in template_results:
+                    self.initial_results = self.initial_results.concat(template_result)
+                self.initial_results.model_results['Score'] = generate_score(
+                    self.initial_results.model_results,
+                    metric_weighting=metric_weighting,
+                    prediction_interval=prediction_interval,
+                )
 
         self.validation_results = copy.copy(self.initial_results)
         # aggregate validation results
@@ -1568,6 +1738,7 @@ or otherwise increase models available."""
                     n_jobs=self.n_jobs,
                     traceback=self.traceback,
                     current_model_file=self.current_model_file,
+                    per_model_timeout=self.per_model_timeout,
                 )
                 # capture results from lower-level template run
                 template_result.model_results['TotalRuntime'].fillna(
@@ -1659,10 +1830,91 @@ or otherwise increase models available."""
         # set flags to check if regressors or ensemble used in final model.
         self.used_regressor_check = self._regr_param_check(self.best_model_params)
         self.regressor_used = self.used_regressor_check
+        # training statistics are only reused within a search, release them
+        train_stat_cache.clear()
         # clean up any remaining print statements
         sys.stdout.flush()
         return self
 
+    def _fidelity_screen(
+        self,
+        template,
+        df_train,
+        df_test,
+        weights,
+        future_regressor_train=None,
+        future_regressor_forecast=None,
+        current_generation=0,
+        deadline=None,
+    ):
+        """Run a template on fractions of the series and history, returning only the models promoted to full data.
+
+        future_regressor_train and future_regressor_forecast are those of df_train and df_test.
+        """
+        rows, cols = df_train.shape
+        for level in sorted(self.fidelity_levels):
+            if template.shape[0] < 2 or level >= 1:
+                break
+            low_cols = subset_series(
+                df_train,
+                [weights.get(x, 1) for x in df_train.columns],
+                n=max(int(np.ceil(cols * level)), 1),
+                random_state=self.random_seed + current_generation,
+            ).columns
+            n_rows = min(max(int(rows * level), self.forecast_length * 4), rows)
+            low_train = df_train[low_cols].iloc[-n_rows:]
+            reg_tr, reg_fc = None, None
+            if future_regressor_train is not None:
+                reg_tr = future_regressor_train.reindex(index=low_train.index)
+                reg_fc = future_regressor_forecast.reindex(index=df_test.index)
+            result = TemplateWizard(
+                template,
+                low_train,
+                df_test[low_cols],
+                weights={x: weights.get(x, 1) for x in low_cols},
+                model_count=0,
+                ensemble=[],
+                forecast_length=self.forecast_length,
+                frequency=self.frequency,
+                prediction_interval=self.prediction_interval,
+                no_negatives=self.no_negatives,
+                constraint=self.constraint,
+                future_regressor_train=reg_tr,
+                future_regressor_forecast=reg_fc,
+                holiday_country=self.holiday_country,
+                startTimeStamps=self.startTimeStamps,
+                template_cols=self.template_cols,
+                model_interrupt=self.model_interrupt,
+                grouping_ids=self.grouping_ids,
+                random_seed=self.random_seed,
+                verbose=self.verbose - 1,
+                n_jobs=self.n_jobs,
+                current_generation=current_generation,
+                max_generations=f"Fidelity {level}",
+                traceback=self.traceback,
+                current_model_file=self.current_model_file,
+                per_model_timeout=self.per_model_timeout,
+                deadline=deadline,
+            )
+            model_results = result.model_results
+            model_results['Fidelity'] = level
+            success = model_results['Exceptions'].isna()
+            # one result per template row, unless interrupted
+            if model_results.shape[0] != template.shape[0] or not success.any():
+                break
+            model_results['Score'] = generate_score(
+                model_results,
+                metric_weighting=self.metric_weighting,
+                prediction_interval=self.prediction_interval,
+            )
+            self.fidelity_results = self.fidelity_results.concat(result)
+            rank = model_results['Score'].where(success).rank(method='first')
+            promoted = (rank <= np.ceil(template.shape[0] / 2)).to_numpy()
+            template = template.iloc[np.flatnonzero(promoted)]
+            if self.verbose > 0:
+                print(f"{template.shape[0]} models promoted from fidelity {level}")
+        return template
+
     def _regr_param_check(self, param_dict):
         """Help to search for if a regressor was used in model."""
         out = False
@@ -1706,8 +1958,12 @@ or otherwise increase models available."""
                 defaults to 'self' ie the interval specified in __init__()
                 if prediction_interval is a list, then returns a dict of forecast objects.
                     {str(interval): prediction_object}
+                    the model is fit once for all intervals, and each prediction_object
+                    also has .quantile_forecast and .quantile() for the bounds of every interval
             future_regressor (numpy.Array): additional regressor
-            hierarchy: Not yet implemented
+            hierarchy (HierarchicalReconciler): if given, reconcile forecasts to this hierarchy
+                the training data must contain all nodes, as from HierarchicalReconciler.transform()
+                fit on the training data here if not already fit
             just_point_forecast (bool): If True, return a pandas.DataFrame of just point forecasts
             fail_on_forecast_nan (bool): if False, return forecasts even if NaN present, if True, raises error if any nan in forecast
 
@@ -1736,110 +1992,97 @@ or otherwise increase models available."""
                 index=self.df_wide_numeric.index
             )
 
-        # allow multiple prediction intervals
+        # multiple prediction intervals are forecast from a single fit of the model
+        df_forecast = model_forecast(
+            model_name=self.best_model_name,
+            model_param_dict=self.best_model_params,
+            model_transform_dict=self.best_model_transformation_params,
+            df_train=self.df_wide_numeric,
+            forecast_length=forecast_length,
+            frequency=self.frequency,
+            prediction_interval=prediction_interval,
+            no_negatives=self.no_negatives,
+            constraint=self.constraint,
+            future_regressor_train=self.future_regressor_train,
+            future_regressor_forecast=future_regressor,
+            holiday_country=self.holiday_country,
+            startTimeStamps=self.startTimeStamps,
+            grouping_ids=self.grouping_ids,
+            fail_on_forecast_nan=fail_on_forecast_nan,
+            random_seed=self.random_seed,
+            verbose=verbose,
+            n_jobs=self.n_jobs,
+            template_cols=self.template_cols,
+            current_model_file=self.current_model_file,
+        )
+        df_forecast = _undo_preprocessing(
+            df_forecast,
+            prediction_interval,
+            self.categorical_transformer,
+            self.preclean_transformer if self.preclean is not None else None,
+        )
+        if hierarchy is not None:
+            if not hasattr(hierarchy, "S"):
+                hierarchy.fit(self.df_wide_numeric)
+            if isinstance(df_forecast, dict):
+                for pred in df_forecast.values():
+                    hierarchy.reconcile_prediction(pred)
+            else:
+                hierarchy.reconcile_prediction(df_forecast)
+        sys.stdout.flush()
         if isinstance(prediction_interval, list):
-            forecast_objects = {}
-            for interval in prediction_interval:
-                df_forecast = model_forecast(
-                    model_name=self.best_model_name,
-                    model_param_dict=self.best_model_params,
-                    model_transform_dict=self.best_model_transformation_params,
-                    df_train=self.df_wide_numeric,
-                    forecast_length=forecast_length,
-                    frequency=self.frequency,
-                    prediction_interval=interval,
-                    no_negatives=self.no_negatives,
-                    constraint=self.constraint,
-                    future_regressor_train=self.future_regressor_train,
-                    future_regressor_forecast=future_regressor,
-                    holiday_country=self.holiday_country,
-                    startTimeStamps=self.startTimeStamps,
-                    grouping_ids=self.grouping_ids,
-                    fail_on_forecast_nan=fail_on_forecast_nan,
-                    random_seed=self.random_seed,
-                    verbose=verbose,
-                    n_jobs=self.n_jobs,
-                    template_cols=self.template_cols,
-                    current_model_file=self.current_model_file,
-                )
-                # convert categorical back to numeric
-                trans = self.categorical_transformer
-                df_forecast.forecast = trans.inverse_transform(df_forecast.forecast)
-                df_forecast.lower_forecast = trans.inverse_transform(
-                    df_forecast.lower_forecast
-                )
-                df_forecast.upper_forecast = trans.inverse_transform(
-                    df_forecast.upper_forecast
-                )
-                # undo preclean transformations if necessary
-                if self.preclean is not None:
-                    df_forecast.forecast = self.preclean_transformer.inverse_transform(
-                        df_forecast.forecast
-                    )
-                    df_forecast.lower_forecast = (
-                        self.preclean_transformer.inverse_transform(
-                            df_forecast.lower_forecast
-                        )
-                    )
-                    df_forecast.upper_forecast = (
-                        self.preclean_transformer.inverse_transform(
-                            df_forecast.upper_forecast
-                        )
-                    )
-                forecast_objects[str(interval)] = df_forecast
-            return forecast_objects
+            return df_forecast
+        elif just_point_forecast:
+            return df_forecast.forecast
         else:
-            df_forecast = model_forecast(
-                model_name=self.best_model_name,
-                model_param_dict=self.best_model_params,
-                model_transform_dict=self.best_model_transformation_params,
-                df_train=self.df_wide_numeric,
-                forecast_length=forecast_length,
-                frequency=self.frequency,
-                prediction_interval=prediction_interval,
-                no_negatives=self.no_negatives,
-                constraint=self.constraint,
-                future_regressor_train=self.future_regressor_train,
-                future_regressor_forecast=future_regressor,
-                holiday_country=self.holiday_country,
-                startTimeStamps=self.startTimeStamps,
-                grouping_ids=self.grouping_ids,
-                fail_on_forecast_nan=fail_on_forecast_nan,
-                random_seed=self.random_seed,
-                verbose=verbose,
-                n_jobs=self.n_jobs,
-                template_cols=self.template_cols,
-                current_model_file=self.current_model_file,
-            )
-            # convert categorical back to numeric
-            trans = self.categorical_transformer
-            df_forecast.forecast = trans.inverse_transform(df_forecast.forecast)
-            df_forecast.lower_forecast = trans.inverse_transform(
-                df_forecast.lower_forecast
-            )
-            df_forecast.upper_forecast = trans.inverse_transform(
-                df_forecast.upper_forecast
-            )
-            # undo preclean transformations if necessary
-            if self.preclean is not None:
-                df_forecast.forecast = self.preclean_transformer.inverse_transform(
-                    df_forecast.forecast
-                )
-                df_forecast.lower_forecast = (
-                    self.preclean_transformer.inverse_transform(
-                        df_forecast.lower_forecast
-                    )
-                )
-                df_forecast.upper_forecast = (
-                    self.preclean_transformer.inverse_transform(
-                        df_forecast.upper_forecast
-                    )
-                )
-            sys.stdout.flush()
-            if just_point_forecast:
-                return df_forecast.forecast
-            else:
-                return df_forecast
+            return df_forecast
+
+    def export_artifact(self, filename: str = None):
+        """Fit the best model once and export it for forecasting without refitting.
+
+        Args:
+            filename (str): if not None, also save the artifact to this file path, see load_artifact()
+
+        Returns:
+            ForecastArtifact, with .predict() taking the same main args as AutoTS.predict()
+        """
+        if self.best_model.empty:
+            raise ValueError("AutoTS must be fit before export_artifact")
+        fitted = FittedTemplate(
+            self.best_model_name,
+            self.best_model_params,
+            self.best_model_transformation_params,
+            forecast_length=self.forecast_length,
+            frequency=self.frequency,
+            prediction_interval=self.prediction_interval,
+            no_negatives=self.no_negatives,
+            constraint=self.constraint,
+            holiday_country=self.holiday_country,
+            random_seed=self.random_seed,
+            verbose=self.verbose,
+            n_jobs=self.n_jobs,
+            template_cols=self.template_cols,
+        ).fit(
+            self.df_wide_numeric,
+            future_regressor_train=(
+                self.future_regressor_train.reindex(index=self.df_wide_numeric.index)
+                if self.future_regressor_train is not None
+                else None
+            ),
+        )
+        artifact = ForecastArtifact(
+            fitted,
+            categorical_transformer=self.categorical_transformer,
+            preclean_transformer=(
+                self.preclean_transformer if self.preclean is not None else None
+            ),
+            regressor_transformer=(
+                self.regr_num_trans if self.future_regressor_train is not None else None
+            ),
+        )
+        if filename is not None:
+            artifact.save(filename)
+        return artifact
 
     def results(self, result_set: str = 'initial'):
         """Convenience function to return tested models table.
@@ -2143,6 +2386,7 @@ or otherwise increase models available."""
                     n_jobs=self.n_jobs,
                     traceback=self.traceback,
                     current_model_file=self.current_model_file,
+                    per_model_timeout=self.per_model_timeout,
                 )
             )
         # this handles missing runtime information, which really shouldn't be missing
@@ -2164,7 +2408,12 @@ or otherwise increase models available."""
         )
 
     def back_forecast(
-        self, series=None, n_splits: int = "auto", tail: int = "auto", verbose: int = 0
+        self,
+        series=None,
+        n_splits: int = "auto",
+        tail: int = "auto",
+        verbose: int = 0,
+        parallel: bool = False,
     ):
         """Create forecasts for the historical training data, ie. backcast or back forecast. OUT OF SAMPLE
 
@@ -2177,6 +2426,7 @@ or otherwise increase models available."""
         series (str): if to run on only one column, pass column name. Faster than full.
         tail (int): df.tail() of the dataset, back_forecast is only run on n most recent observations.
             which points at eval_periods of lower-level back_forecast function
+        parallel (bool): if True, run the splits concurrently across n_jobs processes
 
         Returns a standard prediction object (access .forecast, .lower_forecast, .upper_forecast)
         """
@@ -2211,6 +2461,7 @@ or otherwise increase models available."""
             n_jobs=self.n_jobs,
             verbose=verbose,
             eval_periods=eval_periods,
+            parallel=parallel,
         )
         return result
 
@@ -2771,38 +3022,215 @@ class AutoTSIntervals(object):
         verbose = self.verbose if verbose == 'self' else verbose
 
         urow = self.ens_templates.iloc[0]
+        # fit once for all intervals
+        df_forecast = model_forecast(
+            model_name=urow['Model'],
+            model_param_dict=urow['ModelParameters'],
+            model_transform_dict=urow['TransformationParameters'],
+            df_train=self.df_wide_numeric,
+            forecast_length=self.forecast_length,
+            frequency=self.frequency,
+            prediction_interval=list(self.prediction_intervals),
+            no_negatives=self.no_negatives,
+            constraint=self.constraint,
+            future_regressor_train=self.future_regressor_train,
+            future_regressor_forecast=future_regressor,
+            holiday_country=self.holiday_country,
+            startTimeStamps=self.startTimeStamps,
+            grouping_ids=self.grouping_ids,
+            random_seed=self.random_seed,
+            verbose=verbose,
+            template_cols=self.template_cols,
+            current_model_file=self.current_model_file,
+        )
+
+        trans = self.categorical_transformer
+        df_forecast.forecast = trans.inverse_transform(df_forecast.forecast)
+        df_forecast.quantile_forecast = np.stack(
+            [
+                trans.inverse_transform(df_forecast.quantile(q)).to_numpy()
+                for q in df_forecast.quantiles
+            ]
+        )
         for interval in self.prediction_intervals:
-            df_forecast = model_forecast(
-                model_name=urow['Model'],
-                model_param_dict=urow['ModelParameters'],
-                model_transform_dict=urow['TransformationParameters'],
-                df_train=self.df_wide_numeric,
-                forecast_length=self.forecast_length,
-                frequency=self.frequency,
-                prediction_interval=interval,
-                no_negatives=self.no_negatives,
-                constraint=self.constraint,
-                future_regressor_train=self.future_regressor_train,
-                future_regressor_forecast=future_regressor,
-                holiday_country=self.holiday_country,
-                startTimeStamps=self.startTimeStamps,
-                grouping_ids=self.grouping_ids,
-                random_seed=self.random_seed,
-                verbose=verbose,
-                template_cols=self.template_cols,
-                current_model_file=self.current_model_file,
-            )
+            forecast_objects[interval] = df_forecast.interval(interval)
+        return forecast_objects
+
+
+def _undo_preprocessing(
+    df_forecast, prediction_interval, categorical_transformer, preclean_transformer=None
+):
+    """Convert numeric forecasts back to the input space of AutoTS.
+
+    Returns the PredictionObject, or a dict of {str(interval): PredictionObject} if prediction_interval is a list.
+    """
+    # convert categorical back to numeric
+    trans = categorical_transformer
+    df_forecast.forecast = trans.inverse_transform(df_forecast.forecast)
+    if isinstance(prediction_interval, list):
+        quantile_forecasts = [
+            trans.inverse_transform(df_forecast.quantile(q))
+            for q in df_forecast.quantiles
+        ]
+    else:
+        df_forecast.lower_forecast = trans.inverse_transform(df_forecast.lower_forecast)
+        df_forecast.upper_forecast = trans.inverse_transform(df_forecast.upper_forecast)
+    # undo preclean transformations if necessary, one pass for all forecasts
+    if preclean_transformer is not None:
+        if isinstance(prediction_interval, list):
+            forecasts = [df_forecast.forecast] + quantile_forecasts
+        else:
+            forecasts = [
+                df_forecast.forecast,
+                df_forecast.lower_forecast,
+                df_forecast.upper_forecast,
+            ]
+        index = df_forecast.forecast.index
+        result = preclean_transformer.inverse_transform_stacked(
+            np.stack([x.to_numpy() for x in forecasts]),
+            index=index,
+            columns=df_forecast.forecast.columns,
+            bounds=[False] * len(forecasts),
+            fillzero=False,
+        )
+        forecasts = [
+            pd.DataFrame(x, index=index, columns=preclean_transformer.df_colnames)
+            for x in result
+        ]
+        df_forecast.forecast = forecasts[0]
+        if isinstance(prediction_interval, list):
+            quantile_forecasts = forecasts[1:]
+        else:
+            df_forecast.lower_forecast, df_forecast.upper_forecast = forecasts[1:]
+    if isinstance(prediction_interval, list):
+        df_forecast.quantile_forecast = np.stack(
+            [x.to_numpy() for x in quantile_forecasts]
+        )
+        return {
+            str(interval): df_forecast.interval(interval)
+            for interval in prediction_interval
+        }
+    return df_forecast
+
+
+class ForecastArtifact(object):
+    """Fitted best model of AutoTS with its preprocessing, to forecast without refitting.
+
+    Create with AutoTS.export_artifact(), save with .save() and load with load_artifact().
+    Holds only the fitted transformers and models (all components, for ensembles), not search results.
+
+    Args:
+        fitted (FittedTemplate): fitted template of the best model
+        categorical_transformer (NumericTransformer): fitted transformer of input data
+        preclean_transformer (GeneralTransformer): fitted preclean transformer, if any
+        regressor_transformer (NumericTransformer): fitted transformer of future_regressor, if any
+    """
+
+    artifact_version = 1
+
+    def __init__(
+        self,
+        fitted,
+        categorical_transformer,
+        preclean_transformer=None,
+        regressor_transformer=None,
+    ):
+        self.fitted = fitted
+        self.categorical_transformer = categorical_transformer
+        self.preclean_transformer = preclean_transformer
+        self.regressor_transformer = regressor_transformer
+        self.forecast_length = fitted.forecast_length
+        self.prediction_interval = fitted.prediction_interval
+
+    def __repr__(self):
+        """Print."""
+        return f"ForecastArtifact v{self.artifact_version} of {self.fitted.model_name}"
+
+    def predict(
+        self,
+        forecast_length: int = "self",
+        prediction_interval: float = 'self',
+        future_regressor=None,
+        just_point_forecast: bool = False,
+    ):
+        """Generate forecast immediately following the training data, without refitting.
 
-            trans = self.categorical_transformer
-            df_forecast.forecast = trans.inverse_transform(df_forecast.forecast)
-            df_forecast.lower_forecast = trans.inverse_transform(
-                df_forecast.lower_forecast
+        Args:
+            forecast_length (int): Number of periods of data to forecast ahead
+            prediction_interval (float): interval of upper/lower forecasts, or list of intervals, as in AutoTS.predict
+            future_regressor (pd.DataFrame): additional regressor, if one was used in fit
+            just_point_forecast (bool): If True, return a pandas.DataFrame of just point forecasts
+
+        Return:
+            Either a PredictionObject of forecasts and metadata, or
+            if just_point_forecast == True, a dataframe of point forecasts
+        """
+        if forecast_length == 'self':
+            forecast_length = self.forecast_length
+        if prediction_interval == 'self':
+            prediction_interval = self.prediction_interval
+        if future_regressor is not None:
+            if self.regressor_transformer is None:
+                raise ValueError(
+                    "regressor passed to .predict but no regressor was passed to .fit"
+                )
+            future_regressor = self.regressor_transformer.transform(
+                pd.DataFrame(future_regressor)
             )
-            df_forecast.upper_forecast = trans.inverse_transform(
-                df_forecast.upper_forecast
+        df_forecast = self.fitted.predict(
+            forecast_length=forecast_length,
+            future_regressor=future_regressor,
+            prediction_interval=prediction_interval,
+        )
+        df_forecast = _undo_preprocessing(
+            df_forecast,
+            prediction_interval,
+            self.categorical_transformer,
+            self.preclean_transformer,
+        )
+        if just_point_forecast and not isinstance(prediction_interval, list):
+            return df_forecast.forecast
+        return df_forecast
+
+    def save(self, filename: str):
+        """Save artifact with pickle, load with load_artifact()."""
+        import pickle
+        from autots import __version__
+
+        with open(filename, "wb") as f:
+            pickle.dump(
+                {
+                    "artifact_version": self.artifact_version,
+                    "autots_version": __version__,
+                    "artifact": self,
+                },
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
-            forecast_objects[interval] = df_forecast
-        return forecast_objects
+
+
+def load_artifact(filename: str):
+    """Load a ForecastArtifact saved by AutoTS.export_artifact or ForecastArtifact.save.
+
+    Only load files from trusted sources, as this uses pickle.
+
+    Args:
+        filename (str): file path
+
+    Returns:
+        ForecastArtifact
+    """
+    import pickle
+
+    with open(filename, "rb") as f:
+        saved = pickle.load(f)
+    if not isinstance(saved, dict) or "artifact" not in saved:
+        raise ValueError(f"{filename} is not a ForecastArtifact file")
+    if saved["artifact_version"] > ForecastArtifact.artifact_version:
+        raise ValueError(
+            f"artifact version {saved['artifact_version']} was saved by a newer AutoTS ({saved['autots_version']})"
+        )
+    return saved["artifact"]
 
 
 def fake_regressor(
@@ -6,6 +6,7 @@ import random
 import numpy as np
 import pandas as pd
 from autots.evaluator.auto_model import model_forecast, back_forecast
+from autots.models.base import interval_quantiles
 from autots.evaluator.auto_ts import AutoTS
 
 
@@ -382,29 +383,27 @@ class EventRiskForecast(object):
         else:
             if isinstance(prediction_interval, float):
                 prediction_interval = list(set([prediction_interval, 0.95, 0.8, 0.5]))
-            result_windows_list = []
-            point_included = False
+            # model is fit once for all intervals
+            forecasts = model_forecast(
+                model_name=model_name,
+                model_param_dict=model_param_dict,
+                model_transform_dict=model_transform_dict,
+                df_train=df_train,
+                forecast_length=forecast_length,
+                frequency=frequency,
+                prediction_interval=prediction_interval,
+                future_regressor_train=future_regressor_train,
+                future_regressor_forecast=future_regressor_forecast,
+                return_model=True,
+                **model_forecast_kwargs,
+            )
+            lower_forecast = forecasts.lower_forecast
+            upper_forecast = forecasts.upper_forecast
+            result_windows_list = [forecasts.forecast]
             for interval in prediction_interval:
-                forecasts = model_forecast(
-                    model_name=model_name,
-                    model_param_dict=model_param_dict,
-                    model_transform_dict=model_transform_dict,
-                    df_train=df_train,
-                    forecast_length=forecast_length,
-                    frequency=frequency,
-                    prediction_interval=interval,
-                    future_regressor_train=future_regressor_train,
-                    future_regressor_forecast=future_regressor_forecast,
-                    return_model=True,
-                    **model_forecast_kwargs,
-                )
-                if not point_included:
-                    result_windows_list.append(forecasts.forecast)
-                    lower_forecast = forecasts.lower_forecast
-                    upper_forecast = forecasts.upper_forecast
-                    point_included = True
-                result_windows_list.append(forecasts.upper_forecast)
-                result_windows_list.append(forecasts.lower_forecast)
+                lower_q, upper_q = interval_quantiles(interval)
+                result_windows_list.append(forecasts.quantile(upper_q))
+                result_windows_list.append(forecasts.quantile(lower_q))
             result_windows = np.array(result_windows_list)
         return result_windows, forecasts.forecast, upper_forecast, lower_forecast
 
@@ -6,6 +6,7 @@ Base model information
 """
 import warnings
 import datetime
+import copy
 import numpy as np
 import pandas as pd
 from autots.tools.shaping import infer_frequency, clean_weights
@@ -229,6 +230,33 @@ def apply_constraints(
     return forecast, lower_forecast, upper_forecast
 
 
+def interval_quantiles(prediction_interval: float):
+    """Return the (lower, upper) quantiles bounding a prediction interval."""
+    lower = round((1 - prediction_interval) / 2, 10)
+    return lower, round(1 - lower, 10)
+
+
+def combine_interval_predictions(predictions, prediction_intervals):
+    """Merge predictions of the same fitted model made at several prediction intervals.
+
+    Args:
+        predictions (list): PredictionObjects, one per interval
+        prediction_intervals (list): the interval of each prediction
+
+    Returns:
+        the first PredictionObject, with .quantiles and .quantile_forecast covering all intervals
+    """
+    levels = {0.5: predictions[0].forecast.to_numpy()}
+    for prediction, interval in zip(predictions, prediction_intervals):
+        lower_q, upper_q = interval_quantiles(interval)
+        levels.setdefault(lower_q, prediction.lower_forecast.to_numpy())
+        levels.setdefault(upper_q, prediction.upper_forecast.to_numpy())
+    combined = predictions[0]
+    combined.quantiles = sorted(levels)
+    combined.quantile_forecast = np.stack([levels[q] for q in combined.quantiles])
+    return combined
+
+
 class PredictionObject(object):
     """Generic class for holding forecast information.
 
@@ -239,10 +267,14 @@ class PredictionObject(object):
         forecast
         upper_forecast
         lower_forecast
+        quantiles: quantile levels of quantile_forecast, if forecast for a list of intervals
+        quantile_forecast: array of (quantiles, forecast_length, series)
 
     Methods:
         long_form_results: return complete results in long form
         total_runtime: return runtime for all model components in seconds
+        quantile: return forecast of one quantile as pd.DataFrame
+        interval: return PredictionObject of one of several prediction intervals
         plot
         evaluate
         apply_constraints
@@ -270,6 +302,8 @@ class PredictionObject(object):
         full_mae_error=None,
         model=None,
         transformer=None,
+        quantile_forecast=None,
+        quantiles=None,
     ):
         self.model_name = model_name
         self.model_parameters = model_parameters
@@ -293,6 +327,9 @@ class PredictionObject(object):
         # model attributes, not normally used
         self.model = model
         self.transformer = transformer
+        # (quantiles, forecast_length, series) array, when multiple intervals forecast
+        self.quantile_forecast = quantile_forecast
+        self.quantiles = quantiles
 
     def __repr__(self):
         """Print."""
@@ -364,6 +401,42 @@ class PredictionObject(object):
         """Combine runtimes."""
         return self.fit_runtime + self.predict_runtime + self.transformation_runtime
 
+    def quantile(self, q: float):
+        """Return forecast of one quantile, where 0.5 is the point forecast.
+
+        Only available when forecast was made with a list of prediction intervals,
+        and only for the quantiles those intervals cover (see .quantiles).
+
+        Args:
+            q (float): quantile in [0, 1], ie 0.1 for P10
+
+        Returns:
+            pd.DataFrame
+        """
+        if self.quantile_forecast is None:
+            raise ValueError("forecast was not made with a list of prediction intervals")
+        pos = np.nonzero(np.isclose(self.quantiles, q))[0]
+        if pos.size == 0:
+            raise ValueError(f"quantile {q} not in available quantiles {self.quantiles}")
+        return pd.DataFrame(
+            self.quantile_forecast[pos[0]],
+            index=self.forecast.index,
+            columns=self.forecast.columns,
+        )
+
+    def interval(self, prediction_interval: float):
+        """Return a copy with upper and lower forecasts of one of the prediction intervals.
+
+        Args:
+            prediction_interval (float): one of the intervals the forecast was made with
+        """
+        lower_q, upper_q = interval_quantiles(prediction_interval)
+        prediction = copy.copy(self)
+        prediction.prediction_interval = prediction_interval
+        prediction.lower_forecast = self.quantile(lower_q)
+        prediction.upper_forecast = self.quantile(upper_q)
+        return prediction
+
     def plot(
         self,
         df_wide=None,
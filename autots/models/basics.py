@@ -5,35 +5,167 @@ from math import ceil
 import warnings
 import random
 import datetime
+from importlib.util import find_spec
 import numpy as np
 import pandas as pd
 from autots.models.base import ModelObject, PredictionObject
 from autots.tools.seasonal import seasonal_int, seasonal_window_match
 from autots.tools.probabilistic import Point_to_Probability, historic_quantile
 from autots.tools.window_functions import window_id_maker, sliding_window_view
-from autots.tools.percentile import nan_quantile
+from autots.tools.percentile import nan_quantile, nan_percentile
 from autots.tools.fast_kalman import KalmanFilter, random_state_space
+from autots.tools.cache import train_stat_cache, data_key
 from autots.tools.transform import GeneralTransformer, RandomTransform, filters
 
+# optional packages (scipy, sklearn, joblib) are imported where used
+joblib_present = find_spec("joblib") is not None
 
-# these are all optional packages
-try:
-    from scipy.spatial.distance import cdist
-    from scipy.stats import norm
 
-    # from scipy.stats import t as studentt
-except Exception:
-    pass
-try:
-    from joblib import Parallel, delayed
+class NaiveStatistics(object):
+    """Statistics shared by the naive model family, computed once per training array.
+
+    Many AverageValueNaive and SeasonalNaive templates are run on the same training data.
+    Each distinct statistic (method, window, lag) is computed vectorized on first request
+    and kept in the shared train_stat_cache for every later template with the same data.
+    Only the derived statistics are cached, not the training data.
+    Use naive_statistics(df) to get the object for a DataFrame.
+
+    Args:
+        df (pandas.DataFrame): Datetime Indexed training data
+        key (bytes): digest identifying df in the cache, if None nothing is cached
+    """
+
+    def __init__(self, df, key=None):
+        self.index = df.index
+        arr = df.to_numpy()
+        if not np.issubdtype(arr.dtype, np.floating):
+            arr = arr.astype(float)
+        self.arr = arr
+        self.key = key
+
+    def _window(self, window=None):
+        if window is None:
+            return self.arr, self.index
+        return self.arr[-window:], self.index[-window:]
+
+    def _cached(self, key, func):
+        if self.key is None:
+            return func()
+        return train_stat_cache.get(("naive_statistics", self.key) + key, func)
+
+    def average(self, method: str = "median", window: int = None):
+        """Return 1D array of one value per series, as in AverageValueNaive."""
+        method = str(method).lower()
+        return self._cached(
+            ("average", method, window), lambda: self._average(method, window)
+        )
 
-    joblib_present = True
-except Exception:
-    joblib_present = False
-try:
-    from sklearn.metrics.pairwise import nan_euclidean_distances, pairwise_distances
-except Exception:
-    pass
+    def _average(self, method, window):
+        arr, index = self._window(window)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            if method == "median":
+                return _nan_median(arr)
+            elif method == "mean":
+                return np.nanmean(arr, axis=0)
+            elif method == "mode":
+                mode = _nan_mode(arr)
+                return np.where(np.isnan(mode), self.average("median", window), mode)
+            elif method == "midhinge":
+                q1, q2 = nan_percentile(arr.copy(), [25, 75])
+                return (q1 + q2) / 2
+            elif method in ["weighted_mean", "exp_weighted_mean"]:
+                weights = pd.to_numeric(index)
+                weights = weights - weights.min()
+                if method == "exp_weighted_mean":
+                    weights = (weights / weights[weights != 0].min()) ** 2
+                return np.average(arr, axis=0, weights=weights)
+        return None
+
+    def historic_quantile(self, prediction_interval: float = 0.9, window: int = None):
+        """Cached historic_quantile of the (optionally windowed) data."""
+        return self._cached(
+            ("historic_quantile", prediction_interval, window),
+            lambda: historic_quantile(
+                self._window(window)[0],
+                prediction_interval=prediction_interval,
+            ),
+        )
+
+    def seasonal(self, method: str = "lastvalue", lag: int = 7):
+        """Return 2D array of one seasonal cycle (lag rows or fewer), as in SeasonalNaive.
+
+        Args:
+            method (str): 'lastvalue', 'mean' or 'median' of each position in the seasonal cycle
+            lag (int): length of seasonal cycle
+        """
+        method = str(method).lower()
+        if method not in ["mean", "median"]:
+            method = "lastvalue"
+        return self._cached(
+            ("seasonal", method, lag), lambda: self._seasonal(method, lag)
+        )
+
+    def _seasonal(self, method, lag):
+        arr = self.arr
+        if method == "lastvalue":
+            # copied so the cached result does not keep the training array alive
+            return arr[-lag:].copy()
+        # pad the front so the last row is the last position of the cycle
+        df_length = arr.shape[0]
+        n_cycles = int(np.ceil(df_length / lag))
+        padded = np.full((n_cycles * lag, arr.shape[1]), np.nan, dtype=arr.dtype)
+        padded[padded.shape[0] - df_length :] = arr
+        padded = padded.reshape(n_cycles, lag, arr.shape[1])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            if method == "median":
+                result = _nan_median(padded)
+            else:
+                result = np.nanmean(padded, axis=0)
+        # positions of the cycle never observed are not included
+        return result[-min(lag, df_length) :]
+
+
+def _nan_median(arr):
+    """Median along the first axis ignoring NaN, via one sort rather than np.nanmedian."""
+    srt = np.sort(arr, axis=0)
+    valid = np.sum(~np.isnan(arr), axis=0, keepdims=True)
+    lower = np.clip((valid - 1) // 2, 0, None)
+    upper = np.clip(valid // 2, 0, None)
+    median = (
+        np.take_along_axis(srt, lower, axis=0) + np.take_along_axis(srt, upper, axis=0)
+    ) / 2
+    return np.where(valid > 0, median, np.nan)[0]
+
+
+def _nan_mode(arr):
+    """Most frequent value of each column, smallest on ties, NaN if column is all NaN."""
+    srt = np.sort(arr, axis=0)
+    positions = np.arange(srt.shape[0])[:, None]
+    new_run = np.ones(srt.shape, dtype=bool)
+    new_run[1:] = srt[1:] != srt[:-1]
+    run_start = np.maximum.accumulate(np.where(new_run, positions, 0), axis=0)
+    run_length = np.where(np.isnan(srt), 0, positions - run_start + 1)
+    best = np.argmax(run_length, axis=0)
+    mode = srt[best, np.arange(srt.shape[1])]
+    mode[run_length.max(axis=0) == 0] = np.nan
+    return mode
+
+
+def naive_statistics(df):
+    """Return a NaiveStatistics for df, reusing cached statistics if the data is identical.
+
+    Args:
+        df (pandas.DataFrame): Datetime Indexed training data
+    """
+    arr = df.to_numpy()
+    if arr.dtype.kind not in "fiub" or arr.ndim != 2:
+        return NaiveStatistics(df)
+    key = data_key(
+        arr, pd.util.hash_pandas_object(df.index, index=False).to_numpy().tobytes()
+    )
+    return NaiveStatistics(df, key=key)
 
 
 class ConstantNaive(ModelObject):
@@ -171,10 +303,8 @@ class LastValueNaive(ModelObject):
         """
         df = self.basic_profile(df)
         self.last_values = df.tail(1).to_numpy()
-        # self.df_train = df
-        self.lower, self.upper = historic_quantile(
-            df.iloc[-100:], prediction_interval=self.prediction_interval
-        )
+        # bounds are computed in predict, so prediction_interval may change after fit
+        self.df_tail = df.iloc[-100:]
         self.fit_runtime = datetime.datetime.now() - self.startTime
         return self
 
@@ -201,8 +331,11 @@ class LastValueNaive(ModelObject):
         if just_point_forecast:
             return df
         else:
-            upper_forecast = df.astype(float) + (self.upper * 0.9)
-            lower_forecast = df.astype(float) - (self.lower * 0.9)
+            lower, upper = historic_quantile(
+                self.df_tail, prediction_interval=self.prediction_interval
+            )
+            upper_forecast = df.astype(float) + (upper * 0.9)
+            lower_forecast = df.astype(float) - (lower * 0.9)
             predict_runtime = datetime.datetime.now() - predictStartTime
             prediction = PredictionObject(
                 model_name=self.name,
@@ -269,37 +402,9 @@ class AverageValueNaive(ModelObject):
             df (pandas.DataFrame): Datetime Indexed
         """
         df = self.basic_profile(df)
-        method = str(self.method).lower()
-        if self.window is not None:
-            df_used = df[-self.window :]
-        else:
-            df_used = df
-
-        if method == 'median':
-            self.average_values = df_used.median(axis=0).to_numpy()
-        elif method == 'mean':
-            self.average_values = df_used.mean(axis=0).to_numpy()
-        elif method == 'mode':
-            self.average_values = (
-                df_used.mode(axis=0).iloc[0].fillna(df_used.median(axis=0)).to_numpy()
-            )
-        elif method == "midhinge":
-            results = df_used.to_numpy()
-            q1 = nan_quantile(results, q=0.25, axis=0)
-            q2 = nan_quantile(results, q=0.75, axis=0)
-            self.average_values = (q1 + q2) / 2
-        elif method in ["weighted_mean", "exp_weighted_mean"]:
-            weights = pd.to_numeric(df_used.index)
-            weights = weights - weights.min()
-            if method == "exp_weighted_mean":
-                weights = (weights / weights[weights != 0].min()) ** 2
-            self.average_values = np.average(
-                df_used.to_numpy(), axis=0, weights=weights
-            )
+        self.stats = naive_statistics(df)
+        self.average_values = self.stats.average(self.method, self.window)
         self.fit_runtime = datetime.datetime.now() - self.startTime
-        self.lower, self.upper = historic_quantile(
-            df_used, prediction_interval=self.prediction_interval
-        )
         return self
 
     def predict(
@@ -325,8 +430,11 @@ class AverageValueNaive(ModelObject):
         if just_point_forecast:
             return df
         else:
-            upper_forecast = df.astype(float) + self.upper
-            lower_forecast = df.astype(float) - self.lower
+            lower, upper = self.stats.historic_quantile(
+                self.prediction_interval, self.window
+            )
+            upper_forecast = df.astype(float) + upper
+            lower_forecast = df.astype(float) - lower
             predict_runtime = datetime.datetime.now() - predictStartTime
             prediction = PredictionObject(
                 model_name=self.name,
@@ -423,37 +531,14 @@ class SeasonalNaive(ModelObject):
         """
         df = self.basic_profile(df)
         self.df_train = df
-
-        df_length = self.train_shape[0]
+        stats = naive_statistics(df)
+        self.tile_values_lag_1 = stats.seasonal(self.method, self.lag_1)
         self.tile_values_lag_2 = None
-        if self.method in ['mean', 'median']:
-            tile_index = np.tile(
-                np.arange(self.lag_1), int(np.ceil(df_length / self.lag_1))
+        if str(self.lag_2).isdigit():
+            # a lag_2 of 1 is always the last value
+            self.tile_values_lag_2 = stats.seasonal(
+                self.method if self.lag_2 != 1 else "lastvalue", self.lag_2
             )
-            tile_index = tile_index[len(tile_index) - (df_length) :]
-            df.index = tile_index
-            if self.method == "median":
-                self.tile_values_lag_1 = df.groupby(level=0, axis=0).median()
-            else:
-                self.tile_values_lag_1 = df.groupby(level=0, axis=0).mean()
-            if str(self.lag_2).isdigit():
-                if self.lag_2 == 1:
-                    self.tile_values_lag_2 = df.tail(self.lag_2)
-                else:
-                    tile_index = np.tile(
-                        np.arange(self.lag_2), int(np.ceil(df_length / self.lag_2))
-                    )
-                    tile_index = tile_index[len(tile_index) - (df_length) :]
-                    df.index = tile_index
-                    if self.method == "median":
-                        self.tile_values_lag_2 = df.groupby(level=0, axis=0).median()
-                    else:
-                        self.tile_values_lag_2 = df.groupby(level=0, axis=0).mean()
-        else:
-            self.method == 'lastvalue'
-            self.tile_values_lag_1 = df.tail(self.lag_1)
-            if str(self.lag_2).isdigit():
-                self.tile_values_lag_2 = df.tail(self.lag_2)
         self.fit_runtime = datetime.datetime.now() - self.startTime
         return self
 
@@ -475,7 +560,7 @@ class SeasonalNaive(ModelObject):
             if just_point_forecast == True, a dataframe of point forecasts
         """
         predictStartTime = datetime.datetime.now()
-        tile_len = len(self.tile_values_lag_1.index)
+        tile_len = self.tile_values_lag_1.shape[0]
         df = pd.DataFrame(
             np.tile(
                 self.tile_values_lag_1, (int(np.ceil(forecast_length / tile_len)), 1)
@@ -489,7 +574,7 @@ class SeasonalNaive(ModelObject):
                     self.tile_values_lag_2,
                     (
                         int(
-                            np.ceil(forecast_length / len(self.tile_values_lag_2.index))
+                            np.ceil(forecast_length / self.tile_values_lag_2.shape[0])
                         ),
                         1,
                     ),
@@ -544,6 +629,63 @@ class SeasonalNaive(ModelObject):
         return {'method': self.method, 'lag_1': self.lag_1, 'lag_2': self.lag_2}
 
 
+def _sign_view(arr):
+    """Sign of values as used by the 'pct_change_sign' comparison, NaN as -1."""
+    return np.where(np.isnan(arr), -1, np.sign(arr))
+
+
+def _motif_distances(x, y, metric: str = "l2"):
+    """Distance of each series' motif vectors to that series' last motif.
+
+    Vectorized for common metrics, otherwise falls back to sklearn pairwise_distances per series.
+
+    Args:
+        x (np.array): motif vectors of shape (n_motifs, n_series, phrase_len)
+        y (np.array): last motif of each series, shape (n_series, phrase_len)
+        metric (str): name of distance metric, as in sklearn pairwise_distances
+
+    Returns:
+        np.array of shape (n_motifs, n_series)
+    """
+    if metric in ['euclidean', 'l2', 'minkowski', 'sqeuclidean']:
+        dist = np.sum((x - y) ** 2, axis=-1)
+        return dist if metric == 'sqeuclidean' else np.sqrt(dist)
+    elif metric in ['cityblock', 'l1', 'manhattan']:
+        return np.sum(np.abs(x - y), axis=-1)
+    elif metric == 'chebyshev':
+        return np.max(np.abs(x - y), axis=-1)
+    elif metric == 'hamming':
+        return np.mean(x != y, axis=-1)
+    elif metric in ['cosine', 'correlation']:
+        if metric == 'correlation':
+            x = x - np.mean(x, axis=-1, keepdims=True)
+            y = y - np.mean(y, axis=-1, keepdims=True)
+        x_norm = np.linalg.norm(x, axis=-1)
+        y_norm = np.linalg.norm(y, axis=-1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if metric == 'cosine':
+                # as sklearn, zero vectors are left unscaled
+                x_norm = np.where(x_norm == 0, 1, x_norm)
+                y_norm = np.where(y_norm == 0, 1, y_norm)
+                return np.clip(1 - np.sum(x * y, axis=-1) / (x_norm * y_norm), 0, 2)
+            return 1 - np.sum(x * y, axis=-1) / (x_norm * y_norm)
+    elif metric == 'braycurtis':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.sum(np.abs(x - y), axis=-1) / np.sum(np.abs(x + y), axis=-1)
+    elif metric == 'canberra':
+        denom = np.abs(x) + np.abs(y)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = np.abs(x - y) / np.where(denom == 0, np.nan, denom)
+            return np.nansum(ratio, axis=-1)
+    else:
+        from sklearn.metrics.pairwise import pairwise_distances
+
+        dist = np.empty(x.shape[:-1])
+        for i in range(x.shape[1]):
+            dist[:, i] = pairwise_distances(x[:, i], y[i : i + 1], metric=metric)[:, 0]
+        return dist
+
+
 class MotifSimulation(ModelObject):
     """More dark magic created by the evil mastermind of this project.
     Basically a highly-customized KNN
@@ -564,6 +706,7 @@ class MotifSimulation(ModelObject):
         cutoff_threshold (float): lowest value of distance metric to allow into forecast
         cutoff_minimum (int): minimum number of motif vectors to include in forecast.
         point_method (str): summarization method to choose forecast on, 'sample', 'mean', 'sign_biased_mean', 'median'
+        block_size (int): number of series computed at once, None picks a size keeping arrays near 10 million elements
     """
 
     def __init__(
@@ -582,6 +725,7 @@ class MotifSimulation(ModelObject):
         cutoff_threshold: float = 0.9,
         cutoff_minimum: int = 20,
         point_method: str = 'median',
+        block_size: int = None,
         n_jobs: int = -1,
         verbose: int = 1,
         **kwargs,
@@ -595,6 +739,7 @@ class MotifSimulation(ModelObject):
             random_seed=random_seed,
             n_jobs=n_jobs,
         )
+        self.block_size = block_size
         self.phrase_len = phrase_len
         self.comparison = comparison
         self.shared = shared
@@ -605,6 +750,12 @@ class MotifSimulation(ModelObject):
         self.cutoff_minimum = cutoff_minimum
         self.point_method = point_method
 
+    def _block_size(self, elements_per_series: int):
+        """Number of series to compute at once."""
+        if self.block_size is not None:
+            return max(int(self.block_size), 1)
+        return max(int(1e7 // max(elements_per_series, 1)), 1)
+
     def fit(self, df, future_regressor=None):
         """Train algorithm given data supplied.
 
@@ -650,13 +801,6 @@ class MotifSimulation(ModelObject):
         na_threshold = 0.1
         point_method = self.point_method
 
-        parallel = True
-        if self.n_jobs in [0, 1] or df.shape[1] < 3:
-            parallel = False
-        else:
-            if not joblib_present:
-                parallel = False
-
         # start_time_1st = timeit.default_timer()
         # transform the data into different views (contour = percent_change)
         original_df = None
@@ -675,191 +819,111 @@ class MotifSimulation(ModelObject):
         # else:
         # self.comparison = 'magnitude'
 
-        if 'pct_change_sign' in comparison:
-            last_motif = df.where(df >= 0, -1).where(df <= 0, 1).tail(phrase_n)
+        arr = df.to_numpy(dtype=float)
+        n_rows, n_series = arr.shape
+        # values following a motif, in original magnitude if requested
+        if original_df is not None:
+            source = original_df.to_numpy(dtype=float)[1:]
         else:
-            last_motif = df.tail(phrase_n)
+            source = arr
 
-        max_samps = df.shape[0] - phrase_n
+        last_motif = arr[-phrase_n:].T
+        max_samps = n_rows - phrase_n
         numbers = np.random.choice(
             max_samps,
             size=max_motifs_n if max_motifs_n < max_samps else max_samps,
             replace=False,
         )
-
-        # make this faster
-        motif_vecs_list = []
-        # takes random slices of the time series and rearranges as phrase_n length vectors
-        for z in numbers:
-            rand_slice = df.iloc[
-                z : (z + phrase_n),
-            ]
-            rand_slice = (
-                rand_slice.reset_index(drop=True)
-                .transpose()
-                .set_index(np.repeat(z, (df.shape[1],)), append=True)
-            )
-            # motif_vecs = pd.concat([motif_vecs, rand_slice], axis=0)
-            motif_vecs_list.append(rand_slice)
-        motif_vecs = pd.concat(motif_vecs_list, axis=0)
-
+        # (motifs, series, phrase_n) random slices of the time series
+        motif_vecs = sliding_window_view(arr, phrase_n, axis=0)[numbers]
         if 'pct_change_sign' in comparison:
-            motif_vecs = motif_vecs.where(motif_vecs >= 0, -1).where(motif_vecs <= 0, 1)
+            last_motif = _sign_view(last_motif)
+            motif_vecs = _sign_view(motif_vecs)
         # elapsed_1st = timeit.default_timer() - start_time_1st
         # start_time_2nd = timeit.default_timer()
-        # compare the motif vectors to the most recent vector of the series
-        args = {
-            "cutoff_minimum": cutoff_minimum,
-            "comparison": comparison,
-            "point_method": point_method,
-            "prediction_interval": prediction_interval,
-            "phrase_n": phrase_n,
-            "distance_metric": distance_metric,
-            "shared": shared,
-            "na_threshold": na_threshold,
-            "original_df": original_df,
-            "df": df,
-        }
 
+        # compare the motif vectors to the most recent vector of the series
+        # comparative is (candidate motifs, series), each candidate has a start and series
         if shared:
-            comparative = pd.DataFrame(
-                pairwise_distances(
-                    motif_vecs.to_numpy(),
-                    last_motif.transpose().to_numpy(),
-                    metric=distance_metric,
-                )
-            )
-            comparative.index = motif_vecs.index
-            comparative.columns = last_motif.columns
-        if not shared:
-
-            def create_comparative(motif_vecs, last_motif, args, col):
-                distance_metric = args["distance_metric"]
-                x = motif_vecs[motif_vecs.index.get_level_values(0) == col]
-                y = last_motif[col].to_numpy().reshape(1, -1)
-                current_comparative = pd.DataFrame(
-                    pairwise_distances(x.to_numpy(), y, metric=distance_metric)
+            from sklearn.metrics.pairwise import pairwise_distances
+
+            # every series' motifs are candidates for every series
+            motif_vecs = motif_vecs.reshape(-1, phrase_n)
+            cand_start = np.repeat(numbers, n_series)
+            cand_series = np.tile(np.arange(n_series), numbers.shape[0])
+            comparative = np.empty((motif_vecs.shape[0], n_series))
+            block = self._block_size(motif_vecs.shape[0] * phrase_n)
+            for i in range(0, n_series, block):
+                comparative[:, i : i + block] = pairwise_distances(
+                    motif_vecs, last_motif[i : i + block], metric=distance_metric
                 )
-                current_comparative.index = x.index
-                current_comparative.columns = [col]
-                return current_comparative
-
-            if parallel:
-                verbs = 0 if self.verbose < 1 else self.verbose - 1
-                df_list = Parallel(n_jobs=self.n_jobs, verbose=(verbs))(
-                    delayed(create_comparative)(
-                        motif_vecs=motif_vecs, last_motif=last_motif, args=args, col=col
-                    )
-                    for col in last_motif.columns
+        else:
+            cand_start = numbers
+            cand_series = None
+            comparative = np.empty((numbers.shape[0], n_series))
+            block = self._block_size(numbers.shape[0] * phrase_n)
+            for i in range(0, n_series, block):
+                comparative[:, i : i + block] = _motif_distances(
+                    motif_vecs[:, i : i + block],
+                    last_motif[i : i + block],
+                    metric=distance_metric,
                 )
-            else:
-                df_list = []
-                for col in last_motif.columns:
-                    df_list.append(
-                        create_comparative(motif_vecs, last_motif, args, col)
-                    )
-            comparative = pd.concat(df_list, axis=0)
-            comparative = comparative.groupby(level=[0, 1]).sum(min_count=0)
+            comparative = np.nan_to_num(comparative, nan=0.0)
+        del motif_vecs
 
-            # comparative comes out of this looking kinda funny, but get_level_values works with that later
-            # it might be possible to reshape it to a more memory efficient design
-
-        # comparative is a df of motifs (in index) with their value to each series (per column)
         if recency_weighting != 0:
-            rec_weights = np.repeat(
-                ((comparative.index.get_level_values(1)) / df.shape[0])
-                .to_numpy()
-                .reshape(-1, 1)
-                * recency_weighting,
-                len(comparative.columns),
-                axis=1,
-            )
-            comparative = comparative.add(rec_weights, fill_value=0)
-
-        def seek_the_oracle(comparative, args, col):
-            # comparative.idxmax()
-            cutoff_minimum = args["cutoff_minimum"]
-            comparison = args["comparison"]
-            point_method = args["point_method"]
-            prediction_interval = args["prediction_interval"]
-            phrase_n = args["phrase_n"]
-            shared = args["shared"]
-            na_threshold = args["na_threshold"]
-            original_df = args["original_df"]
-            df = args["df"]
-
-            vals = comparative[col].sort_values(ascending=False)
-            if not shared:
-                vals = vals[vals.index.get_level_values(0) == col]
-            # vals = vals[vals > cutoff_threshold]
-            # if vals.shape[0] < cutoff_minimum:
-            vals = comparative[col].sort_values(ascending=False)
-            if not shared:
-                vals = vals[vals.index.get_level_values(0) == col]
-            vals = vals.head(cutoff_minimum)
-
-            pos_forecasts = pd.DataFrame()
-            for val_index, val_value in vals.items():
-                sec_start = val_index[1] + phrase_n
-                if comparison in ['magnitude_pct_change', 'magnitude_pct_change_sign']:
-                    current_pos = original_df[val_index[0]].iloc[sec_start + 1 :]
-                else:
-                    current_pos = df[val_index[0]].iloc[sec_start:]
-                pos_forecasts = pd.concat(
-                    [pos_forecasts, current_pos.reset_index(drop=True)],
-                    axis=1,
-                    sort=False,
-                )
+            comparative += (cand_start / n_rows * recency_weighting)[:, np.newaxis]
 
-            thresh = int(np.ceil(pos_forecasts.shape[1] * na_threshold))
-            if point_method == 'mean':
-                current_forecast = pos_forecasts.mean(axis=1)
-            elif point_method == 'sign_biased_mean':
-                axis_means = pos_forecasts.mean(axis=0)
-                if axis_means.mean() > 0:
-                    pos_forecasts = pos_forecasts[
-                        pos_forecasts.columns[~(axis_means < 0)]
-                    ]
-                else:
-                    pos_forecasts = pos_forecasts[
-                        pos_forecasts.columns[~(axis_means > 0)]
-                    ]
-                current_forecast = pos_forecasts.mean(axis=1)
-            else:
-                point_method = 'median'
-                current_forecast = pos_forecasts.median(axis=1)
-            # current_forecast.columns = [col]
-            forecast = current_forecast.copy()
-            forecast.name = col
-
-            current_forecast = (
-                pos_forecasts.dropna(thresh=thresh, axis=0)
-                .quantile(q=[(1 - prediction_interval), prediction_interval], axis=1)
-                .transpose()
-            )
-
-            lower_forecast = pd.Series(current_forecast.iloc[:, 0], name=col)
-            upper_forecast = pd.Series(current_forecast.iloc[:, 1], name=col)
-            return (forecast, lower_forecast, upper_forecast)
-
-        # seek_the_oracle(comparative, args, comparative.columns[0])
-        if parallel:
-            verbs = 0 if self.verbose < 1 else self.verbose - 1
-            df_list = Parallel(n_jobs=self.n_jobs, verbose=(verbs))(
-                delayed(seek_the_oracle)(comparative=comparative, args=args, col=col)
-                for col in comparative.columns
-            )
-            complete = list(map(list, zip(*df_list)))
+        # choose the cutoff_minimum highest of comparative, ties in candidate order
+        n_select = min(cutoff_minimum, comparative.shape[0])
+        selected = np.argsort(-comparative, axis=0, kind='stable')[:n_select]
+        del comparative
+        sel_start = cand_start[selected] + phrase_n
+        if shared:
+            sel_series = cand_series[selected]
         else:
-            df_list = []
-            for col in comparative.columns:
-                df_list.append(seek_the_oracle(comparative, args, col))
-            complete = list(map(list, zip(*df_list)))
-        forecasts = pd.concat(
-            complete[0], axis=1
-        )  # .reindex(self.column_names, axis=1)
-        lower_forecasts = pd.concat(complete[1], axis=1)
-        upper_forecasts = pd.concat(complete[2], axis=1)
+            sel_series = np.broadcast_to(np.arange(n_series), selected.shape)
+        thresh = int(np.ceil(n_select * na_threshold))
+        # length of the longest possible path following any chosen motif
+        path_len = n_rows - int(sel_start.min())
+        steps = np.arange(path_len)[np.newaxis, :, np.newaxis]
+
+        forecasts = np.full((path_len, n_series), np.nan)
+        lower_forecasts = np.full((path_len, n_series), np.nan)
+        upper_forecasts = np.full((path_len, n_series), np.nan)
+        block = self._block_size(n_select * path_len)
+        for i in range(0, n_series, block):
+            # (chosen motifs, steps, series) of the values following each motif
+            rows = sel_start[:, np.newaxis, i : i + block] + steps
+            pos_forecasts = source[
+                np.minimum(rows, n_rows - 1),
+                sel_series[:, np.newaxis, i : i + block],
+            ]
+            pos_forecasts[rows >= n_rows] = np.nan
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                if point_method == 'sign_biased_mean':
+                    axis_means = np.nanmean(pos_forecasts, axis=1)
+                    positive = np.nanmean(axis_means, axis=0) > 0
+                    keep = np.where(positive, ~(axis_means < 0), ~(axis_means > 0))
+                    pos_forecasts[~np.broadcast_to(keep[:, None], rows.shape)] = np.nan
+                count = np.sum(~np.isnan(pos_forecasts), axis=0)
+                if point_method in ['mean', 'sign_biased_mean']:
+                    point = np.nanmean(pos_forecasts, axis=0)
+                else:
+                    point = nan_percentile(pos_forecasts, q=50)
+                    point[count == 0] = np.nan
+                bounds = nan_percentile(
+                    pos_forecasts,
+                    q=[(1 - prediction_interval) * 100, prediction_interval * 100],
+                )
+            bounds[:, count < max(thresh, 1)] = np.nan
+            forecasts[:, i : i + block] = point
+            lower_forecasts[:, i : i + block] = bounds[0]
+            upper_forecasts[:, i : i + block] = bounds[1]
+        forecasts = pd.DataFrame(forecasts, columns=df.columns)
+        lower_forecasts = pd.DataFrame(lower_forecasts, columns=df.columns)
+        upper_forecasts = pd.DataFrame(upper_forecasts, columns=df.columns)
 
         if comparison in ['pct_change', 'pct_change_sign']:
             forecasts = (forecasts + 1).replace([0], np.nan)
@@ -1103,6 +1167,8 @@ def looped_motif(
     # model.fit(Xa)
     # model.kneighbors(Xb)
 
+    from scipy.spatial.distance import cdist
+
     A = cdist(Xa, Xb, metric=distance_metric)
     # lowest values
     idx = np.argpartition(A, k, axis=0)[:k].flatten()
@@ -1242,6 +1308,8 @@ class Motif(ModelObject):
 
         # joblib multiprocessing to loop through series
         if self.parallel:
+            from joblib import Parallel, delayed
+
             df_list = Parallel(n_jobs=(self.n_jobs - 1))(
                 delayed(looped_motif)(
                     Xa=x.reshape(-1, x.shape[-1]) if self.multivariate else x[:, i],
@@ -1838,6 +1906,8 @@ class SectionalMotif(ModelObject):
         )
         # calculate distance between all points and last window of history
         if distance_metric == "nan_euclidean":
+            from sklearn.metrics.pairwise import nan_euclidean_distances
+
             res = np.array(
                 [
                     nan_euclidean_distances(
@@ -1863,6 +1933,8 @@ class SectionalMotif(ModelObject):
                 )
                 res = np.mean([res, res_diff], axis=0)
         else:
+            from scipy.spatial.distance import cdist
+
             res = np.array(
                 [
                     cdist(
@@ -2094,6 +2166,8 @@ class KalmanStateSpace(ModelObject):
         if just_point_forecast:
             return df
         else:
+            from scipy.stats import norm
+
             df_stdev = np.sqrt(result.observations.cov).T
             bound = df_stdev * norm.ppf(self.prediction_interval)
             upper_forecast = df + bound
@@ -400,29 +400,44 @@ def conj_grad_w(sparse_mat, ind, W, X, rho, maxiter=5):
     return np.reshape(w, (rank, dim1), order="F")
 
 
-def ell_x(ind, W, X, A, Psi, d, lambda0, rho):
+def _lag_slice(X, d, k):
+    """Equivalent of X @ Psi[k].T from generate_Psi, without the dense (T, T) Psi."""
+    T = X.shape[1]
+    return X[:, d - k : T - k]
+
+
+def _lag_scatter(Y, d, k, T):
+    """Equivalent of Y @ Psi[k] from generate_Psi, without the dense (T, T) Psi."""
+    out = np.zeros((Y.shape[0], T))
+    out[:, d - k : T - k] = Y
+    return out
+
+
+def ell_x(ind, W, X, A, d, lambda0, rho):
     rank, dim2 = X.shape
-    temp = np.zeros((d * rank, Psi[0].shape[0]))
-    for k in range(1, d + 1):
-        temp[(k - 1) * rank : k * rank, :] = X @ Psi[k].T
-    temp1 = X @ Psi[0].T - A @ temp
+    temp = np.concatenate([_lag_slice(X, d, k) for k in range(1, d + 1)], axis=0)
+    temp1 = _lag_slice(X, d, 0) - A @ temp
     temp2 = np.zeros((rank, dim2))
     for k in range(d):
-        temp2 += A[:, k * rank : (k + 1) * rank].T @ temp1 @ Psi[k + 1]
-    return W @ ((W.T @ X) * ind) + rho * X + lambda0 * (temp1 @ Psi[0] - temp2)
+        temp2 += _lag_scatter(
+            A[:, k * rank : (k + 1) * rank].T @ temp1, d, k + 1, dim2
+        )
+    return (
+        W @ ((W.T @ X) * ind)
+        + rho * X
+        + lambda0 * (_lag_scatter(temp1, d, 0, dim2) - temp2)
+    )
 
 
-def conj_grad_x(sparse_mat, ind, W, X, A, Psi, d, lambda0, rho, maxiter=5):
+def conj_grad_x(sparse_mat, ind, W, X, A, d, lambda0, rho, maxiter=5):
     rank, dim2 = X.shape
     x = np.reshape(X, -1, order="F")
-    r = np.reshape(
-        W @ sparse_mat - ell_x(ind, W, X, A, Psi, d, lambda0, rho), -1, order="F"
-    )
+    r = np.reshape(W @ sparse_mat - ell_x(ind, W, X, A, d, lambda0, rho), -1, order="F")
     q = r.copy()
     rold = np.inner(r, r)
     for it in range(maxiter):
         Q = np.reshape(q, (rank, dim2), order="F")
-        Aq = np.reshape(ell_x(ind, W, Q, A, Psi, d, lambda0, rho), -1, order="F")
+        Aq = np.reshape(ell_x(ind, W, Q, A, d, lambda0, rho), -1, order="F")
         x, r, q, rold = update_cg(x, r, q, Aq, rold)
     return np.reshape(x, (rank, dim2), order="F")
 
@@ -443,7 +458,15 @@ def generate_Psi(T, d):
     return Psi
 
 
-def tmf(sparse_mat, rank, d, lambda0, rho, maxiter=50, inner_maxiter=10):
+def tmf(
+    sparse_mat, rank, d, lambda0, rho, maxiter=50, inner_maxiter=10, epsilon=None
+):
+    """Temporal matrix factorization.
+
+    Args:
+        epsilon (float): if given, stop early once the relative change of the
+            reconstructed matrix between iterations falls below this tolerance
+    """
     dim1, dim2 = sparse_mat.shape
     # prevent failure of constant matrix
     if np.all(sparse_mat == sparse_mat[0, 0]):
@@ -452,15 +475,20 @@ def tmf(sparse_mat, rank, d, lambda0, rho, maxiter=50, inner_maxiter=10):
     W = 0.01 * np.random.randn(rank, dim1)
     X = 0.01 * np.random.randn(rank, dim2)
     A = 0.01 * np.random.randn(rank, d * rank)
-    Psi = generate_Psi(dim2, d)
-    temp = np.zeros((d * rank, dim2 - d))
+    last_mat = None
+    snorm = np.linalg.norm(sparse_mat, "fro")
     for it in range(maxiter):
         W = conj_grad_w(sparse_mat, ind, W, X, rho, inner_maxiter)
-        X = conj_grad_x(sparse_mat, ind, W, X, A, Psi, d, lambda0, rho, inner_maxiter)
-        for k in range(1, d + 1):
-            temp[(k - 1) * rank : k * rank, :] = X @ Psi[k].T
-        A = X @ Psi[0].T @ np.linalg.pinv((temp))
+        X = conj_grad_x(sparse_mat, ind, W, X, A, d, lambda0, rho, inner_maxiter)
+        temp = np.concatenate([_lag_slice(X, d, k) for k in range(1, d + 1)], axis=0)
+        A = _lag_slice(X, d, 0) @ np.linalg.pinv((temp))
         mat_hat = W.T @ X
+        if epsilon is not None:
+            if last_mat is not None:
+                tol = np.linalg.norm(mat_hat - last_mat, "fro") / snorm
+                if tol < epsilon:
+                    break
+            last_mat = mat_hat
     return mat_hat, W, X, A
 
 
@@ -483,6 +511,7 @@ class TMF(ModelObject):
         prediction_interval (float): Confidence interval for probabilistic forecast
         regression_type (str): type of regression (None, 'User', or 'Holiday')
         n_jobs (int): passed to joblib for multiprocessing. Set to none for context manager.
+        epsilon (float): if not None, relative tolerance for stopping before maxiter
 
     """
 
@@ -497,6 +526,7 @@ class TMF(ModelObject):
         rank: float = 0.4,
         maxiter: int = 100,
         inner_maxiter: int = 10,
+        epsilon: float = None,
         holiday_country: str = 'US',
         random_seed: int = 2022,
         verbose: int = 0,
@@ -519,6 +549,7 @@ class TMF(ModelObject):
         self.rank = rank
         self.maxiter = maxiter
         self.inner_maxiter = inner_maxiter
+        self.epsilon = epsilon
 
     def fit(self, df, future_regressor=None):
         """Train algorithm given data supplied .
@@ -566,6 +597,7 @@ class TMF(ModelObject):
             self.rho,
             self.maxiter,
             self.inner_maxiter,
+            epsilon=self.epsilon,
         )
         forecast = (W.T @ var4cast(X, A, self.d, forecast_length)).T
 
@@ -606,6 +638,7 @@ class TMF(ModelObject):
             'rank': random.choice([2, 4, 0.1, 0.2, 0.5]),
             'maxiter': 100,
             'inner_maxiter': 10,
+            'epsilon': random.choices([None, 1e-4], [0.5, 0.5])[0],
         }
 
     def get_params(self):
@@ -617,6 +650,7 @@ class TMF(ModelObject):
             'rank': self.rank,
             'maxiter': self.maxiter,
             'inner_maxiter': self.inner_maxiter,
+            'epsilon': self.epsilon,
         }
 
 
@@ -652,6 +686,87 @@ def svt_tnn(mat, tau, theta):
     return u[:, :idx] @ np.diag(vec) @ v[:idx, :]
 
 
+def svt_tnn_randomized(
+    mat, tau, theta, rank, basis=None, n_oversamples=10, n_power_iter=1
+):
+    """Truncated nuclear norm singular value thresholding with a randomized truncated SVD.
+
+    Only the leading singular values are computed. The rank grows until the
+    smallest computed singular value falls below the threshold tau, so the
+    result matches svt_tnn up to the accuracy of the randomized range finder.
+
+    Args:
+        mat (np.array): 2d array to threshold
+        tau (float): singular value threshold
+        theta (int): number of leading singular values left unshrunk
+        rank (int): starting rank estimate, usually the rank of the previous iteration
+        basis (np.array): left singular vectors of the previous iteration, to warm start
+        n_oversamples (int): extra random directions beyond rank
+        n_power_iter (int): power iterations to sharpen the spectrum
+
+    Returns:
+        thresholded matrix, left singular vectors kept (for warm start), rank kept
+    """
+    [m, n] = mat.shape
+    if m > n:
+        result, basis, idx = svt_tnn_randomized(
+            mat.T,
+            tau,
+            theta,
+            rank,
+            basis=basis,
+            n_oversamples=n_oversamples,
+            n_power_iter=n_power_iter,
+        )
+        return result.T, basis, idx
+    max_rank = m
+    k = min(max(rank, theta, 1) + n_oversamples, max_rank)
+    while True:
+        if k * 2 >= max_rank:
+            # randomized offers little savings for nearly full rank
+            return svt_tnn(mat, tau, theta), None, max_rank
+        if basis is not None and basis.shape[0] == m and basis.shape[1] > 0:
+            warm = basis[:, :k]
+            omega = np.random.standard_normal((n, k - warm.shape[1]))
+            Y = np.concatenate([warm, mat @ omega], axis=1)
+        else:
+            Y = mat @ np.random.standard_normal((n, k))
+        Q, _ = np.linalg.qr(Y)
+        for _ in range(n_power_iter):
+            Q, _ = np.linalg.qr(mat @ (mat.T @ Q))
+        ub, s, v = np.linalg.svd(Q.T @ mat, full_matrices=False)
+        idx = int(np.sum(s > tau))
+        if idx < k:
+            break
+        # every computed value survived the threshold, look for more
+        basis = Q @ ub
+        k = k * 2
+    u = Q @ ub[:, :idx]
+    vec = s[:idx].copy()
+    vec[theta:idx] = s[theta:idx] - tau
+    return (u * vec) @ v[:idx, :], u, idx
+
+
+def _ar_coefficients(mat_hat, Z, ind, max_lag, max_cells=10000000):
+    """Per series least squares of Z on its own lags of mat_hat, batched over series.
+
+    Returns coefficients A (n_series, n_lags) and fitted values (n_series, T - max_lag).
+    Series are processed in chunks so the stacked lag arrays stay under max_cells.
+    """
+    num_series = mat_hat.shape[0]
+    d, width = ind.shape
+    chunk = max(1, int(max_cells // max(d * width, 1)))
+    A = np.zeros((num_series, d))
+    mat0 = np.zeros((num_series, width))
+    for start in range(0, num_series, chunk):
+        end = start + chunk
+        Qm = np.swapaxes(mat_hat[start:end][:, ind], 1, 2)
+        coef = np.linalg.pinv(Qm) @ Z[start:end, max_lag:, np.newaxis]
+        A[start:end] = coef[..., 0]
+        mat0[start:end] = (Qm @ coef)[..., 0]
+    return A, mat0
+
+
 def latc_imputer(
     sparse_tensor,
     time_lags,
@@ -661,9 +776,14 @@ def latc_imputer(
     theta,
     epsilon,
     maxiter,
+    svd_method="full",
 ):
     """Low-Rank Autoregressive Tensor Completion, LATC-imputer.
     Recognizes 0 as NaN.
+
+    Args:
+        svd_method (str): 'full' for exact SVD each iteration, or 'randomized' for a
+            rank adaptive randomized truncated SVD warm started from the previous iteration
     """
     dim = np.array(sparse_tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -684,24 +804,23 @@ def latc_imputer(
     last_mat = sparse_mat.copy()
     snorm = np.linalg.norm(sparse_mat, "fro")
     rho = rho0
+    bases = [None] * len(dim)
+    ranks = [theta] * len(dim)
     while True:
         rho = min(rho * 1.05, 1e5)
         for k in range(len(dim)):
-            X[k] = mat2ten(
-                svt_tnn(
-                    ten2mat(mat2ten(Z, dim, 0) - T[k] / rho, k), alpha[k] / rho, theta
-                ),
-                dim,
-                k,
-            )
+            unfolded = ten2mat(mat2ten(Z, dim, 0) - T[k] / rho, k)
+            if svd_method == "randomized":
+                thresholded, bases[k], ranks[k] = svt_tnn_randomized(
+                    unfolded, alpha[k] / rho, theta, ranks[k], basis=bases[k]
+                )
+            else:
+                thresholded = svt_tnn(unfolded, alpha[k] / rho, theta)
+            X[k] = mat2ten(thresholded, dim, k)
         tensor_hat = np.einsum("k, kmnt -> mnt", alpha, X)
         mat_hat = ten2mat(tensor_hat, 0)
-        mat0 = np.zeros((dim[0], dim_time - max_lag))
         if lambda0 > 0:
-            for m in range(dim[0]):
-                Qm = mat_hat[m, ind].T
-                A[m, :] = np.linalg.pinv(Qm) @ Z[m, max_lag:]
-                mat0[m, :] = Qm @ A[m, :]
+            A, mat0 = _ar_coefficients(mat_hat, Z, ind, max_lag)
             mat1 = ten2mat(np.mean(rho * X + T, axis=0), 0)
             Z[pos_missing] = np.append(
                 (mat1[:, :max_lag] / rho),
@@ -742,6 +861,7 @@ def latc_predictor(
     window,
     epsilon,
     maxiter,
+    svd_method="full",
 ):
     """LATC-predictor kernel."""
     num_series = sparse_mat.shape[0]
@@ -774,6 +894,7 @@ def latc_predictor(
             theta,
             epsilon,
             maxiter,
+            svd_method=svd_method,
         )
         res = (ten2mat(tensor, 0))[:, -time_horizon:]
         sparse_mat = np.concatenate([sparse_mat, res], axis=1)
@@ -794,6 +915,7 @@ class LATC(ModelObject):
         prediction_interval (float): Confidence interval for probabilistic forecast
         regression_type (str): type of regression (None, 'User', or 'Holiday')
         n_jobs (int): passed to joblib for multiprocessing. Set to none for context manager.
+        svd_method (str): 'full' or 'randomized', the latter much faster for many series
 
     """
 
@@ -812,6 +934,7 @@ class LATC(ModelObject):
         epsilon: float = 1e-4,
         alpha: list = [0.33333333, 0.33333333, 0.33333333],
         maxiter: int = 100,
+        svd_method: str = "full",
         holiday_country: str = 'US',
         random_seed: int = 2022,
         verbose: int = 0,
@@ -828,6 +951,7 @@ class LATC(ModelObject):
             verbose=verbose,
             n_jobs=n_jobs,
         )
+        self.svd_method = svd_method
         self.time_horizon = time_horizon
         self.seasonality = seasonality
         self.time_lags = time_lags
@@ -887,6 +1011,7 @@ class LATC(ModelObject):
             window=self.window,
             epsilon=self.epsilon,
             maxiter=self.maxiter,
+            svd_method=self.svd_method,
         )
         forecast = mat_hat.T
 
@@ -951,6 +1076,7 @@ class LATC(ModelObject):
             'epsilon': 1e-4,
             'alpha': [0.33333333, 0.33333333, 0.33333333],
             'maxiter': random.choice([25, 50, 100, 150]),
+            'svd_method': random.choices(['full', 'randomized'], [0.5, 0.5])[0],
         }
 
     def get_params(self):
@@ -966,4 +1092,5 @@ class LATC(ModelObject):
             'epsilon': self.epsilon,
             'alpha': self.alpha,
             'maxiter': self.maxiter,
+            'svd_method': self.svd_method,
         }
@@ -298,6 +298,25 @@ motifs = [
     'MetricMotif',
     'SeasonalityMotif',
 ]
+# USED IN AUTO_MODEL for models which can fit float32 data, others are upcast to float64
+float32_models = [
+    'ConstantNaive',
+    'LastValueNaive',
+    'AverageValueNaive',
+    'SeasonalNaive',
+    'UnivariateMotif',
+    'MultivariateMotif',
+    'SectionalMotif',
+    'MetricMotif',
+    'SeasonalityMotif',
+]
+# USED IN AUTO_MODEL for models which use prediction_interval in .fit(), refit per interval
+interval_fit_models = [
+    'MotifSimulation',
+    'ComponentAnalysis',
+    'MultivariateRegression',
+    'Cassandra',
+]
 no_shared_fast = list(set(no_shared).intersection(set(fast_parallel)))
 model_lists = {
     "all": all_models,
@@ -8,12 +8,6 @@ import random
 import numpy as np
 import pandas as pd
 
-# because this attempts to make sklearn optional for overall usage
-try:
-    from sklearn import config_context
-    from sklearn.multioutput import MultiOutputRegressor, RegressorChain
-except Exception:
-    pass
 from autots.models.base import ModelObject, PredictionObject
 from autots.tools.probabilistic import Point_to_Probability
 from autots.tools.seasonal import date_part, seasonal_int
@@ -215,6 +209,8 @@ def retrieve_regressor(
     multioutput: bool = True,
 ):
     """Convert a model param dict to model object for regression frameworks."""
+    from sklearn.multioutput import MultiOutputRegressor, RegressorChain
+
     model_class = regression_model['model']
     model_param_dict = regression_model.get("model_params", {})
     if model_class == 'ElasticNet':
@@ -2534,6 +2530,8 @@ class MultivariateRegression(ModelObject):
             df (pandas.DataFrame): Datetime Indexed
             future_regressor (pandas.DataFrame or Series): Datetime Indexed
         """
+        from sklearn import config_context
+
         df = self.basic_profile(df)
         # assume memory and CPU count are correlated
         with config_context(assume_finite=True, working_memory=int(self.n_jobs * 512)):
@@ -12,6 +12,7 @@ that do not fall within low-density regions yet are anomalous with
 regard to local values - https://arxiv.org/pdf/1802.04431.pdf
 """
 import random
+from importlib.util import find_spec
 import numpy as np
 import pandas as pd
 from autots.tools.percentile import nan_quantile
@@ -22,36 +23,29 @@ from autots.tools.calendar import (
     gregorian_to_hebrew,
 )
 
-
-try:
-    from joblib import Parallel, delayed
-
-    joblib_present = True
-except Exception:
-    joblib_present = False
-# because this attempts to make sklearn optional for overall usage
-try:
-    from sklearn.ensemble import IsolationForest
-    from sklearn.neighbors import LocalOutlierFactor
-    from sklearn.covariance import EllipticEnvelope
-    from scipy.stats import chi2, norm, gamma, uniform
-except Exception:
-    pass
+# optional dependencies are imported where used, to keep `import autots` light
+joblib_present = find_spec("joblib") is not None
 
 
 def sk_outliers(df, method, method_params={}):
     """scikit-learn outlier methods wrapper."""
     if method == "IsolationForest":
+        from sklearn.ensemble import IsolationForest
+
         model = IsolationForest(n_jobs=1, **method_params)  # n_estimators=200
         res = model.fit_predict(df)
         scores = model.decision_function(df)
     elif method == "LOF":
+        from sklearn.neighbors import LocalOutlierFactor
+
         model = LocalOutlierFactor(n_jobs=1, **method_params)  # n_neighbors=5
         res = model.fit_predict(df)
         scores = model.negative_outlier_factor_ + 1.45
     elif method == "EE":
         if method_params['contamination'] == "auto":
             method_params['contamination'] = 0.1
+        from sklearn.covariance import EllipticEnvelope
+
         model = EllipticEnvelope(**method_params)
         res = model.fit_predict(df)
         scores = model.decision_function(df)
@@ -71,6 +65,8 @@ def loop_sk_outliers(df, method, method_params={}, n_jobs=1):
 
     # joblib multiprocessing to loop through series
     if parallel:
+        from joblib import Parallel, delayed
+
         df_list = Parallel(n_jobs=(n_jobs - 1))(
             delayed(sk_outliers)(
                 df=df.iloc[:, i : i + 1],
@@ -140,6 +136,8 @@ def zscore_survival_function(
     else:
         raise ValueError("zscore sf `output` arg not recognized")
 
+    from scipy.stats import chi2, norm, gamma, uniform
+
     # chi2, nbinom, erlang, gamma, poisson, maxwell, [laplace, cosine, norm, arcsine, uniform]
     if distribution == "norm":
         return pd.DataFrame(
@@ -321,6 +319,8 @@ def nonparametric_multivariate(df, output, method_params, n_jobs=1):
 
         # joblib multiprocessing to loop through series
         if parallel:
+            from joblib import Parallel, delayed
+
             df_list = Parallel(n_jobs=(n_jobs - 1))(
                 delayed(nonparametric)(
                     series=df.iloc[:, i],
@@ -0,0 +1,83 @@
+"""
+Shared cache of statistics derived from training data.
+"""
+import hashlib
+from collections import OrderedDict
+import numpy as np
+
+
+def data_key(arr, *extra):
+    """Digest of the values, shape and dtype of an array.
+
+    Args:
+        arr (np.array): data to identify
+        *extra: additional bytes, or objects with a stable str, to include in the digest
+    """
+    arr = np.ascontiguousarray(arr)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(str((arr.shape, arr.dtype.str)).encode())
+    hasher.update(arr.view(np.uint8))
+    for part in extra:
+        hasher.update(part if isinstance(part, bytes) else str(part).encode())
+    return hasher.digest()
+
+
+def _nbytes(value):
+    """Bytes held by the numpy arrays in a result (arrays, or tuples/lists of them)."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    elif isinstance(value, (tuple, list)):
+        return sum(_nbytes(x) for x in value)
+    return 0
+
+
+def _freeze(value):
+    """Make cached arrays read-only, as one result is shared by every caller."""
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for x in value:
+            _freeze(x)
+    return value
+
+
+class StatisticCache(object):
+    """Least recently used cache of training statistics, bounded by total array bytes.
+
+    Only derived results are stored, never the training data itself.
+    Results larger than max_bytes are computed but not stored.
+
+    Args:
+        max_bytes (int): maximum total nbytes of cached arrays
+    """
+
+    def __init__(self, max_bytes: int = 2**26):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._store = OrderedDict()
+
+    def __len__(self):
+        return len(self._store)
+
+    def get(self, key, func):
+        """Return the cached result for key, else compute func() and cache it."""
+        if key in self._store:
+            self._store.move_to_end(key)
+            return self._store[key][0]
+        result = _freeze(func())
+        size = _nbytes(result)
+        if size <= self.max_bytes:
+            self._store[key] = (result, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= self._store.popitem(last=False)[1][1]
+        return result
+
+    def clear(self):
+        """Drop all cached results."""
+        self._store.clear()
+        self.nbytes = 0
+
+
+# shared by models and probabilistic intervals evaluated on the same data, cleared after AutoTS.fit
+train_stat_cache = StatisticCache()
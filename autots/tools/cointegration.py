@@ -9,7 +9,6 @@ https://towardsdatascience.com/canonical-decomposition-a-forgotten-method-for-ti
 import datetime
 import numpy as np
 import pandas as pd
-from scipy.linalg import fractional_matrix_power
 
 # np.allclose(np.matmul(trans.components_, (df.values - trans.mean_).T).T, trans.transform(df))
 # np.allclose(np.matmul((df.values - trans.mean_), (trans.components_.T)), trans.transform(df))
@@ -160,6 +159,8 @@ def _get_expected_dyadic_prod(V):
 
 def _get_b_sqrt_inv(p_mat):
     """Rows of p_mat represent t index, columns represent each path."""
+    from scipy.linalg import fractional_matrix_power
+
     B = _get_expected_dyadic_prod(p_mat)
     B_sqrt = fractional_matrix_power(B, 0.5)
     return np.linalg.pinv(B_sqrt)
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from autots.models.base import interval_quantiles
 
 
 class hierarchial(object):
@@ -131,6 +132,271 @@ class hierarchial(object):
             return df
 
 
+def summing_matrix(hierarchy, include_total: bool = True):
+    """Build a sparse summing matrix from a multi-level hierarchy.
+
+    Args:
+        hierarchy (pd.DataFrame): index of bottom level series ids, one column per
+            aggregation level holding the group each bottom series belongs to.
+            A dict of {level: {series_id: group}} or a one-level {series_id: group} is also accepted.
+        include_total (bool): add a single 'total' node summing all bottom series
+
+    Returns:
+        scipy.sparse.csr_matrix S of shape (n_aggregate + n_bottom, n_bottom),
+        list of aggregate node ids, list of bottom series ids
+    """
+    from scipy import sparse
+
+    hierarchy = _hierarchy_frame(hierarchy)
+    bottom_ids = hierarchy.index.tolist()
+    n_bottom = len(bottom_ids)
+    bottom_pos = np.arange(n_bottom)
+    rows, cols, agg_ids = [], [], []
+    if include_total:
+        rows.append(np.zeros(n_bottom, dtype=int))
+        cols.append(bottom_pos)
+        agg_ids.append("total")
+    for level in hierarchy.columns:
+        codes, uniques = pd.factorize(hierarchy[level], sort=True)
+        valid = codes >= 0
+        rows.append(codes[valid] + len(agg_ids))
+        cols.append(bottom_pos[valid])
+        agg_ids.extend([f"{level}_{x}" for x in uniques])
+    overlap = set(agg_ids).intersection(bottom_ids)
+    if overlap:
+        raise ValueError(f"aggregate node ids collide with series ids: {overlap}")
+    n_agg = len(agg_ids)
+    agg = sparse.csr_matrix(
+        (
+            np.ones(sum(len(x) for x in rows)),
+            (np.concatenate(rows), np.concatenate(cols)),
+        ),
+        shape=(n_agg, n_bottom),
+    )
+    S = sparse.vstack([agg, sparse.identity(n_bottom, format="csr")], format="csr")
+    return S, agg_ids, bottom_ids
+
+
+def _hierarchy_frame(hierarchy):
+    """Coerce accepted hierarchy specifications to a DataFrame."""
+    if isinstance(hierarchy, pd.DataFrame):
+        return hierarchy
+    elif isinstance(hierarchy, pd.Series):
+        return hierarchy.to_frame()
+    elif isinstance(hierarchy, dict):
+        if all(isinstance(x, dict) for x in hierarchy.values()):
+            return pd.DataFrame(hierarchy)
+        return pd.DataFrame({"group": hierarchy})
+    else:
+        raise ValueError("hierarchy must be a pandas DataFrame or dict")
+
+
+class HierarchicalReconciler(object):
+    """Multi-level hierarchy construction and forecast reconciliation on a sparse summing matrix.
+
+    Aggregate series are created with .transform(), forecast alongside the bottom
+    series, and then made coherent with .reconcile() or .reconcile_prediction().
+
+    bottom_up, top_down, ols, and wls methods only use sparse operations, with the
+    inner solve sized by the number of aggregate nodes, so they scale to very many bottom series.
+    mint_shrink uses a dense covariance of all nodes and is only suitable for moderate hierarchies.
+
+    Args:
+        hierarchy (pd.DataFrame): index of bottom series ids, one column per level, see summing_matrix
+        method (str): 'bottom_up', 'top_down', 'ols', 'wls_struct', 'wls_var', or 'mint_shrink'
+        include_total (bool): add a single 'total' node, required for 'top_down'
+        return_all (bool): if True, reconcile returns all nodes, otherwise only bottom series
+    """
+
+    methods = ["bottom_up", "top_down", "ols", "wls_struct", "wls_var", "mint_shrink"]
+
+    def __init__(
+        self,
+        hierarchy,
+        method: str = "wls_struct",
+        include_total: bool = True,
+        return_all: bool = True,
+    ):
+        if method not in self.methods:
+            raise ValueError(f"method `{method}` not recognized, use one of {self.methods}")
+        if method == "top_down" and not include_total:
+            raise ValueError("top_down reconciliation requires include_total=True")
+        self.hierarchy = _hierarchy_frame(hierarchy)
+        self.method = method
+        self.include_total = include_total
+        self.return_all = return_all
+
+    def fit(self, df):
+        """Build the summing matrix and learn weights from history.
+
+        Args:
+            df (pd.DataFrame): wide history containing at least the bottom series
+        """
+        self.S, self.agg_ids, self.bottom_ids = summing_matrix(
+            self.hierarchy, include_total=self.include_total
+        )
+        self.node_ids = self.agg_ids + self.bottom_ids
+        self.n_agg = len(self.agg_ids)
+        missing = set(self.bottom_ids) - set(df.columns)
+        if missing:
+            raise ValueError(f"bottom series missing from df: {list(missing)[:10]}")
+        all_nodes = self.transform(df[self.bottom_ids])
+        if self.method == "top_down":
+            # historical average proportions of each bottom series in the total
+            totals = all_nodes["total"].sum()
+            self.proportions = all_nodes[self.bottom_ids].sum().to_numpy() / (
+                totals if totals != 0 else 1
+            )
+        elif self.method == "ols":
+            self.weights = np.ones(len(self.node_ids))
+        elif self.method == "wls_struct":
+            # number of bottom series in each node
+            self.weights = np.asarray(self.S.sum(axis=1)).ravel()
+        else:
+            # one step naive in sample errors as a residual proxy
+            resid = all_nodes.diff().iloc[1:].fillna(0).to_numpy()
+            if self.method == "wls_var":
+                var = np.mean(resid**2, axis=0)
+                self.weights = np.where(var > 0, var, 1.0)
+            else:
+                self.covariance = self._shrink_covariance(resid)
+        return self
+
+    @staticmethod
+    def _shrink_covariance(resid):
+        """Covariance shrunk toward its diagonal, per Schafer and Strimmer."""
+        n = resid.shape[0]
+        resid = resid - resid.mean(axis=0)
+        cov = resid.T @ resid / n
+        std = np.sqrt(np.diag(cov))
+        std = np.where(std > 0, std, 1.0)
+        xs = resid / std
+        corr = xs.T @ xs / n
+        corr_var = ((xs**2).T @ (xs**2) / n - corr**2) * n / (n - 1) ** 2
+        np.fill_diagonal(corr_var, 0)
+        off_diag = corr.copy()
+        np.fill_diagonal(off_diag, 0)
+        denom = np.sum(off_diag**2)
+        lam = np.clip(np.sum(corr_var) / denom, 0, 1) if denom > 0 else 1.0
+        shrunk = (1 - lam) * cov
+        shrunk[np.diag_indices_from(shrunk)] = np.diag(cov)
+        shrunk[np.diag_indices_from(shrunk)] += np.where(np.diag(cov) > 0, 0, 1.0)
+        return shrunk
+
+    def transform(self, df):
+        """Return the bottom series with all aggregate nodes added as columns."""
+        bottom = df[self.bottom_ids]
+        agg = self.S[: self.n_agg] @ bottom.fillna(0).to_numpy().T
+        agg = pd.DataFrame(
+            np.asarray(agg).T, index=df.index, columns=self.agg_ids
+        )
+        return pd.concat([agg, bottom], axis=1)
+
+    def _bottom(self, y):
+        """Reconciled bottom level values from base forecasts y of shape (n_nodes, h)."""
+        from scipy import sparse
+
+        S = self.S
+        if self.method == "bottom_up":
+            return y[self.n_agg :]
+        elif self.method == "top_down":
+            return self.proportions[:, np.newaxis] * y[0]
+        elif self.method == "mint_shrink":
+            S_dense = S.toarray()
+            winv_s = np.linalg.solve(self.covariance, S_dense)
+            return np.linalg.solve(S_dense.T @ winv_s, winv_s.T @ y)
+        # generalized least squares with diagonal W, (S'W^-1S)^-1 S'W^-1 y
+        # S'W^-1S = D + C' L C, solved with the Woodbury identity so only a
+        # sparse (n_agg, n_agg) system is factorized
+        from scipy.sparse.linalg import splu
+
+        lam = 1.0 / self.weights
+        lam_agg, lam_bottom = lam[: self.n_agg], lam[self.n_agg :]
+        C = S[: self.n_agg]
+        g = C.T @ (lam_agg[:, np.newaxis] * y[: self.n_agg]) + (
+            lam_bottom[:, np.newaxis] * y[self.n_agg :]
+        )
+        d_inv = 1.0 / lam_bottom
+        d_inv_g = d_inv[:, np.newaxis] * g
+        if self.n_agg == 0:
+            return d_inv_g
+        inner = sparse.diags(1.0 / lam_agg) + C @ sparse.diags(d_inv) @ C.T
+        correction = splu(sparse.csc_matrix(inner)).solve(
+            np.asarray(C @ d_inv_g)
+        )
+        return d_inv_g - d_inv[:, np.newaxis] * (C.T @ correction)
+
+    def reconcile(self, df):
+        """Make forecasts containing all nodes (as from .transform()) coherent.
+
+        Args:
+            df (pd.DataFrame): forecasts with a column for every node
+
+        Returns:
+            pd.DataFrame of all nodes, or only bottom series if return_all is False
+        """
+        y = df[self.node_ids].to_numpy().T
+        bottom = self._bottom(y)
+        if self.return_all:
+            return pd.DataFrame(
+                np.asarray(self.S @ bottom).T, index=df.index, columns=self.node_ids
+            )
+        return pd.DataFrame(bottom.T, index=df.index, columns=self.bottom_ids)
+
+    def reconcile_prediction(self, prediction):
+        """Reconcile the point, interval and quantile forecasts of a PredictionObject in place.
+
+        Bounds and quantiles pass through the same linear reconciliation as the point
+        forecast. They are then ordered per bottom series, so that lower <= forecast <= upper
+        and quantiles increase with q, and aggregates are summed from the ordered bottom
+        series, so every level stays coherent.
+        """
+        index = prediction.forecast.index
+        columns = prediction.forecast.columns
+
+        def bottom(values):
+            df = pd.DataFrame(np.asarray(values), index=index, columns=columns)
+            return np.asarray(self._bottom(df[self.node_ids].to_numpy().T))
+
+        def frame(bottom_values):
+            if self.return_all:
+                return pd.DataFrame(
+                    np.asarray(self.S @ bottom_values).T,
+                    index=index,
+                    columns=self.node_ids,
+                )
+            return pd.DataFrame(bottom_values.T, index=index, columns=self.bottom_ids)
+
+        point = bottom(prediction.forecast)
+        upper = bottom(prediction.upper_forecast)
+        lower = bottom(prediction.lower_forecast)
+        prediction.forecast = frame(point)
+        prediction.upper_forecast = frame(np.maximum(np.maximum(upper, lower), point))
+        prediction.lower_forecast = frame(np.minimum(np.minimum(upper, lower), point))
+        prediction.forecast_columns = prediction.forecast.columns
+        if getattr(prediction, "quantile_forecast", None) is not None:
+            quantiles = np.asarray(prediction.quantiles)
+            levels = np.sort(
+                np.stack([bottom(x) for x in prediction.quantile_forecast]), axis=0
+            )
+            below = quantiles < 0.5
+            above = quantiles > 0.5
+            levels[below] = np.minimum(levels[below], point)
+            levels[above] = np.maximum(levels[above], point)
+            levels[np.isclose(quantiles, 0.5)] = point
+            # a new array, as the predictions of several intervals may share the original
+            prediction.quantile_forecast = np.stack(
+                [frame(x).to_numpy() for x in levels]
+            )
+            # bounds of the prediction's own interval stay consistent with its quantiles
+            lower_q, upper_q = interval_quantiles(prediction.prediction_interval)
+            available = [np.isclose(quantiles, q).any() for q in [lower_q, upper_q]]
+            if all(available):
+                prediction.lower_forecast = prediction.quantile(lower_q)
+                prediction.upper_forecast = prediction.quantile(upper_q)
+        return prediction
+
+
 """
 grouping_ids = {
     'CSUSHPISA': 'A',
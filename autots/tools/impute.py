@@ -2,18 +2,6 @@
 import numpy as np
 import pandas as pd
 
-try:
-    from sklearn.impute import KNNImputer
-
-    try:
-        from sklearn.experimental import enable_iterative_imputer  # noqa
-    except Exception:
-        pass
-    from sklearn.ensemble import ExtraTreesRegressor
-    from sklearn.impute import IterativeImputer
-except Exception:
-    pass
-
 
 def fill_zero(df):
     """Fill NaN with zero."""
@@ -245,6 +233,9 @@ def FillNA(df, method: str = 'ffill', window: int = 10):
         return df
 
     elif method == 'IterativeImputer':
+        from sklearn.experimental import enable_iterative_imputer  # noqa
+        from sklearn.impute import IterativeImputer
+
         cols = df.columns
         indx = df.index
 
@@ -256,6 +247,10 @@ def FillNA(df, method: str = 'ffill', window: int = 10):
         return df
 
     elif method == 'IterativeImputerExtraTrees':
+        from sklearn.experimental import enable_iterative_imputer  # noqa
+        from sklearn.ensemble import ExtraTreesRegressor
+        from sklearn.impute import IterativeImputer
+
         cols = df.columns
         indx = df.index
 
@@ -271,6 +266,8 @@ def FillNA(df, method: str = 'ffill', window: int = 10):
         return df
 
     elif method == 'KNNImputer':
+        from sklearn.impute import KNNImputer
+
         cols = df.columns
         indx = df.index
 
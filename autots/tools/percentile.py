@@ -1,112 +1,120 @@
 # -*- coding: utf-8 -*-
 """Faster percentile and quantile for numpy
 
-Entirely from: https://krstn.eu/np.nanpercentile()-there-has-to-be-a-faster-way/
+Originally from: https://krstn.eu/np.nanpercentile()-there-has-to-be-a-faster-way/
 """
 import numpy as np
 
 
-def _zvalue_from_index(arr, ind):
-    """private helper function to work around the limitation of np.choose() by employing np.take()
-    arr has to be a 3D array
-    ind has to be a 2D array containing values for z-indicies to take from arr
-    See: http://stackoverflow.com/a/32091712/4169585
-    This is faster and more memory efficient than using the ogrid based solution with fancy indexing.
-    """
-    # get number of columns and rows
-    _, nC, nR = arr.shape
+def _quantile_positions(valid_obs, quant, method):
+    """Floor and ceiling sort positions, and weight of the ceiling, for one percentile."""
+    k_arr = (valid_obs - 1) * (quant / 100.0)
+    if method == "linear":
+        f_arr = np.floor(k_arr)
+        c_arr = np.ceil(k_arr)
+        return f_arr.astype(np.intp), c_arr.astype(np.intp), k_arr - f_arr
+    elif method == "nearest":
+        f_arr = np.around(k_arr)
+    elif method in ["lowest", "lower"]:
+        f_arr = np.floor(k_arr)
+    elif method in ["highest", "higher"]:
+        f_arr = np.ceil(k_arr)
+    elif method == "midpoint":
+        f_arr = np.floor(k_arr)
+        c_arr = np.ceil(k_arr)
+        return f_arr.astype(np.intp), c_arr.astype(np.intp), (c_arr - f_arr) * 0.5
+    else:
+        raise ValueError("interpolation method not supported")
+    f_arr = f_arr.astype(np.intp)
+    return f_arr, f_arr, np.zeros_like(k_arr, dtype=float)
 
-    # get linear indices and extract elements with np.take()
-    idx = nC * nR * ind + np.arange(nC * nR).reshape((nC, nR))
-    return np.take(arr, idx)
+
+def _sorted_quantiles(arr, qs, method, valid_obs=None):
+    """Quantiles along axis 0 of a 2D array, sorted or partitioned at the needed positions only."""
+    n = arr.shape[0]
+    if valid_obs is None:
+        # no NaN, same positions for every column so only partition at those
+        positions = [_quantile_positions(n, q, method) for q in qs]
+        kth = np.unique(np.concatenate([[f, c] for f, c, _ in positions]))
+        arr = np.partition(arr, kth, axis=0)
+        return np.stack(
+            [arr[f] * (1 - w) + arr[c] * w if w else arr[f] for f, c, w in positions]
+        )
+    # NaN sorted to the end, then positions differ by column
+    arr = np.sort(np.where(np.isnan(arr), np.inf, arr), axis=0)
+    result = []
+    for q in qs:
+        f_arr, c_arr, w = _quantile_positions(valid_obs, q, method)
+        f_arr = np.clip(f_arr, 0, n - 1)[np.newaxis]
+        c_arr = np.clip(c_arr, 0, n - 1)[np.newaxis]
+        low = np.take_along_axis(arr, f_arr, axis=0)[0]
+        high = np.take_along_axis(arr, c_arr, axis=0)[0]
+        with np.errstate(invalid="ignore"):
+            quant = np.where(w == 0, low, low * (1 - w) + high * w)
+        quant[valid_obs == 0] = np.nan
+        result.append(quant)
+    return np.stack(result)
 
 
 def nan_percentile(in_arr, q, method="linear", axis=0, errors="raise"):
-    """Given a 3D array, return the given percentiles as input by q.
-    Beware this is only tested for the limited case required here, and will not match np fully.
-    Args more limited. If errors="rollover" passes to np.nanpercentile where args are not supported.
+    """Given an array, return the given percentiles as input by q, ignoring NaN.
+
+    np.partition is used on the requested percentile positions only where there are no NaN,
+    and the input array is never modified. Matches np.nanpercentile for supported methods.
+
+    Args:
+        in_arr (np.array): array of any dimension
+        q (float): percentile in [0, 100], or a list/range/array of percentiles
+        method (str): 'linear', 'nearest', 'lowest'/'lower', 'highest'/'higher', 'midpoint'
+        axis (int): axis along which percentiles are computed
+        errors (str): if "rollover" passes to np.nanpercentile where args are not supported
+
+    Returns:
+        np.array with axis removed, with an additional first dimension of len(q) if more than one q
     """
-    flag_2d = False
-    if in_arr.ndim == 2:
-        arr = np.expand_dims(in_arr, 1)
-        flag_2d = True
-    else:
-        arr = in_arr.copy()
-    if (
-        axis != 0
-        or method not in ["linear", "nearest", "lowest", "highest"]
-        or arr.ndim != 3
-    ):
+    supported = ["linear", "nearest", "lowest", "lower", "highest", "higher", "midpoint"]
+    if method not in supported or axis is None:
         if errors == "rollover":
-            return np.nanpercentile(arr, q=q, method=method, axis=axis)
+            return np.nanpercentile(in_arr, q=q, method=method, axis=axis)
         else:
             raise ValueError("input not supported by internal percentile function")
-    # valid (non NaN) observations along the first axis
-    valid_obs = np.sum(np.isfinite(arr), axis=0)
-    # replace NaN with maximum
-    max_val = np.nanmax(arr)
-    arr[np.isnan(arr)] = max_val
-    # sort - former NaNs will move to the end
-    arr = np.sort(arr, axis=0)
+    arr = np.asarray(in_arr)
+    if not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(float)
+    qs = np.atleast_1d(np.asarray(q, dtype=float)).ravel()
+    # move the reduced axis first and flatten the rest
+    arr = np.moveaxis(arr, axis, 0)
+    out_shape = arr.shape[1:]
+    arr = arr.reshape(arr.shape[0], -1)
 
-    # loop over requested quantiles
-    if type(q) is list:
-        qs = []
-        qs.extend(q)
-    elif type(q) is range:
-        qs = list(q)
-    else:
-        qs = [q]
-    if len(qs) < 2:
-        quant_arr = np.zeros(shape=(arr.shape[1], arr.shape[2]))
+    nan_mask = np.isnan(arr)
+    nan_cols = nan_mask.any(axis=0)
+    if not nan_cols.any():
+        result = _sorted_quantiles(arr, qs, method)
+    elif nan_cols.all():
+        result = _sorted_quantiles(
+            arr, qs, method, valid_obs=arr.shape[0] - nan_mask.sum(axis=0)
+        )
     else:
-        quant_arr = np.zeros(shape=(len(qs), arr.shape[1], arr.shape[2]))
-
-    result = []
-    # note this is vectorized for a single quantile but each quantile step is separate
-    for i in range(len(qs)):
-        quant = qs[i]
-        # desired position as well as floor and ceiling of it
-        k_arr = (valid_obs - 1) * (quant / 100.0)
-        f_arr = np.floor(k_arr).astype(np.int32)
-        c_arr = np.ceil(k_arr).astype(np.int32)
-        fc_equal_k_mask = f_arr == c_arr
-
-        if method == "linear":
-            # linear interpolation (like numpy percentile) takes the fractional part of desired position
-            floor_val = _zvalue_from_index(arr=arr, ind=f_arr) * (c_arr - k_arr)
-            ceil_val = _zvalue_from_index(arr=arr, ind=c_arr) * (k_arr - f_arr)
-
-            quant_arr = floor_val + ceil_val
-            quant_arr[fc_equal_k_mask] = _zvalue_from_index(
-                arr=arr, ind=k_arr.astype(np.int32)
-            )[
-                fc_equal_k_mask
-            ]  # if floor == ceiling take floor value
-        elif method == 'nearest':
-            f_arr = np.around(k_arr).astype(np.int32)
-            quant_arr = _zvalue_from_index(arr=arr, ind=f_arr)
-        elif method == 'lowest':
-            f_arr = np.floor(k_arr).astype(np.int32)
-            quant_arr = _zvalue_from_index(arr=arr, ind=f_arr)
-        elif method == 'highest':
-            f_arr = np.ceiling(k_arr).astype(np.int32)
-            quant_arr = _zvalue_from_index(arr=arr, ind=f_arr)
-        else:
-            raise ValueError("interpolation method not supported")
-
-        if flag_2d:
-            result.append(quant_arr[0])
-        else:
-            result.append(quant_arr)
-    if len(result) == 1:
+        # only columns containing NaN require a full sort
+        result = np.empty((len(qs), arr.shape[1]))
+        result[:, ~nan_cols] = _sorted_quantiles(arr[:, ~nan_cols], qs, method)
+        result[:, nan_cols] = _sorted_quantiles(
+            arr[:, nan_cols],
+            qs,
+            method,
+            valid_obs=arr.shape[0] - nan_mask[:, nan_cols].sum(axis=0),
+        )
+    result = result.reshape((len(qs),) + out_shape)
+    if len(qs) == 1:
         return result[0]
-    else:
-        return np.asarray(result)
+    return result
 
 
 def nan_quantile(arr, q, method="linear", axis=0, errors="raise"):
     """Same as nan_percentile but accepts q in range [0, 1].
     Args more limited. If errors="rollover" passes to np.nanpercentile where not supported.
     """
-    return nan_percentile(arr, q * 100, method=method, axis=axis, errors=errors)
+    return nan_percentile(
+        arr, np.asarray(q, dtype=float) * 100, method=method, axis=axis, errors=errors
+    )
@@ -5,17 +5,54 @@ import pandas as pd
 import numpy as np
 from autots.tools.impute import fake_date_fill
 from autots.tools.percentile import nan_quantile
+from autots.tools.cache import train_stat_cache, data_key
 
-try:
-    from scipy.stats import percentileofscore
-except Exception:
-    pass
+
+def _cached_train_stat(name, train, func, *args):
+    """Return func(train, *args), reusing the result if train has identical values."""
+    arr = np.ascontiguousarray(train)
+    return train_stat_cache.get((name, data_key(arr)) + args, lambda: func(arr, *args))
 
 
 def percentileofscore_appliable(x, a, kind='rank'):
+    from scipy.stats import percentileofscore
+
     return percentileofscore(a, score=x, kind=kind)
 
 
+def percentileofscore_array(a, scores, max_cells: int = 10000000):
+    """Vectorized scipy percentileofscore(kind='rank') for each column.
+
+    Args:
+        a (np.array): 2d distribution of shape (n_obs, n_series), NaN are ignored
+        scores (np.array): 2d scores of shape (n_scores, n_series)
+        max_cells (int): maximum size of the intermediate comparison, series are processed in blocks to stay under this
+
+    Returns:
+        np.array of percentiles in shape of scores, NaN where score is NaN or no valid distribution
+    """
+    a = np.asarray(a, dtype=float)
+    scores = np.asarray(scores, dtype=float)
+    n_valid = np.sum(~np.isnan(a), axis=0)
+    result = np.empty(scores.shape)
+    chunk = max(1, int(max_cells // max(a.shape[0] * scores.shape[0], 1)))
+    for i in range(0, a.shape[1], chunk):
+        dist = a[:, np.newaxis, i : i + chunk]
+        score = scores[np.newaxis, :, i : i + chunk]
+        left = np.sum(dist < score, axis=0)
+        right = np.sum(dist <= score, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[:, i : i + chunk] = (left + right + (right > left)) * (
+                50.0 / n_valid[i : i + chunk]
+            )
+    result[np.isnan(scores) | (n_valid == 0)] = np.nan
+    return result
+
+
+def _historic_bins(arr, quantiles):
+    return nan_quantile(arr.astype(float), list(quantiles), axis=0)
+
+
 def historic_quantile(df_train, prediction_interval: float = 0.9, nan_flag=None):
     """
     Computes the difference between the median and the prediction interval range in historic data.
@@ -23,21 +60,13 @@ def historic_quantile(df_train, prediction_interval: float = 0.9, nan_flag=None)
     Args:
         df_train (pd.DataFrame): a dataframe of training data
         prediction_interval (float): the desired forecast interval range
+        nan_flag (bool): no longer used, NaN are always handled
 
     Returns:
         lower, upper (np.array): two 1D arrays
     """
-    quantiles = [0, 1 - prediction_interval, 0.5, prediction_interval, 1]
-    # save compute time by using the non-nan verison if possible
-    if not isinstance(nan_flag, bool):
-        if isinstance(df_train, pd.DataFrame):
-            nan_flag = np.isnan(np.min(df_train.to_numpy()))
-        else:
-            nan_flag = np.isnan(np.min(np.array(df_train)))
-    if nan_flag:
-        bins = nan_quantile(df_train.astype(float), quantiles, axis=0)
-    else:
-        bins = np.quantile(df_train.astype(float), quantiles, axis=0, keepdims=False)
+    quantiles = (0, 1 - prediction_interval, 0.5, prediction_interval, 1)
+    bins = _cached_train_stat("historic_quantile", df_train, _historic_bins, quantiles)
     upper = bins[3] - bins[2]
     if 0 in upper:
         np.where(upper != 0, upper, (bins[4] - bins[2]) / 4)
@@ -47,35 +76,30 @@ def historic_quantile(df_train, prediction_interval: float = 0.9, nan_flag=None)
     return lower, upper
 
 
+def _mean_std(arr):
+    arr = arr.astype(float)
+    return np.nanmean(arr, axis=0), np.nanstd(arr, axis=0, ddof=1)
+
+
 def inferred_normal(train, forecast, n: int = 5, prediction_interval: float = 0.9):
     """A corruption of Bayes theorem.
     It will be sensitive to the transformations of the data."""
-    prior_mu = train.mean().values
-    prior_sigma = train.std().values
-    idx = forecast.index
-    columns = forecast.columns
+    prior_mu, prior_sigma = _cached_train_stat("inferred_normal", train, _mean_std)
     from scipy.stats import norm
 
     p_int = 1 - ((1 - prediction_interval) / 2)
     adj = norm.ppf(p_int)
-    upper_forecast, lower_forecast = [], []
-
-    for row in forecast.values:
-        data_mu = row
-        reshape_row = data_mu.reshape(1, -1)
+    data_mu = forecast.to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
         post_mu = (
             (prior_mu / prior_sigma**2) + ((n * data_mu) / prior_sigma**2)
         ) / ((1 / prior_sigma**2) + (n / prior_sigma**2))
-        lower = pd.DataFrame(post_mu - adj * prior_sigma, index=columns).transpose()
-        lower = lower.where(lower <= data_mu, reshape_row, axis=1)
-        upper = pd.DataFrame(post_mu + adj * prior_sigma, index=columns).transpose()
-        upper = upper.where(upper >= data_mu, reshape_row, axis=1)
-        lower_forecast.append(lower)
-        upper_forecast.append(upper)
-    lower_forecast = pd.concat(lower_forecast, axis=0)
-    upper_forecast = pd.concat(upper_forecast, axis=0)
-    lower_forecast.index = idx
-    upper_forecast.index = idx
+    lower = post_mu - adj * prior_sigma
+    lower = np.where(lower <= data_mu, lower, data_mu)
+    upper = post_mu + adj * prior_sigma
+    upper = np.where(upper >= data_mu, upper, data_mu)
+    upper_forecast = pd.DataFrame(upper, index=forecast.index, columns=forecast.columns)
+    lower_forecast = pd.DataFrame(lower, index=forecast.index, columns=forecast.columns)
     return upper_forecast, lower_forecast
 
 
@@ -86,6 +110,13 @@ post_sigma = sqrt(1/((1/prior_sigma ** 2) + (n/data_sigma ** 2)))
 """
 
 
+def _train_pct_change(arr):
+    train = pd.DataFrame(arr).replace(0, np.nan)
+    train = fake_date_fill(train, back_method='keepna')
+    percent_changes = train.pct_change()
+    return percent_changes.to_numpy(), percent_changes.median().to_numpy()
+
+
 def Variable_Point_to_Probability(train, forecast, alpha=0.3, beta=1):
     """Data driven placeholder for model error estimation.
 
@@ -117,13 +148,10 @@ def Variable_Point_to_Probability(train, forecast, alpha=0.3, beta=1):
     if aligned_length != intial_length:
         print("Forecast columns do not match train, some series may be lost")
 
-    train = train.replace(0, np.nan)
-
-    train = fake_date_fill(train, back_method='keepNA')
-
-    percent_changes = train.pct_change()
-
-    median_change = percent_changes.median()
+    percent_changes, median_change = _cached_train_stat(
+        "variable_pct_change", train, _train_pct_change
+    )
+    median_change = pd.Series(median_change, index=column_order)
     # median_change = (1  + median_change)
     # median_change[median_change <= 0 ] = 0.01  # HANDLE GOING BELOW ZERO
 
@@ -133,22 +161,14 @@ def Variable_Point_to_Probability(train, forecast, alpha=0.3, beta=1):
 
     forecast_percent_changes = forecast.replace(0, np.nan).pct_change()
 
-    quantile_differences = pd.DataFrame()
-    for column in forecast.columns:
-        percentile_distribution = percent_changes[column].dropna()
-
-        quantile_difference = abs(
-            (
-                50
-                - forecast_percent_changes[column].apply(
-                    percentileofscore_appliable, a=percentile_distribution, kind='rank'
-                )
-            )
+    quantile_differences = pd.DataFrame(
+        abs(
+            (50 - percentileofscore_array(percent_changes, forecast_percent_changes))
             / 100
-        )
-        quantile_differences = pd.concat(
-            [quantile_differences, quantile_difference], axis=1
-        )
+        ),
+        index=forecast.index,
+        columns=forecast.columns,
+    )
 
     En = quantile_differences * diffs
     Enneg1 = En.cumsum().shift(1).fillna(0)
@@ -199,3 +219,33 @@ def Point_to_Probability(
         upper_forecast = forecast + errorranges
         lower_forecast = forecast - errorranges
         return upper_forecast, lower_forecast
+
+
+def point_to_quantiles(
+    train, forecast, quantiles, method: str = 'historic_quantile'
+):
+    """Point_to_Probability for many quantiles at once, sharing training statistics.
+
+    Quantile q is the upper (q > 0.5) or lower (q < 0.5) bound of Point_to_Probability
+    at prediction_interval = abs(2 * q - 1), matching PredictionObject.quantile_forecast.
+
+    Args:
+        train (pandas.DataFrame): DataFrame of time series where index is DatetimeIndex
+        forecast (pandas.DataFrame): DataFrame of forecast time series
+        quantiles (list): quantile levels in (0, 1), 0.5 returns the forecast
+        method (str): as for Point_to_Probability
+
+    Returns:
+        np.array of shape (len(quantiles), forecast_length, num_series)
+    """
+    result = []
+    for q in quantiles:
+        interval = round(abs(2 * q - 1), 10)
+        if interval == 0:
+            result.append(forecast.to_numpy(dtype=float))
+            continue
+        upper, lower = Point_to_Probability(
+            train, forecast, prediction_interval=interval, method=method
+        )
+        result.append((upper if q > 0.5 else lower).to_numpy(dtype=float))
+    return np.stack(result)
@@ -390,3 +390,100 @@ def seasonal_window_match(
     if k > min_k:
         test = np.where(test >= len(DTindex), -1, test)
     return test, scores
+
+
+def _seasonal_decompose_array(x, period):
+    """Additive moving average decomposition of each column, as statsmodels seasonal_decompose."""
+    from statsmodels.tsa.filters.filtertools import convolution_filter
+
+    nobs = x.shape[0]
+    if period % 2 == 0:  # split weights at ends
+        filt = np.array([0.5] + [1] * (period - 1) + [0.5]) / period
+    else:
+        filt = np.repeat(1.0 / period, period)
+    trend = np.asarray(convolution_filter(x, filt, 2))
+    detrended = x - trend
+    # average of each position in the cycle, ignoring NaN ends of the trend
+    cycles = int(np.ceil(nobs / period))
+    padded = np.full((cycles * period, x.shape[1]), np.nan)
+    padded[:nobs] = detrended
+    period_averages = np.nanmean(padded.reshape(cycles, period, x.shape[1]), axis=0)
+    period_averages -= np.mean(period_averages, axis=0)
+    seasonal = np.tile(period_averages, (cycles, 1))[:nobs]
+    return trend, seasonal, detrended - seasonal
+
+
+def _stl_array(x, index, seasonal):
+    """STL decomposition of each column of an array."""
+    from statsmodels.tsa.seasonal import STL
+
+    parts = [np.empty_like(x), np.empty_like(x), np.empty_like(x)]
+    for i in range(x.shape[1]):
+        result = STL(pd.Series(x[:, i], index=index), seasonal=seasonal).fit()
+        parts[0][:, i] = result.trend
+        parts[1][:, i] = result.seasonal
+        parts[2][:, i] = result.resid
+    return parts
+
+
+def batch_decompose(
+    df,
+    decomp_type: str = "seasonal_decompose",
+    seasonal: int = 7,
+    period: int = None,
+    n_jobs: int = 1,
+    max_cells: int = 10000000,
+):
+    """Seasonal decomposition of all series of a DataFrame at once.
+
+    seasonal_decompose is computed as arrays across all columns, in chunks of columns of at most max_cells values.
+    STL is exact statsmodels STL per series, spread across n_jobs processes if more than 1.
+
+    Args:
+        df (pd.DataFrame): wide df with series as columns and DatetimeIndex, without NaN
+        decomp_type (str): 'STL' or 'seasonal_decompose'
+        seasonal (int): length of the seasonal smoother of STL
+        period (int): seasonal period for seasonal_decompose, if None inferred from the index frequency
+        n_jobs (int): processes for STL
+        max_cells (int): maximum values per chunk of columns for seasonal_decompose
+
+    Returns:
+        dict of 'trend', 'seasonal', and 'resid' DataFrames
+    """
+    x = df.to_numpy(dtype=float)
+    if not np.all(np.isfinite(x)):
+        raise ValueError("batch_decompose does not handle missing values")
+    if str(decomp_type).lower() == "stl":
+        if n_jobs not in [0, 1, None] and x.shape[1] > 1:
+            from joblib import Parallel, delayed
+
+            chunks = np.array_split(np.arange(x.shape[1]), min(x.shape[1], 100))
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(_stl_array)(x[:, chunk], df.index, seasonal)
+                for chunk in chunks
+            )
+            parts = [np.concatenate([r[i] for r in results], axis=1) for i in range(3)]
+        else:
+            parts = _stl_array(x, df.index, seasonal)
+    else:
+        if period is None:
+            from statsmodels.tsa.tsatools import freq_to_period
+
+            freq = getattr(df.index, "inferred_freq", None)
+            if freq is None:
+                raise ValueError("period must be given if index has no frequency")
+            period = freq_to_period(freq)
+        if x.shape[0] < 2 * period:
+            raise ValueError(
+                f"x must have 2 complete cycles requires {2 * period} observations"
+            )
+        step = max(int(max_cells // x.shape[0]), 1)
+        parts = [np.empty_like(x), np.empty_like(x), np.empty_like(x)]
+        for start in range(0, x.shape[1], step):
+            result = _seasonal_decompose_array(x[:, start : start + step], period)
+            for part, chunk in zip(parts, result):
+                part[:, start : start + step] = chunk
+    return {
+        name: pd.DataFrame(part, index=df.index, columns=df.columns)
+        for name, part in zip(["trend", "seasonal", "resid"], parts)
+    }
@@ -1,4 +1,5 @@
 """Reshape data."""
+import os
 import numpy as np
 import pandas as pd
 
@@ -28,6 +29,10 @@ def infer_frequency(df_wide, warn=True, **kwargs):
     return frequency
 
 
+# aggfuncs which leave a single value unchanged and give NaN for empty periods
+_reindexable_aggfuncs = ['first', 'last', 'mean', 'median', 'min', 'max']
+
+
 def df_cleanup(
     df_wide,
     frequency: str = "infer",
@@ -68,10 +73,26 @@ def df_cleanup(
             print("Frequency is 'None'! Input frequency not recognized.")
 
     # fill missing dates in index with NaN, resample to freq as necessary
-    try:
-        df_wide = df_wide.resample(frequency).apply(aggfunc)
-    except Exception:
-        df_wide = df_wide.asfreq(frequency, fill_value=np.nan)
+    full_index = None
+    if aggfunc in _reindexable_aggfuncs and frequency is not None:
+        # unique dates already on the frequency grid need only a reindex
+        try:
+            index = df_wide.index
+            if index.is_unique and index.is_monotonic_increasing:
+                full_index = pd.date_range(
+                    index[0], index[-1], freq=frequency, name=index.name
+                )
+                if not index.isin(full_index).all():
+                    full_index = None
+        except Exception:
+            full_index = None
+    if full_index is not None:
+        df_wide = df_wide.reindex(full_index)
+    else:
+        try:
+            df_wide = df_wide.resample(frequency).apply(aggfunc)
+        except Exception:
+            df_wide = df_wide.asfreq(frequency, fill_value=np.nan)
 
     # drop older data, because too much of a good thing...
     if str(drop_data_older_than_periods).isdigit():
@@ -112,26 +133,173 @@ def df_cleanup(
     return pd.DataFrame(df_wide)
 
 
+def _read_long_columns(df, columns):
+    """Pull the needed columns out of a long DataFrame, Arrow table, or Parquet file.
+
+    Only the requested columns are read or converted, the rest are never copied.
+
+    Returns:
+        dict of column name: pd.Series
+    """
+    if isinstance(df, (str, os.PathLike)):
+        # pandas uses pyarrow (or fastparquet) and raises if neither is installed
+        df = pd.read_parquet(df, columns=columns)
+    if hasattr(df, "column_names") and hasattr(df, "column"):
+        # pyarrow.Table, dictionary encoded columns arrive as pd.Categorical
+        return {col: df.column(col).to_pandas() for col in columns}
+    if not isinstance(df, pd.DataFrame):
+        df = pd.DataFrame(df)
+    return {col: df[col] for col in columns}
+
+
+_fast_aggfuncs = {
+    'first': 'first',
+    'last': 'last',
+    'sum': 'sum',
+    'mean': 'mean',
+    'min': 'min',
+    'max': 'max',
+    'count': 'count',
+    np.sum: 'sum',
+    np.nansum: 'sum',
+    np.mean: 'mean',
+    np.nanmean: 'mean',
+    np.min: 'min',
+    np.nanmin: 'min',
+    np.max: 'max',
+    np.nanmax: 'max',
+}
+
+
+def _scatter_long(row_codes, col_codes, values, shape, aggfunc, dtype="float64"):
+    """Place long values into a preallocated (dates, series) array in one pass.
+
+    Duplicate date/series pairs are aggregated vectorially, without a groupby.
+
+    Args:
+        row_codes (np.array): integer date position of each observation
+        col_codes (np.array): integer series position of each observation
+        values (np.array): float values, NaN only allowed for 'sum', 'mean', and 'count'
+        shape (tuple): (n_dates, n_series) of output
+        aggfunc (str): one of 'first', 'last', 'sum', 'mean', 'min', 'max', 'count'
+        dtype (str): output float dtype
+    """
+    n_cells = shape[0] * shape[1]
+    flat = row_codes.astype(np.int64) * shape[1] + col_codes
+    if aggfunc in ['first', 'last', 'min', 'max']:
+        if aggfunc in ['min', 'max']:
+            # after a stable sort by value, first of each cell is min, last is max
+            order = np.argsort(values, kind='stable')
+            flat = flat[order]
+            values = values[order]
+        keep_which = 'last' if aggfunc in ['last', 'max'] else 'first'
+        keep = ~pd.Series(flat).duplicated(keep=keep_which).to_numpy()
+        arr = np.full(n_cells, np.nan, dtype=dtype)
+        arr[flat[keep]] = values[keep]
+    else:
+        nan_mask = np.isnan(values)
+        present = np.bincount(flat, minlength=n_cells)
+        if aggfunc == 'count':
+            arr = np.bincount(flat, weights=~nan_mask, minlength=n_cells)
+        else:
+            arr = np.bincount(
+                flat, weights=np.where(nan_mask, 0, values), minlength=n_cells
+            )
+            if aggfunc == 'mean':
+                counts = np.bincount(flat, weights=~nan_mask, minlength=n_cells)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    arr = arr / counts
+        arr = arr.astype(dtype, copy=False)
+        arr[present == 0] = np.nan
+    return arr.reshape(shape)
+
+
 def long_to_wide(
     df,
     date_col: str = 'datetime',
     value_col: str = 'value',
     id_col: str = 'series_id',
     aggfunc: str = 'first',
+    dtype: str = None,
 ):
     """
     Take long data and convert into wide, cleaner data.
 
+    Numeric values with common aggfuncs use a fast path which integer codes the dates and series
+    and scatters values directly into the wide array. Other inputs fall back to pd.pivot_table.
+
     Args:
-        df (pd.DataFrame) - a pandas dataframe having three columns:
+        df (pd.DataFrame) - a pandas dataframe having three columns, or a pyarrow.Table, or a path to a Parquet file
         date_col (str) - the name of the column containing dates, preferrably already in pandas datetime format
         value_col (str): - the name of the column with the values of the time series (ie sales $)
         id_col (str): - name of the id column, unique for each time series
         aggfunc (str): - passed to pd.pivot_table, determines how to aggregate duplicates for series_id and datetime
             other options include "mean" and other numpy functions, beware data *must* already be input as numeric type for these to work.
             if categorical data is provided, `aggfunc='first'` is recommended
+        dtype (str): float dtype of numeric output, such as 'float32' to halve memory. Default None is float64.
     """
-    df_long = df.copy()
+    no_id = id_col in [None, 'None']
+    columns = [date_col, value_col] if no_id else [date_col, id_col, value_col]
+    cols = _read_long_columns(df, columns)
+    values = cols[value_col]
+    try:
+        fast_agg = _fast_aggfuncs.get(aggfunc, None) if not no_id else 'first'
+    except TypeError:
+        fast_agg = None
+    if (
+        fast_agg is not None
+        and pd.api.types.is_numeric_dtype(values)
+        and not pd.api.types.is_bool_dtype(values)
+    ):
+        values = values.to_numpy(dtype="float64", na_value=np.nan)
+        # factorize before datetime conversion, so only unique dates are parsed
+        date_codes, date_uniques = pd.factorize(cols[date_col])
+        try:
+            date_uniques = pd.to_datetime(date_uniques, infer_datetime_format=True)
+        except Exception:
+            raise ValueError(
+                "Could not convert date to datetime format. Incorrect column name or preformat with pandas to_datetime"
+            )
+        # merge different raw values of the same datetime and sort, NaT becomes -1
+        date_remap, date_index = pd.factorize(date_uniques, sort=True)
+        date_codes = np.where(date_codes >= 0, date_remap[date_codes], -1)
+        if no_id:
+            id_codes = np.zeros(values.shape[0], dtype=np.int64)
+            id_index = pd.Index(['First'])
+        else:
+            try:
+                id_codes, id_index = pd.factorize(cols[id_col], sort=True)
+            except TypeError:
+                # mixed type ids cannot be sorted
+                id_codes, id_index = pd.factorize(cols[id_col])
+            id_index = pd.Index(id_index, name=id_col)
+        del cols
+
+        # like pivot_table, drop NaN keys, and NaN values where they would not sum to 0
+        valid = (date_codes >= 0) & (id_codes >= 0)
+        if fast_agg not in ['sum', 'count']:
+            valid &= ~np.isnan(values)
+        if not valid.all():
+            values = values[valid]
+            date_codes, date_used = pd.factorize(date_codes[valid], sort=True)
+            id_codes, id_used = pd.factorize(id_codes[valid], sort=True)
+            date_index = date_index[date_used]
+            id_index = id_index[id_used]
+        arr = _scatter_long(
+            date_codes,
+            id_codes,
+            values,
+            shape=(len(date_index), len(id_index)),
+            aggfunc=fast_agg,
+            dtype="float64" if dtype is None else dtype,
+        )
+        return pd.DataFrame(
+            arr,
+            index=pd.DatetimeIndex(date_index, name=date_col),
+            columns=id_index,
+        )
+
+    df_long = pd.DataFrame(cols)
 
     # Attempt to convert to datetime format if not already
     try:
@@ -144,7 +312,7 @@ def long_to_wide(
         )
 
     # handle no id_col for if only one time series
-    if id_col in [None, 'None']:
+    if no_id:
         df_long[id_col] = 'First'
         df_long.drop_duplicates(subset=date_col, keep='first', inplace=True)
 
@@ -156,6 +324,8 @@ def long_to_wide(
         values=value_col, index=date_col, columns=id_col, aggfunc=aggfunc
     )
     df_wide = df_wide.sort_index(ascending=True)
+    if dtype is not None:
+        df_wide = df_wide.astype(dtype)
 
     return pd.DataFrame(df_wide)
 
@@ -168,12 +338,17 @@ class NumericTransformer(object):
 
     Currently datetimes cannot be inverse_transformed back to datetime
 
+    Columns already of numeric dtype are copied straight into a preallocated float array.
+    Only object columns are converted, `chunk_size` columns at a time, to bound memory on wide data.
+
     Args:
         na_strings (list): list of strings to replace as pd.NA
         categorical_fillna (str): how to fill NaN for categorical variables (numeric NaN are unaltered)
             "ffill" - uses forward and backward filling to supply na values
             "indicator" or anything else currently results in all missing replaced with str "missing_value"
-        handle_unknown (str): passed through to scikit-learn OrdinalEncoder
+        handle_unknown (str): 'use_encoded_value' to encode unknown levels as NaN, or 'error' to raise
+        chunk_size (int): number of columns converted at once
+        dtype (str): float dtype of the output
         verbose (int): greater than 0 to print some messages
     """
 
@@ -182,74 +357,125 @@ class NumericTransformer(object):
         na_strings: list = ['', ' '],  # 'NULL', 'NA', 'NaN', 'na', 'nan'
         categorical_fillna: str = "ffill",
         handle_unknown: str = 'use_encoded_value',
+        chunk_size: int = 1000,
+        dtype: str = "float64",
         verbose: int = 0,
     ):
         self.na_strings = na_strings
         self.verbose = verbose
         self.categorical_fillna = categorical_fillna
         self.handle_unknown = handle_unknown
+        self.chunk_size = chunk_size
+        self.dtype = dtype
         self.categorical_flag = False
         self.needs_transformation = True
 
+    @staticmethod
+    def _is_numeric(df):
+        """Boolean array of which columns are numeric, from dtypes only."""
+        return np.array(
+            [pd.api.types.is_numeric_dtype(x) for x in df.dtypes], dtype=bool
+        )
+
+    def _chunks(self, positions):
+        """Split column positions into chunks of chunk_size."""
+        chunk_size = max(int(self.chunk_size), 1)
+        for i in range(0, len(positions), chunk_size):
+            yield positions[i : i + chunk_size]
+
+    def _object_values(self, df):
+        """Object array of a chunk with na_strings replaced by NaN, and its NaN mask."""
+        values = df.to_numpy(dtype=object, copy=True)
+        na_mask = pd.isna(values)
+        for na_str in self.na_strings:
+            na_mask |= values == na_str
+        values[na_mask] = np.nan
+        return values, na_mask
+
+    def _to_numeric(self, values):
+        """Coerce an object array to float in one call, failures become NaN."""
+        num = pd.to_numeric(values.ravel(), errors='coerce')
+        return np.asarray(num, dtype=self.dtype).reshape(values.shape)
+
+    def _fill_categorical(self, df_enc):
+        """Fill NaN in categorical columns before encoding."""
+        if self.categorical_fillna == "ffill":
+            df_enc = df_enc.fillna(method='ffill').fillna(method='bfill')
+        return df_enc.fillna('missing_value')
+
+    def _encode(self, df_enc, categories):
+        """Encode a chunk of categorical columns to float codes, starting at 1."""
+        encoded = np.empty(df_enc.shape, dtype=self.dtype)
+        for i, cats in enumerate(categories):
+            codes = cats.get_indexer(df_enc.iloc[:, i])
+            unknown = codes < 0
+            if unknown.any():
+                if self.handle_unknown == 'error':
+                    raise ValueError(
+                        f"Found unknown categories in column {df_enc.columns[i]} during transform"
+                    )
+            # the + 1 makes it compatible with remove_leading_zeroes
+            encoded[:, i] = np.where(unknown, np.nan, codes + 1)
+        return encoded
+
     def _fit(self, df):
         """Fit categorical to numeric."""
         # test if any columns aren't numeric
         if not isinstance(df, pd.DataFrame):  # basically just Series inputs
             df = pd.DataFrame(df)
 
-        if df.shape[1] == df.select_dtypes(include=np.number).shape[1]:
+        is_numeric = self._is_numeric(df)
+        if is_numeric.all():
             self.needs_transformation = False
             if self.verbose > 2:
                 print("All data is numeric, skipping NumericTransformer")
-
-        if self.needs_transformation:
-            # replace some common nan datatypes from strings to nan
-            df.replace(self.na_strings, np.nan, inplace=True)  # pd.NA in future
-
+            return df.astype(self.dtype)
+
+        # record which columns are which dtypes
+        self.column_order = df.columns
+        arr = np.empty(df.shape, dtype=self.dtype)
+        numeric_pos = np.flatnonzero(is_numeric)
+        for chunk in self._chunks(numeric_pos):
+            arr[:, chunk] = df.iloc[:, chunk].to_numpy(dtype=self.dtype)
+        categorical_pos = []
+        self.categories = []
+        for chunk in self._chunks(np.flatnonzero(~is_numeric)):
+            values, na_mask = self._object_values(df.iloc[:, chunk])
             # convert series to numeric which can be readily converted.
-            df = df.apply(pd.to_numeric, errors='ignore')
-
-            # record which columns are which dtypes
-            self.column_order = df.columns
-            self.numeric_features = df.select_dtypes(
-                include=[np.number]
-            ).columns.tolist()
-            self.categorical_features = list(
-                set(df.columns.tolist()) - set(self.numeric_features)
-            )
-
-            if len(self.categorical_features) > 0:
-                self.categorical_flag = True
-            if self.categorical_flag:
-                from sklearn.preprocessing import OrdinalEncoder
-
-                df_enc = df[self.categorical_features]
-                if self.categorical_fillna == "ffill":
-                    df_enc = df_enc.fillna(method='ffill').fillna(method='bfill')
-                df_enc = df_enc.fillna('missing_value')
-                self.cat_transformer = OrdinalEncoder(
-                    handle_unknown=self.handle_unknown, unknown_value=np.nan
+            num = self._to_numeric(values)
+            converted = (np.isnan(num) == na_mask).all(axis=0)
+            if converted.any():
+                arr[:, chunk[converted]] = num[:, converted]
+            if not converted.all():
+                df_enc = pd.DataFrame(
+                    values[:, ~converted], columns=df.columns[chunk[~converted]]
                 )
-                # the + 1 makes it compatible with remove_leading_zeroes
-                df_enc = self.cat_transformer.fit_transform(df_enc) + 1
-                # df_enc = self.cat_transformer.transform(df_enc) + 1
-
-                self.cat_max = df_enc.max(axis=0)
-                self.cat_min = df_enc.min(axis=0)
-                if self.verbose > 0:
-                    print("Categorical features converted to numeric")
-                df = pd.concat(
-                    [
-                        pd.DataFrame(
-                            df[self.numeric_features], columns=self.numeric_features
-                        ),
-                        pd.DataFrame(
-                            df_enc, columns=self.categorical_features, index=df.index
-                        ),
-                    ],
-                    axis=1,
-                )[self.column_order]
-        return df.astype(float)
+                df_enc = self._fill_categorical(df_enc)
+                cats = []
+                for col in range(df_enc.shape[1]):
+                    try:
+                        uniques = pd.unique(df_enc.iloc[:, col])
+                        cats.append(pd.Index(np.sort(uniques)))
+                    except TypeError:
+                        # mixed types cannot be sorted
+                        cats.append(pd.Index(uniques))
+                arr[:, chunk[~converted]] = self._encode(df_enc, cats)
+                categorical_pos.extend(chunk[~converted])
+                self.categories.extend(cats)
+        categorical_pos = np.array(categorical_pos, dtype=int)
+        is_numeric = np.ones(df.shape[1], dtype=bool)
+        is_numeric[categorical_pos] = False
+        self.numeric_features = df.columns[is_numeric].tolist()
+        self.categorical_features = df.columns[categorical_pos].tolist()
+
+        if len(self.categorical_features) > 0:
+            self.categorical_flag = True
+            cat_arr = arr[:, categorical_pos]
+            self.cat_max = np.nanmax(cat_arr, axis=0)
+            self.cat_min = np.nanmin(cat_arr, axis=0)
+            if self.verbose > 0:
+                print("Categorical features converted to numeric")
+        return pd.DataFrame(arr, index=df.index, columns=df.columns)
 
     def fit(self, df):
         """Learn behavior of data to change.
@@ -270,33 +496,42 @@ class NumericTransformer(object):
 
     def transform(self, df):
         """Convert categorical dataset to numeric."""
-        if self.needs_transformation:
-            if not isinstance(df, pd.DataFrame):
-                df = pd.DataFrame(df)
-            df.replace(self.na_strings, np.nan, inplace=True)
-            df = df.apply(pd.to_numeric, errors='ignore')
-            if self.categorical_flag:
-                df_enc = (df[self.categorical_features]).fillna(method='ffill')
-                df_enc = df_enc.fillna(method='bfill').fillna('missing_value')
-                df_enc = self.cat_transformer.transform(df_enc) + 1
-                df = pd.concat(
-                    [
-                        pd.DataFrame(
-                            df[self.numeric_features], columns=self.numeric_features
-                        ),
-                        pd.DataFrame(
-                            df_enc, columns=self.categorical_features, index=df.index
-                        ),
-                    ],
-                    axis=1,
-                )[self.column_order]
-        try:
-            df = df.astype(float)
-        except ValueError as e:
-            raise ValueError(
-                f"NumericTransformer.transform() could not convert data to float. {str(e)}."
-            )
-        return df
+        if not isinstance(df, pd.DataFrame):
+            df = pd.DataFrame(df)
+        if not self.needs_transformation:
+            try:
+                return df.astype(self.dtype)
+            except ValueError as e:
+                raise ValueError(
+                    f"NumericTransformer.transform() could not convert data to float. {str(e)}."
+                )
+        df = df[self.column_order]
+        arr = np.empty(df.shape, dtype=self.dtype)
+        numeric_pos = df.columns.get_indexer(self.numeric_features)
+        for chunk in self._chunks(numeric_pos):
+            df_chunk = df.iloc[:, chunk]
+            if self._is_numeric(df_chunk).all():
+                arr[:, chunk] = df_chunk.to_numpy(dtype=self.dtype)
+            else:
+                values, na_mask = self._object_values(df_chunk)
+                num = self._to_numeric(values)
+                if (np.isnan(num) != na_mask).any():
+                    raise ValueError(
+                        "NumericTransformer.transform() could not convert data to float."
+                    )
+                arr[:, chunk] = num
+        if self.categorical_flag:
+            categorical_pos = df.columns.get_indexer(self.categorical_features)
+            start = 0
+            for chunk in self._chunks(categorical_pos):
+                values, na_mask = self._object_values(df.iloc[:, chunk])
+                df_enc = pd.DataFrame(values, columns=df.columns[chunk])
+                df_enc = self._fill_categorical(df_enc)
+                arr[:, chunk] = self._encode(
+                    df_enc, self.categories[start : start + len(chunk)]
+                )
+                start += len(chunk)
+        return pd.DataFrame(arr, index=df.index, columns=df.columns)
 
     def inverse_transform(self, df, convert_dtypes: bool = False):
         """Convert numeric back to categorical.
@@ -307,24 +542,20 @@ class NumericTransformer(object):
         if self.categorical_flag:
             if not isinstance(df, pd.DataFrame):  # basically just Series inputs
                 df = pd.DataFrame(df)
+            df = df.copy()
             df_enc = (
                 df[self.categorical_features].clip(
                     upper=self.cat_max, lower=self.cat_min, axis=1
                 )
                 - 1
             )
-            df_enc = self.cat_transformer.inverse_transform(df_enc)
-            df = pd.concat(
-                [
-                    pd.DataFrame(
-                        df[self.numeric_features], columns=self.numeric_features
-                    ),
-                    pd.DataFrame(
-                        df_enc, columns=self.categorical_features, index=df.index
-                    ),
-                ],
-                axis=1,
-            )[self.column_order]
+            for i, col in enumerate(self.categorical_features):
+                codes = df_enc[col].to_numpy()
+                nan_mask = np.isnan(codes)
+                values = self.categories[i].take(
+                    np.where(nan_mask, 0, codes).astype(int)
+                )
+                df[col] = np.where(nan_mask, np.nan, values.to_numpy(dtype=object))
         if convert_dtypes:
             df = df.convert_dtypes()
         return df
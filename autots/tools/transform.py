@@ -4,7 +4,7 @@ import warnings
 import numpy as np
 import pandas as pd
 from autots.tools.impute import FillNA, df_interpolate
-from autots.tools.seasonal import date_part, seasonal_int
+from autots.tools.seasonal import date_part, seasonal_int, batch_decompose
 from autots.tools.cointegration import coint_johansen, btcd_decompose
 from autots.models.sklearn import generate_regressor_params, retrieve_regressor
 from autots.tools.anomaly_utils import (
@@ -17,11 +17,6 @@ from autots.tools.anomaly_utils import (
 from autots.tools.window_functions import window_lin_reg, window_lin_reg_mean
 from autots.tools.fast_kalman import KalmanFilter, random_state_space
 
-try:
-    from joblib import Parallel, delayed
-except Exception:
-    pass
-
 
 class EmptyTransformer(object):
     """Base transformer returning raw data."""
@@ -70,6 +65,21 @@ class EmptyTransformer(object):
         """
         return self._fit(df)
 
+    def fit_transform_array(self, arr):
+        """Fit and transform a float np.array of (observations, series), may modify arr in place.
+
+        Only used for transformers listed in fused_trans.
+        """
+        return arr
+
+    def transform_array(self, arr):
+        """Transform a float np.array of (observations, series), may modify arr in place."""
+        return arr
+
+    def inverse_transform_array(self, arr, trans_method: str = "forecast"):
+        """Inverse a float np.array with (observations, series) as the last two axes."""
+        return arr
+
     def __repr__(self):
         """Print."""
         return "Transformer " + str(self.name) + ", uses standard .fit/.transform"
@@ -114,6 +124,27 @@ def clip_outliers(df, std_threshold: float = 3):
     return df2
 
 
+def _bfill_array(arr):
+    """Backfill NaN along axis 0 of a 2d array, in place."""
+    mask = np.isnan(arr)
+    if not mask.any():
+        return arr
+    n = arr.shape[0]
+    idx = np.where(mask, n, np.arange(n)[:, np.newaxis])
+    idx = np.minimum.accumulate(idx[::-1], axis=0)[::-1]
+    filled = idx < n
+    arr[filled] = np.take_along_axis(arr, np.minimum(idx, n - 1), axis=0)[filled]
+    return arr
+
+
+def _cumsum_skipna(arr):
+    """Cumulative sum along axis -2 keeping NaN in place, as pandas cumsum."""
+    mask = np.isnan(arr)
+    result = np.nancumsum(arr, axis=-2)
+    result[mask] = np.nan
+    return result
+
+
 def simple_context_slicer(df, method: str = "None", forecast_length: int = 30):
     """Condensed version of context_slicer with more limited options.
 
@@ -333,39 +364,32 @@ class Detrend(EmptyTransformer):
         #     df = df.astype(float)
         # except Exception:
         #     raise ValueError("Data Cannot Be Converted to Numeric Float")
-        x_in = df.index
+        return df + self._inverse_trend(df.index, df.columns)
+
+    def _inverse_trend(self, index, columns):
+        """Trend to add back over index, with phi damping applied."""
+        x_in = index
         if not isinstance(x_in, pd.DatetimeIndex):
             x_in = pd.DatetimeIndex(x_in)
         X = pd.to_numeric(x_in, errors="coerce", downcast="integer").values
         if self.model != "GLS":
             X = X.reshape((-1, 1))
+        pred = pd.DataFrame(self.trained_model.predict(X), index=x_in, columns=columns)
         if self.model in self.need_positive:
-            temp = self.trnd_trans.inverse_transform(
-                pd.DataFrame(
-                    self.trained_model.predict(X), index=x_in, columns=df.columns
-                )
-            )
-            if self.phi != 1:
-                temp = temp.mul(
-                    pd.Series([self.phi] * df.shape[0], index=temp.index).pow(
-                        range(df.shape[0])
-                    ),
-                    axis=0,
-                )
-            df = df + temp
-        else:
-            pred = pd.DataFrame(
-                self.trained_model.predict(X), index=x_in, columns=df.columns
+            pred = self.trnd_trans.inverse_transform(pred)
+        if self.phi != 1:
+            pred = pred.mul(
+                pd.Series([self.phi] * len(index), index=pred.index).pow(
+                    range(len(index))
+                ),
+                axis=0,
             )
-            if self.phi != 1:
-                pred = pred.mul(
-                    pd.Series([self.phi] * df.shape[0], index=pred.index).pow(
-                        range(df.shape[0])
-                    ),
-                    axis=0,
-                )
-            df = df + pred
-        return df
+        return pred
+
+    def inverse_transform_stacked(
+        self, arr, index, columns, trans_method: str = "forecast", bounds=None
+    ):
+        return arr + self._inverse_trend(index, columns).to_numpy()
 
 
 class StatsmodelsFilter(EmptyTransformer):
@@ -472,15 +496,22 @@ class STLFilter(EmptyTransformer):
         decomp_type (str): which decomposition to use
         part (str): which part of decomposition to return
         seaonal (int): seaonsal component of STL
+        n_jobs (int): processes used for STL
     """
 
     def __init__(
-        self, decomp_type="STL", part: str = "trend", seasonal: int = 7, **kwargs
+        self,
+        decomp_type="STL",
+        part: str = "trend",
+        seasonal: int = 7,
+        n_jobs: int = 1,
+        **kwargs,
     ):
         super().__init__(name="STLFilter")
         self.part = part
         self.seasonal = seasonal
         self.decomp_type = decomp_type
+        self.n_jobs = n_jobs
 
     def fit_transform(self, df):
         """Fit and Return Detrended DataFrame.
@@ -496,30 +527,16 @@ class STLFilter(EmptyTransformer):
         Args:
             df (pandas.DataFrame): input dataframe
         """
-        from statsmodels.tsa.seasonal import STL, seasonal_decompose
-
-        def _stl_one_return(series, decomp_type="STL", seasonal=7, part="trend"):
-            """Convert filter to apply on pd DataFrame."""
-            if str(decomp_type).lower() == "stl":
-                result = STL(series, seasonal=seasonal).fit()
-            else:
-                result = seasonal_decompose(series)
-            if part == "seasonal":
-                return result.seasonal
-            elif part == "resid":
-                return result.resid
-            else:
-                return result.trend
-
         if df.isnull().values.any():
             raise ValueError("STLFilter does not handle null values.")
 
-        df = df.apply(
-            _stl_one_return,
+        part = self.part if self.part in ["seasonal", "resid"] else "trend"
+        df = batch_decompose(
+            df,
             decomp_type=self.decomp_type,
             seasonal=self.seasonal,
-            part=self.part,
-        )
+            n_jobs=self.n_jobs,
+        )[part]
         return df.fillna(method="ffill").fillna(method="bfill")
 
     @staticmethod
@@ -542,7 +559,12 @@ class STLFilter(EmptyTransformer):
 
 
 class SinTrend(EmptyTransformer):
-    """Modelling sin."""
+    """Modelling sin.
+
+    Args:
+        method (str): 'fft' for a vectorized least squares fit of all series at once,
+            otherwise the scipy curve_fit method ('lm', 'trf', 'dogbox') used per series
+    """
 
     def __init__(self, n_jobs=1, method='lm', **kwargs):
         super().__init__(name="SinTrend")
@@ -551,8 +573,12 @@ class SinTrend(EmptyTransformer):
 
     @staticmethod
     def get_new_params(method: str = "random"):
+        if method == "fast":
+            return {'method': 'fft'}
         return {
-            'method': random.choices(['lm', 'trf', 'dogbox'], [0.95, 0.025, 0.025])[0]
+            'method': random.choices(
+                ['fft', 'lm', 'trf', 'dogbox'], [0.5, 0.46, 0.02, 0.02]
+            )[0]
         }
 
     @staticmethod
@@ -588,6 +614,104 @@ class SinTrend(EmptyTransformer):
             "offset": c,
         }  # , "freq": f, "period": 1./f, "fitfunc": fitfunc, "maxcov": np.max(pcov), "rawres": (guess,popt,pcov)}
 
+    @staticmethod
+    def fit_sin_vectorized(tt, yy, pad: int = 4, grid_size: int = 9, rounds: int = 2):
+        """Fit a sin to every column of yy at once, returning a DataFrame of "amp", "omega", "phase", "offset".
+
+        Initial frequencies come from the peak of a zero-padded FFT of each series.
+        These are refined over a local frequency grid where, for each candidate,
+        amplitude, phase, and offset are solved in closed form by linear least squares.
+
+        Args:
+            tt (np.array): 1d array of uniformly spaced time values
+            yy (np.array): 2d array of shape (len(tt), n_series), NaN are ignored
+            pad (int): zero padding multiplier of the FFT, finer initial frequency
+            grid_size (int): number of candidate frequencies per refinement round
+            rounds (int): number of refinement rounds, each narrowing the grid
+        """
+        tt = np.asarray(tt, dtype=float)
+        yy = np.asarray(yy, dtype=float)
+        if yy.ndim == 1:
+            yy = yy[:, np.newaxis]
+        n, k = yy.shape
+        if n < 3:
+            return pd.DataFrame(
+                {
+                    "amp": np.zeros(k),
+                    "omega": np.zeros(k),
+                    "phase": np.zeros(k),
+                    "offset": np.nanmean(yy, axis=0),
+                }
+            )
+        # work in steps for numerical stability, converted back to tt units at end
+        dt = tt[1] - tt[0]  # assume uniform spacing
+        steps = (tt - tt[0]) / dt
+        mask = ~np.isnan(yy)
+        y = np.where(mask, yy, 0.0)
+        w = mask.astype(float)
+        count = w.sum(axis=0)
+        mean = y.sum(axis=0) / np.where(count == 0, 1, count)
+
+        n_fft = n * pad
+        spectrum = np.abs(np.fft.rfft((y - mean) * w, n=n_fft, axis=0))
+        # excluding the zero frequency "peak", which is related to offset
+        freq = (np.argmax(spectrum[1:], axis=0) + 1) / n_fft
+        yy_sum = (y * y).sum(axis=0)
+
+        def solve(freq):
+            angle = 2.0 * np.pi * steps[:, np.newaxis] * freq
+            sin = np.sin(angle) * w
+            cos = np.cos(angle) * w
+            # normal equations of y = a * sin + b * cos + c, one 3x3 system per series
+            ss = (sin * sin).sum(axis=0)
+            sc = (sin * cos).sum(axis=0)
+            cc = (cos * cos).sum(axis=0)
+            s1 = sin.sum(axis=0)
+            c1 = cos.sum(axis=0)
+            lhs = np.stack(
+                [
+                    np.stack([ss, sc, s1], axis=-1),
+                    np.stack([sc, cc, c1], axis=-1),
+                    np.stack([s1, c1, count], axis=-1),
+                ],
+                axis=1,
+            )
+            rhs = np.stack(
+                [(sin * y).sum(axis=0), (cos * y).sum(axis=0), y.sum(axis=0)],
+                axis=-1,
+            )
+            lhs = lhs + np.eye(3) * 1e-10
+            beta = np.linalg.solve(lhs, rhs[..., np.newaxis])[..., 0]
+            rss = yy_sum - (beta * rhs).sum(axis=-1)
+            return beta, rss
+
+        width = 1.0 / n_fft
+        for _ in range(rounds):
+            offsets = np.linspace(-width, width, grid_size)
+            candidates = np.clip(freq + offsets[:, np.newaxis], width / pad, 0.5)
+            best_rss = np.full(k, np.inf)
+            best_freq = freq
+            for cand in candidates:
+                _, rss = solve(cand)
+                better = rss < best_rss
+                best_rss = np.where(better, rss, best_rss)
+                best_freq = np.where(better, cand, best_freq)
+            freq = best_freq
+            width = width * 2.0 / (grid_size - 1)
+        beta, _ = solve(freq)
+        a, b, c = beta[:, 0], beta[:, 1], beta[:, 2]
+        omega = 2.0 * np.pi * freq / dt
+        # a * sin(x) + b * cos(x) = amp * sin(x + phase), then shift origin to 0
+        phase = np.arctan2(b, a) - omega * tt[0]
+        return pd.DataFrame(
+            {
+                "amp": np.sqrt(a**2 + b**2),
+                "omega": omega,
+                "phase": np.mod(phase, 2.0 * np.pi),
+                "offset": c,
+            }
+        )
+
     def fit(self, df):
         """Fits trend for later detrending
         Args:
@@ -599,14 +723,20 @@ class SinTrend(EmptyTransformer):
             raise ValueError("Data Cannot Be Converted to Numeric Float")
 
         X = pd.to_numeric(df.index, errors="coerce", downcast="integer").values
-        # make this faster (250 columns in 2.5 seconds isn't bad, though)
+        if self.method == "fft":
+            self.sin_params = self.fit_sin_vectorized(X, df.to_numpy())
+            self.shape = df.shape
+            return self
         cols = df.columns.tolist()
+        parallel = True
         if self.n_jobs in [0, 1] or len(cols) < 100:
             parallel = False
         # joblib multiprocessing to loop through series
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             if parallel:
+                from joblib import Parallel, delayed
+
                 df_list = Parallel(n_jobs=self.n_jobs)(
                     delayed(self.fit_sin)(X, df[col].to_numpy(), method=self.method)
                     for col in cols
@@ -721,6 +851,7 @@ class PositiveShift(EmptyTransformer):
         else:
             shift_amount = df.min(axis=0)
         self.shift_amount = shift_amount.where(shift_amount < 0, 0).abs()
+        self.shift_array = self.shift_amount.to_numpy()
 
         return self
 
@@ -761,6 +892,35 @@ class PositiveShift(EmptyTransformer):
         df = df - self.shift_amount
         return df
 
+    def fit_transform_array(self, arr):
+        shift_amount = np.fmin.reduce(arr, axis=0)
+        if self.log or self.center_one:
+            shift_amount = shift_amount - 1
+        self.shift_array = np.where(shift_amount < 0, -shift_amount, 0).astype(
+            arr.dtype
+        )
+        return self.transform_array(arr)
+
+    def transform_array(self, arr):
+        arr += self.shift_array
+        if self.squared:
+            np.square(arr, out=arr)
+        if self.log:
+            np.log(arr, out=arr)
+        return arr
+
+    def inverse_transform_array(self, arr, trans_method: str = "forecast"):
+        if self.log:
+            arr = np.exp(arr)
+        if self.squared:
+            arr = arr**0.5
+        return arr - self.shift_array
+
+    def inverse_transform_stacked(
+        self, arr, index, columns, trans_method: str = "forecast", bounds=None
+    ):
+        return self.inverse_transform_array(arr, trans_method=trans_method)
+
 
 class IntermittentOccurrence(EmptyTransformer):
     """Intermittent inspired binning predicts probability of not center.
@@ -1049,6 +1209,21 @@ class SeasonalDifference(EmptyTransformer):
         sdf.columns = df.columns
         return df + sdf
 
+    def inverse_transform_stacked(
+        self, arr, index, columns, trans_method: str = "forecast", bounds=None
+    ):
+        tile_len = len(self.tile_values_lag_1.index)
+        df_len = arr.shape[-2]
+        sdf = np.tile(
+            self.tile_values_lag_1.to_numpy(),
+            (int(np.ceil(df_len / tile_len)), 1),
+        )
+        if trans_method == "original":
+            sdf = sdf[-df_len:]
+        else:
+            sdf = sdf[:df_len]
+        return arr + sdf
+
 
 class DatepartRegressionTransformer(EmptyTransformer):
     """Remove a regression on datepart from the data. See tools.seasonal.date_part"""
@@ -1216,6 +1391,17 @@ class DatepartRegressionTransformer(EmptyTransformer):
         df = df + y
         return df
 
+    def inverse_transform_stacked(
+        self, arr, index, columns, trans_method: str = "forecast", bounds=None
+    ):
+        X = date_part(
+            index,
+            method=self.datepart_method,
+            polynomial_degree=self.polynomial_degree,
+        )
+        y = np.asarray(self.model.predict(X), dtype=float)
+        return arr.astype(float) + y.reshape(len(index), -1)
+
 
 DatepartRegression = DatepartRegressionTransformer
 
@@ -1240,6 +1426,8 @@ class DifferencedTransformer(EmptyTransformer):
         """
         self.last_values = df.tail(self.lag)
         self.first_values = df.head(self.lag)
+        self.last_array = self.last_values.to_numpy()
+        self.first_array = self.first_values.to_numpy()
         return self
 
     def transform(self, df):
@@ -1280,6 +1468,38 @@ class DifferencedTransformer(EmptyTransformer):
                 raise ValueError("NaN in DifferencedTransformer.inverse_transform")
             return df.cumsum().tail(df_len)
 
+    def fit_transform_array(self, arr):
+        self.last_array = arr[-self.lag :].copy()
+        self.first_array = arr[: self.lag].copy()
+        return self.transform_array(arr)
+
+    def transform_array(self, arr):
+        lag = self.lag
+        arr[lag:] = arr[lag:] - arr[:-lag]
+        arr[:lag] = np.nan
+        return _bfill_array(arr)
+
+    def inverse_transform_array(self, arr, trans_method: str = "forecast"):
+        lag = self.lag
+        if trans_method == "original":
+            start = np.broadcast_to(
+                self.first_array, arr.shape[:-2] + self.first_array.shape
+            )
+            return _cumsum_skipna(np.concatenate([start, arr[..., lag:, :]], axis=-2))
+        else:
+            if np.isnan(arr).any():
+                raise ValueError("NaN in DifferencedTransformer.inverse_transform")
+            start = np.broadcast_to(
+                self.last_array, arr.shape[:-2] + self.last_array.shape
+            )
+            full = np.concatenate([start, arr], axis=-2)
+            return np.cumsum(full, axis=-2)[..., lag:, :]
+
+    def inverse_transform_stacked(
+        self, arr, index, columns, trans_method: str = "forecast", bounds=None
+    ):
+        return self.inverse_transform_array(arr, trans_method=trans_method)
+
 
 class PctChangeTransformer(EmptyTransformer):
     """% Change of Data.
@@ -1483,6 +1703,26 @@ class ClipOutliers(EmptyTransformer):
             df2 = FillNA(df2, method=self.fillna, window=10)
         return df2
 
+    def fit_transform_array(self, arr):
+        # fillna requires a DataFrame, so this is not fused if fillna is set
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            self.std_array = np.nanstd(arr, axis=0, ddof=1)
+            self.mean_array = np.nanmean(arr, axis=0)
+        return self.transform_array(arr)
+
+    def transform_array(self, arr):
+        threshold = self.std_array * self.std_threshold
+        if self.method == "remove":
+            with np.errstate(invalid="ignore"):
+                arr[~(np.abs(arr - self.mean_array) <= threshold)] = np.nan
+        else:
+            # NaN bounds are not applied, as with pandas clip
+            lower = np.nan_to_num(self.mean_array - threshold, nan=-np.inf)
+            upper = np.nan_to_num(self.mean_array + threshold, nan=np.inf)
+            np.clip(arr, lower, upper, out=arr)
+        return arr
+
     def inverse_transform(self, df, trans_method: str = "forecast"):
         """Return data to original *or* forecast form.
 
@@ -1491,6 +1731,11 @@ class ClipOutliers(EmptyTransformer):
         """
         return df
 
+    def inverse_transform_stacked(
+        self, arr, index, columns, trans_method: str = "forecast", bounds=None
+    ):
+        return arr
+
     def fit_transform(self, df):
         """Fits and Returns *Magical* DataFrame.
 
@@ -1572,6 +1817,32 @@ class Round(EmptyTransformer):
                 df = df.astype(int)
         return df
 
+    def fit_transform_array(self, arr):
+        return self.transform_array(arr)
+
+    def transform_array(self, arr):
+        # force_int returns integers, so this is not fused if set
+        if self.on_transform:
+            np.round(arr, decimals=self.decimals, out=arr)
+        return arr
+
+    def inverse_transform_array(self, arr, trans_method: str = "forecast"):
+        if self.on_inverse:
+            arr = np.round(arr, decimals=self.decimals)
+        return arr
+
+    def inverse_transform_stacked(
+        self, arr, index, columns, trans_method: str = "forecast", bounds=None
+    ):
+        arr = self.inverse_transform_array(arr, trans_method=trans_method)
+        if self.on_inverse and self.force_int:
+            if not np.isfinite(arr).all():
+                raise ValueError(
+                    "Cannot convert non-finite values (NA or inf) to integer"
+                )
+            arr = arr.astype(int)
+        return arr
+
     def fit_transform(self, df):
         """Fits and Returns *Magical* DataFrame.
 
@@ -1845,6 +2116,7 @@ class CenterLastValue(EmptyTransformer):
         if self.center.isnull().any():
             surrogate = df.replace(0, np.nan).median().fillna(1)
             self.center = self.center.fillna(surrogate)
+        self.center_array = self.center.to_numpy()
         return self
 
     def transform(self, df):
@@ -1865,6 +2137,30 @@ class CenterLastValue(EmptyTransformer):
         df = df * self.center
         return df
 
+    def fit_transform_array(self, arr):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            center = np.nanmean(arr[-self.rows :], axis=0)
+            center[center == 0] = np.nan
+            if np.isnan(center).any():
+                nonzero = np.where(arr == 0, np.nan, arr)
+                surrogate = np.nan_to_num(np.nanmedian(nonzero, axis=0), nan=1)
+                center = np.where(np.isnan(center), surrogate, center)
+        self.center_array = center
+        return self.transform_array(arr)
+
+    def transform_array(self, arr):
+        arr /= self.center_array
+        return arr
+
+    def inverse_transform_array(self, arr, trans_method: str = "forecast"):
+        return arr * self.center_array
+
+    def inverse_transform_stacked(
+        self, arr, index, columns, trans_method: str = "forecast", bounds=None
+    ):
+        return self.inverse_transform_array(arr, trans_method=trans_method)
+
     def fit_transform(self, df):
         """Fits and Returns *Magical* DataFrame.
 
@@ -2568,6 +2864,26 @@ class AlignLastValue(EmptyTransformer):
                 else:
                     return df + self.strength * (self.center - df.iloc[0])
 
+    def inverse_transform_stacked(
+        self, arr, index, columns, trans_method: str = "forecast", bounds=None
+    ):
+        """Bounds are left unaligned, as with inverse_transform(bounds=True)."""
+        if bounds is None:
+            bounds = np.zeros(arr.shape[0], dtype=bool)
+        align = ~np.asarray(bounds, dtype=bool)
+        if trans_method == "original" or not align.any():
+            return arr
+        center = self.center.to_numpy()
+        first = arr[..., 0:1, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.method == "multiplicative":
+                aligned = arr * (1 + ((center / first) - 1) * self.strength)
+            else:
+                aligned = arr + self.strength * (center - first)
+        if self.first_value_only:
+            aligned = np.concatenate([aligned[..., 0:1, :], arr[..., 1:, :]], axis=-2)
+        return np.where(align[:, None, None], aligned, arr)
+
     def fit_transform(self, df):
         """Fits and Returns *Magical* DataFrame.
 
@@ -3219,8 +3535,6 @@ trans_dict = {
     "RollingMean10": RollingMeanTransformer(window=10),
     "DifferencedTransformer": DifferencedTransformer(),
     "PctChangeTransformer": PctChangeTransformer(),
-    "SinTrend": SinTrend(),
-    "SineTrend": SinTrend(),
     "PositiveShift": PositiveShift(squared=False),
     "Log": PositiveShift(log=True),
     "CumSumTransformer": CumSumTransformer(),
@@ -3249,10 +3563,11 @@ trans_dict = {
 # have n_jobs
 n_jobs_trans = {
     # datepart not included for fears it will slow it down sometimes
-    "SinTrend": SinTrend(),
-    "SineTrend": SinTrend(),
+    "SinTrend": SinTrend,
+    "SineTrend": SinTrend,
     "AnomalyRemoval": AnomalyRemoval,
     'HolidayTransformer': HolidayTransformer,
+    "STLFilter": STLFilter,
 }
 # transformers with parameter pass through (internal only)
 have_params = {
@@ -3268,7 +3583,6 @@ have_params = {
     "Detrend": Detrend,
     "ScipyFilter": ScipyFilter,
     "HPFilter": HPFilter,
-    "STLFilter": STLFilter,
     "EWMAFilter": EWMAFilter,
     "FastICA": FastICA,
     "PCA": PCA,
@@ -3277,6 +3591,9 @@ have_params = {
     "AlignLastValue": AlignLastValue,
     "AnomalyRemoval": AnomalyRemoval,  # not shared as long as output is 'multivariate'
     "HolidayTransformer": HolidayTransformer,
+    "STLFilter": STLFilter,
+    "SinTrend": SinTrend,
+    "SineTrend": SinTrend,
     "LocalLinearTrend": LocalLinearTrend,
     "KalmanSmoothing": KalmanSmoothing,
 }
@@ -3290,6 +3607,52 @@ shared_trans = [
     "Cointegration",
     "HolidayTransformer",
 ]
+# transformers which run on float32 data without meaningful loss of accuracy
+# all others upcast float32 input to float64
+float32_trans = [
+    None,
+    "None",
+    "MinMaxScaler",
+    "MaxAbsScaler",
+    "StandardScaler",
+    "RobustScaler",
+    "PositiveShift",
+    "Log",
+    "DifferencedTransformer",
+    "SeasonalDifference",
+    "SeasonalDifferenceMean",
+    "SeasonalDifference7",
+    "SeasonalDifference12",
+    "SeasonalDifference28",
+    "RollingMeanTransformer",
+    "RollingMean",
+    "RollingMean10",
+    "RollingMean100thN",
+    "RollingMean10thN",
+    "FixedRollingMean",
+    "ClipOutliers",
+    "Round",
+    "Slice",
+    "Discretize",
+    "CenterLastValue",
+    "AlignLastValue",
+    "IntermittentOccurrence",
+    "EWMAFilter",
+]
+# cheap transformers with ndarray methods, run in a single fused pass by GeneralTransformer
+fused_trans = [
+    None,
+    "None",
+    "DifferencedTransformer",
+    "PositiveShift",
+    "Log",
+    "MinMaxScaler",
+    "MaxAbsScaler",
+    "StandardScaler",
+    "ClipOutliers",
+    "Round",
+    "CenterLastValue",
+]
 # transformers not defined in AutoTS
 external_transformers = [
     "MinMaxScaler",
@@ -3376,6 +3739,8 @@ class GeneralTransformer(object):
             pass through dictionary of empty dictionaries to utilize defaults
 
         random_seed (int): random state passed through where applicable
+        fused (bool): if all transformers are in fused_trans, run them on a single ndarray
+            without intermediate DataFrames
     """
 
     def __init__(
@@ -3388,6 +3753,7 @@ class GeneralTransformer(object):
         grouping_ids=None,
         random_seed: int = 2020,
         n_jobs: int = 1,
+        fused: bool = True,
     ):
 
         self.fillna = fillna
@@ -3404,6 +3770,8 @@ class GeneralTransformer(object):
 
         self.random_seed = random_seed
         self.n_jobs = n_jobs
+        self.fused = fused
+        self.fused_fit = False
         self.transformers = {}
         # upper/lower forecast inverses are different
         self.bounded_oddities = ["AlignLastValue"]
@@ -3583,12 +3951,81 @@ class GeneralTransformer(object):
             )
             return EmptyTransformer()
 
+    def _to_compute_dtype(self, df):
+        """Upcast float32 data to float64 unless all transformers support float32."""
+        if (
+            self.upcast
+            and isinstance(df, pd.DataFrame)
+            and (df.dtypes == np.float32).any()
+        ):
+            return df.astype(float)
+        return df
+
+    def _fusable(self):
+        """Whether every transformation can run in the fused ndarray path."""
+        for i, transformation in self.transformations.items():
+            if transformation not in fused_trans:
+                return False
+            param = self.transformation_params.get(i, {}) or {}
+            if transformation == "ClipOutliers" and param.get("fillna") is not None:
+                return False
+            if transformation == "Round" and param.get("force_int", False):
+                return False
+        return True
+
+    @staticmethod
+    def _array_step(transformer, arr, step: str, trans_method: str = "forecast"):
+        """Apply one fused transformer to an ndarray."""
+        if isinstance(transformer, EmptyTransformer):
+            if step == "fit":
+                return transformer.fit_transform_array(arr)
+            elif step == "transform":
+                return transformer.transform_array(arr)
+            return transformer.inverse_transform_array(arr, trans_method=trans_method)
+        # sklearn scalers, which only accept 2d arrays
+        if step == "fit":
+            return transformer.fit_transform(arr)
+        elif step == "transform":
+            return transformer.transform(arr)
+        shape = arr.shape
+        return transformer.inverse_transform(arr.reshape(-1, shape[-1])).reshape(shape)
+
+    def _fit_fused(self, df):
+        """Fit and transform all transformers on one contiguous ndarray."""
+        arr = df.to_numpy(copy=True)
+        if not np.issubdtype(arr.dtype, np.floating):
+            arr = arr.astype(float)
+        try:
+            for i in sorted(self.transformations.keys()):
+                self.transformers[i] = self.retrieve_transformer(
+                    transformation=self.transformations[i],
+                    df=df,
+                    param=self.transformation_params[i],
+                    random_seed=self.random_seed,
+                    n_jobs=self.n_jobs,
+                )
+                arr = self._array_step(self.transformers[i], arr, "fit")
+        except Exception as e:
+            raise Exception(
+                f"Transformer {self.transformations[i]} failed on fit"
+            ) from e
+        return pd.DataFrame(arr, index=self.df_index, columns=self.df_colnames)
+
     def _fit(self, df):
+        self.upcast = not all(
+            x in float32_trans for x in self.transformations.values()
+        )
+        df = self._to_compute_dtype(df)
         # fill NaN
         df = self.fill_na(df)
 
         self.df_index = df.index
         self.df_colnames = df.columns
+        self.fused_fit = (
+            self.fused and isinstance(df, pd.DataFrame) and self._fusable()
+        )
+        if self.fused_fit:
+            return self._fit_fused(df)
         try:
             for i in sorted(self.transformations.keys()):
                 transformation = self.transformations[i]
@@ -3635,11 +4072,19 @@ class GeneralTransformer(object):
         if self.grouping is not None:
             df = self.hier.transform(df)
         """
+        df = self._to_compute_dtype(df)
         # fill NaN
         df = self.fill_na(df)
 
         self.df_index = df.index
         self.df_colnames = df.columns
+        if getattr(self, "fused_fit", False):
+            arr = df.to_numpy()
+            if not np.issubdtype(arr.dtype, np.floating):
+                arr = arr.astype(float)
+            for i in sorted(self.transformations.keys()):
+                arr = self._array_step(self.transformers[i], arr, "transform")
+            return pd.DataFrame(arr, index=self.df_index, columns=self.df_colnames)
         # transformations
         i = 0
         for i in sorted(self.transformations.keys()):
@@ -3672,25 +4117,25 @@ class GeneralTransformer(object):
         """
         self.df_index = df.index
         self.df_colnames = df.columns
+        if getattr(self, "fused_fit", False):
+            arr = df.to_numpy(dtype=float)
+            for i in sorted(self.transformations.keys(), reverse=True):
+                c_trans_n = self.transformations[i]
+                try:
+                    arr = self._array_step(
+                        self.transformers[i], arr, "inverse", trans_method
+                    )
+                except Exception as e:
+                    raise Exception(f"Transformer {c_trans_n} failed on inverse") from e
+            df = pd.DataFrame(arr, index=self.df_index, columns=self.df_colnames)
+            if fillzero:
+                df = df.fillna(0)
+            return df
         # df = df.replace([np.inf, -np.inf], 0)  # .fillna(0)
         try:
             for i in sorted(self.transformations.keys(), reverse=True):
                 c_trans_n = self.transformations[i]
-                if c_trans_n in self.oddities_list:
-                    if c_trans_n in self.bounded_oddities:
-                        df = self.transformers[i].inverse_transform(
-                            df, trans_method=trans_method, bounds=bounds
-                        )
-                    else:
-                        df = self.transformers[i].inverse_transform(
-                            df, trans_method=trans_method
-                        )
-                else:
-                    df = self.transformers[i].inverse_transform(df)
-                if not isinstance(df, pd.DataFrame):
-                    df = pd.DataFrame(df, index=self.df_index, columns=self.df_colnames)
-                elif c_trans_n in ["FastICA", "PCA"]:
-                    self.df_colnames = df.columns
+                df = self._inverse_step(i, df, trans_method, bounds)
                 # df = df.replace([np.inf, -np.inf], 0)
         except Exception as e:
             raise Exception(f"Transformer {c_trans_n} failed on inverse") from e
@@ -3700,6 +4145,104 @@ class GeneralTransformer(object):
 
         return df
 
+    def _inverse_step(self, i, df, trans_method: str = "forecast", bounds=False):
+        """Inverse one transformer on a DataFrame."""
+        c_trans_n = self.transformations[i]
+        if c_trans_n in self.oddities_list:
+            if c_trans_n in self.bounded_oddities:
+                df = self.transformers[i].inverse_transform(
+                    df, trans_method=trans_method, bounds=bounds
+                )
+            else:
+                df = self.transformers[i].inverse_transform(
+                    df, trans_method=trans_method
+                )
+        else:
+            df = self.transformers[i].inverse_transform(df)
+        if not isinstance(df, pd.DataFrame):
+            df = pd.DataFrame(df, index=self.df_index, columns=self.df_colnames)
+        elif c_trans_n in ["FastICA", "PCA"]:
+            self.df_colnames = df.columns
+        return df
+
+    def inverse_transform_stacked(
+        self,
+        arr,
+        index,
+        columns,
+        trans_method: str = "forecast",
+        bounds=None,
+        fillzero=None,
+    ):
+        """Undo the madness on several forecasts at once, ie point, lower and upper, or many quantiles.
+
+        Each transformer is inverted once on the whole stack where it has an
+        inverse_transform_stacked method (or is an sklearn scaler), otherwise per slice.
+        Transformers with different handling of bounds, like AlignLastValue, use the bounds mask.
+
+        Args:
+            arr (np.array): of shape (n, observations, series), ie (3, forecast_length, series)
+            index (pd.Index): index of the observations axis
+            columns (pd.Index): columns of the series axis
+            trans_method (str): 'forecast' or 'original' passed through
+            bounds (list): bool for each of n, True if that slice is an upper/lower bound
+                default is the first slice is the point forecast and all others are bounds
+            fillzero (bool): or list of bool for each of n, if inverse returns NaN, fill with zero
+                default fills only the bounds, as in model prediction
+
+        Returns:
+            np.array of shape (n, observations, series), with columns in .df_colnames
+        """
+        arr = np.asarray(arr)
+        if not np.issubdtype(arr.dtype, np.floating):
+            arr = arr.astype(float)
+        n = arr.shape[0]
+        if bounds is None:
+            bounds = [False] + [True] * (n - 1)
+        bounds = np.asarray(bounds, dtype=bool)
+        if fillzero is None:
+            fillzero = bounds
+        fillzero = np.broadcast_to(np.asarray(fillzero, dtype=bool), (n,))
+        self.df_index = index
+        self.df_colnames = columns
+        fused = getattr(self, "fused_fit", False)
+        try:
+            for i in sorted(self.transformations.keys(), reverse=True):
+                c_trans_n = self.transformations[i]
+                transformer = self.transformers[i]
+                if fused:
+                    arr = self._array_step(transformer, arr, "inverse", trans_method)
+                elif hasattr(transformer, "inverse_transform_stacked"):
+                    arr = transformer.inverse_transform_stacked(
+                        arr,
+                        self.df_index,
+                        self.df_colnames,
+                        trans_method=trans_method,
+                        bounds=bounds,
+                    )
+                elif c_trans_n in external_transformers:
+                    # row-wise sklearn scalers, only accept 2d arrays
+                    shape = arr.shape
+                    arr = transformer.inverse_transform(
+                        arr.reshape(-1, shape[-1])
+                    ).reshape(shape)
+                else:
+                    columns = self.df_colnames
+                    result = []
+                    for j in range(n):
+                        df = pd.DataFrame(arr[j], index=self.df_index, columns=columns)
+                        result.append(
+                            self._inverse_step(i, df, trans_method, bounds[j])
+                        )
+                    self.df_colnames = result[0].columns
+                    arr = np.stack([x.to_numpy() for x in result])
+        except Exception as e:
+            raise Exception(f"Transformer {c_trans_n} failed on inverse") from e
+
+        if fillzero.any():
+            arr = np.where(fillzero[:, None, None] & np.isnan(arr), 0, arr)
+        return arr
+
 
 def get_transformer_params(transformer: str = "EmptyTransformer", method: str = None):
     """Retrieve new random params for new Transformers."""
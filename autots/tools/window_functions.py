@@ -234,6 +234,56 @@ def window_maker_3(array, window_size: int, **kwargs):
     return x
 
 
+def nan_euclidean_window_distances(array, ends, window_sizes, max_cells: int = 1000000):
+    """NaN aware euclidean distance of many windows to the final window, per series, vectorized.
+
+    Matches sklearn nan_euclidean_distances run separately for each series and window:
+    sqrt(weight * squared distance over present coordinates), weight = window size / number present.
+    All window sizes share the same window end points and are computed in one pass with a
+    cumulative sum over offsets back from the end.
+
+    Args:
+        array (np.array): in shape of (num_obs, num_series)
+        ends (np.array): exclusive end position of each compared window
+        window_sizes (list): one or more window lengths to compare
+        max_cells (int): maximum size of the intermediate array, windows are processed in blocks to stay under this
+
+    Returns:
+        np.array of shape (len(window_sizes), len(ends), num_series)
+    """
+    if isinstance(window_sizes, int):
+        window_sizes = [window_sizes]
+    array = np.asarray(array, dtype=float)
+    ends = np.asarray(ends)
+    w_max = max(window_sizes)
+    offsets = np.arange(1, w_max + 1)
+    # offset 0 is the final point of each window
+    target = array[array.shape[0] - offsets]
+    num_series = array.shape[1]
+    chunk = max(1, int(max_cells // (w_max * num_series)))
+    sizes = np.asarray(window_sizes) - 1
+    weights = np.asarray(window_sizes, dtype=float)[np.newaxis, :, np.newaxis]
+    result = np.empty((len(window_sizes), len(ends), num_series))
+    for i in range(0, len(ends), chunk):
+        block = ends[i : i + chunk]
+        diff = array[block[:, np.newaxis] - offsets]
+        diff -= target
+        missing = np.isnan(diff)
+        diff[missing] = 0
+        diff *= diff
+        if len(window_sizes) == 1:
+            sq = diff.sum(axis=1)[:, np.newaxis]
+            count = w_max - missing.sum(axis=1)[:, np.newaxis]
+        else:
+            sq = np.cumsum(diff, axis=1)[:, sizes]
+            count = np.cumsum(~missing, axis=1)[:, sizes]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dist = np.sqrt(sq * weights / count)
+        dist[count == 0] = np.nan
+        result[:, i : i + chunk] = np.moveaxis(dist, 1, 0)
+    return result
+
+
 def retrieve_closest_indices(
     df,
     num_indices,
@@ -252,7 +302,8 @@ def retrieve_closest_indices(
         df (pd.DataFrame): source data in wide format
         num_indices (int): number of indices to return
         forecast_length (int): length of forecast
-        window_size (int): length of comparison
+        window_size (int): length of comparison, or a list of lengths, compared with windows
+            ending at the same point and averaged (as root mean squared distance for nan_euclidean)
         distance_metric (str): distance measure from scipy and nan_euclidean
         stride_size (int): length of spacing between windows
         start_index (int): index to begin creation of windows from
@@ -261,6 +312,8 @@ def retrieve_closest_indices(
     array = df.to_numpy()
     index = df.index
     tlt_len = array.shape[0]
+    window_sizes = window_size if isinstance(window_size, list) else [window_size]
+    window_size = max(window_sizes)
     combined_window_size = window_size + forecast_length
     # remove extra so last segment not included at all
     # have the last window end evenly
@@ -281,58 +334,46 @@ def retrieve_closest_indices(
         stride_size=stride_size,
         skip_size=1,
     )
+    window_ends = window_idxs[:, 0] + window_size
+    if include_differenced:
+        array_diff = np.diff(array, n=1, axis=0)
+        array_diff = np.concatenate([array_diff[0:1], array_diff])
     # calculate distance between all points and last window of history
     if distance_metric == "nan_euclidean":
-        from sklearn.metrics.pairwise import nan_euclidean_distances
-
-        res = np.array(
-            [
-                nan_euclidean_distances(
-                    array[:, a][window_idxs[:, :window_size]],
-                    array[(tlt_len - window_size) : tlt_len, a].reshape(1, -1),
-                )
-                for a in range(array.shape[1])
-            ]
-        )
+        # shape of (num series, num windows, 1) as from pairwise distances
+        res = nan_euclidean_window_distances(array, window_ends, window_sizes)
         if include_differenced:
-            array_diff = np.diff(array, n=1, axis=0)
-            array_diff = np.concatenate([array_diff[0:1], array_diff])
-            res_diff = np.array(
-                [
-                    nan_euclidean_distances(
-                        array_diff[:, a][window_idxs[:, :window_size]],
-                        array_diff[(tlt_len - window_size) : tlt_len, a].reshape(1, -1),
-                    )
-                    for a in range(array_diff.shape[1])
-                ]
+            res_diff = nan_euclidean_window_distances(
+                array_diff, window_ends, window_sizes
             )
             res = np.mean([res, res_diff], axis=0)
+        if len(window_sizes) > 1:
+            scale = np.sqrt(window_sizes)[:, np.newaxis, np.newaxis]
+            res = np.mean(res / scale, axis=0)
+        else:
+            res = res[0]
+        res = res.T[..., np.newaxis]
     else:
         from scipy.spatial.distance import cdist
 
-        res = np.array(
-            [
-                cdist(
-                    array[:, a][window_idxs[:, :window_size]],
-                    array[(tlt_len - window_size) : tlt_len, a].reshape(1, -1),
-                    metric=distance_metric,
-                )
-                for a in range(array.shape[1])
-            ]
-        )
-        if include_differenced:
-            array_diff = np.diff(array, n=1, axis=0)
-            array_diff = np.concatenate([array_diff[0:1], array_diff])
-            res_diff = np.array(
+        def window_cdist(source, size):
+            idx = window_ends[:, np.newaxis] - size + np.arange(size)
+            return np.array(
                 [
                     cdist(
-                        array_diff[:, a][window_idxs[:, :window_size]],
-                        array_diff[(tlt_len - window_size) : tlt_len, a].reshape(1, -1),
+                        source[:, a][idx],
+                        source[(tlt_len - size) : tlt_len, a].reshape(1, -1),
                         metric=distance_metric,
                     )
-                    for a in range(array_diff.shape[1])
+                    for a in range(source.shape[1])
                 ]
             )
+
+        res = np.mean([window_cdist(array, size) for size in window_sizes], axis=0)
+        if include_differenced:
+            res_diff = np.mean(
+                [window_cdist(array_diff, size) for size in window_sizes], axis=0
+            )
             res = np.mean([res, res_diff], axis=0)
     # find the lowest distance historical windows
     res_sum = np.nansum(res, axis=0)
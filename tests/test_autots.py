@@ -325,6 +325,442 @@ class AutoTSTest(unittest.TestCase):
         self.assertEqual(forecast_length, len(forecasts_df.index))
         self.assertTrue((expected_idx == pd.DatetimeIndex(forecasts_df.index)).all())
 
+    def test_float32(self):
+        print("Starting test_float32")
+        df = load_daily(long=False).iloc[:, 0:5]
+        forecast_length = 7
+        model = AutoTS(
+            forecast_length=forecast_length,
+            max_generations=1,
+            model_list=['LastValueNaive', 'SeasonalNaive', 'GLS', 'MetricMotif'],
+            transformer_list="superfast",
+            ensemble="simple",
+            num_validations=1,
+            n_jobs=1,
+            verbose=-1,
+            dtype="float32",
+        )
+        model = model.fit(df)
+        prediction = model.predict(verbose=0)
+        self.assertTrue((model.df_wide_numeric.dtypes == np.float32).all())
+        self.assertTrue((prediction.forecast.dtypes == np.float32).all())
+        self.assertTrue((prediction.upper_forecast.dtypes == np.float32).all())
+        self.assertEqual(prediction.forecast.shape, (forecast_length, df.shape[1]))
+        self.assertFalse(prediction.forecast.isna().any().any())
+
+    def test_multiple_intervals(self):
+        print("Starting test_multiple_intervals")
+        df = load_daily(long=False).iloc[:, 0:5]
+        model = AutoTS(
+            forecast_length=7,
+            max_generations=1,
+            model_list=['LastValueNaive', 'SeasonalNaive', 'AverageValueNaive', 'GLS'],
+            transformer_list="superfast",
+            ensemble="simple",
+            num_validations=1,
+            n_jobs=1,
+            verbose=-1,
+        )
+        model = model.fit(df)
+        intervals = [0.8, 0.98]
+        predictions = model.predict(prediction_interval=intervals, verbose=0)
+        self.assertEqual(list(predictions.keys()), ['0.8', '0.98'])
+        for interval in intervals:
+            prediction = predictions[str(interval)]
+            single = model.predict(prediction_interval=interval, verbose=0)
+            self.assertEqual(prediction.quantiles, [0.01, 0.1, 0.5, 0.9, 0.99])
+            self.assertEqual(prediction.quantile_forecast.shape, (5, 7, df.shape[1]))
+            self.assertTrue(np.allclose(prediction.quantile(0.5), prediction.forecast))
+            # matches predicting each interval separately
+            self.assertTrue(np.allclose(prediction.forecast, single.forecast))
+            self.assertTrue(np.allclose(prediction.upper_forecast, single.upper_forecast))
+            self.assertTrue(np.allclose(prediction.lower_forecast, single.lower_forecast))
+
+    def test_interval_fit_model_intervals(self):
+        print("Starting test_interval_fit_model_intervals")
+        df = load_daily(long=False).iloc[-300:, 0:4].ffill().bfill()
+        # Cassandra uses prediction_interval in fit, so each interval must be a refit
+        params = {
+            "preprocessing_transformation": None,
+            "scaling": "BaseScaler",
+            "past_impacts_intervention": None,
+            "seasonalities": [7],
+            "ar_lags": None,
+            "ar_interaction_seasonality": None,
+            "anomaly_detector_params": None,
+            "anomaly_intervention": None,
+            "holiday_detector_params": None,
+            "holiday_countries_used": False,
+            "multivariate_feature": None,
+            "multivariate_transformation": None,
+            "regressor_transformation": None,
+            "regressors_used": False,
+            "linear_model": {
+                "model": "lstsq",
+                "lambda": None,
+                "recency_weighting": None,
+            },
+            "randomwalk_n": None,
+            "trend_window": 15,
+            "trend_standin": None,
+            "trend_anomaly_detector_params": None,
+            "trend_transformation": {},
+            "trend_model": {"Model": "LastValueNaive", "ModelParameters": {}},
+            "trend_phi": None,
+        }
+        args = {
+            "model_name": "Cassandra",
+            "model_param_dict": params,
+            "model_transform_dict": {},
+            "df_train": df,
+            "forecast_length": 7,
+            "verbose": 0,
+        }
+        combined = model_forecast(prediction_interval=[0.5, 0.9], **args)
+        for interval in [0.5, 0.9]:
+            single = model_forecast(prediction_interval=interval, **args)
+            lower_q, upper_q = (1 - interval) / 2, (1 + interval) / 2
+            self.assertTrue(
+                np.allclose(combined.quantile(upper_q), single.upper_forecast)
+            )
+            self.assertTrue(
+                np.allclose(combined.quantile(lower_q), single.lower_forecast)
+            )
+
+    def test_export_artifact(self):
+        print("Starting test_export_artifact")
+        import os
+        import tempfile
+        from autots import load_artifact
+
+        df = load_daily(long=False).iloc[:, 0:5]
+        model = AutoTS(
+            forecast_length=7,
+            max_generations=1,
+            model_list=['LastValueNaive', 'SeasonalNaive', 'AverageValueNaive', 'GLS'],
+            transformer_list="superfast",
+            ensemble=["simple", "horizontal-max"],
+            num_validations=1,
+            n_jobs=1,
+            verbose=-1,
+        )
+        model = model.fit(df)
+        prediction = model.predict(verbose=0)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "artifact.pickle")
+            model.export_artifact(filename)
+            artifact = load_artifact(filename)
+        served = artifact.predict()
+        self.assertTrue(np.allclose(served.forecast, prediction.forecast))
+        self.assertTrue(np.allclose(served.upper_forecast, prediction.upper_forecast))
+        self.assertTrue(np.allclose(served.lower_forecast, prediction.lower_forecast))
+        # repeated forecasts come from the same fitted model
+        intervals = artifact.predict(prediction_interval=[0.8, 0.9])
+        self.assertTrue(np.allclose(intervals['0.9'].forecast, prediction.forecast))
+        self.assertTrue(
+            np.allclose(intervals['0.9'].upper_forecast, prediction.upper_forecast)
+        )
+        self.assertEqual(artifact.predict(forecast_length=3, just_point_forecast=True).shape, (3, df.shape[1]))
+
+    def test_time_budget(self):
+        print("Starting test_time_budget")
+        from autots.evaluator.auto_model import TemplateWizard
+
+        df = load_daily(long=False).iloc[:, 0:5]
+        model = AutoTS(
+            forecast_length=7,
+            max_generations=50,
+            model_list=['LastValueNaive', 'SeasonalNaive', 'AverageValueNaive', 'GLS'],
+            transformer_list="superfast",
+            ensemble=None,
+            num_validations=1,
+            n_jobs=1,
+            verbose=-1,
+            time_budget=1,
+            per_model_timeout=60,
+        )
+        model = model.fit(df)
+        generations = model.initial_results.model_results['Generation'].max()
+        self.assertLess(generations, 50)
+        self.assertEqual(model.predict(verbose=0).forecast.shape, (7, df.shape[1]))
+
+        # models exceeding the timeout are recorded like other failures
+        df_train = df.iloc[:-7]
+        df_test = df.iloc[-7:]
+        template = model.best_model[model.template_cols]
+        result = TemplateWizard(
+            template,
+            df_train,
+            df_test,
+            weights={col: 1 for col in df.columns},
+            forecast_length=7,
+            template_cols=model.template_cols,
+            per_model_timeout=0.0001,
+        )
+        self.assertIn("TimeoutError", result.model_results['Exceptions'].iloc[0])
+        result = TemplateWizard(
+            template,
+            df_train,
+            df_test,
+            weights={col: 1 for col in df.columns},
+            forecast_length=7,
+            template_cols=model.template_cols,
+            per_model_timeout=60,
+        )
+        self.assertTrue(result.model_results['Exceptions'].isna().all())
+
+    def test_stop_process_group(self):
+        print("Starting test_stop_process_group")
+        import os
+        import subprocess
+        from autots.evaluator.auto_model import _stop_process_group
+
+        if not os.path.exists("/proc"):
+            self.skipTest("needs process groups and /proc")
+
+        def running(pid):
+            # a killed, orphaned process may be left unreaped as a zombie
+            try:
+                with open(f"/proc/{pid}/stat") as f:
+                    return f.read().split(") ")[-1][0] != "Z"
+            except FileNotFoundError:
+                return False
+
+        # a worker leading its own process group, which has started a child of its own
+        worker = subprocess.Popen(
+            ["sh", "-c", "sleep 60 & echo $!; wait"],
+            stdout=subprocess.PIPE,
+            start_new_session=True,
+            text=True,
+        )
+        grandchild = int(worker.stdout.readline())
+
+        def join(timeout=None):
+            try:
+                worker.wait(timeout)
+            except subprocess.TimeoutExpired:
+                pass
+
+        worker.join = join
+        worker.is_alive = lambda: worker.poll() is None
+        _stop_process_group(worker, grace=5)
+        worker.stdout.close()
+        self.assertIsNotNone(worker.poll())
+        for _ in range(50):
+            if not running(grandchild):
+                break
+            time.sleep(0.1)
+        self.assertFalse(running(grandchild))
+
+    def test_schedule_template(self):
+        print("Starting test_schedule_template")
+        from autots.evaluator.auto_model import schedule_template
+
+        past = pd.DataFrame({
+            'Model': ['GLS', 'GLS', 'ETS'],
+            'ModelParameters': ['{}', '{"a": 1}', '{}'],
+            'TransformationParameters': ['{}', '{}', '{}'],
+            'TotalRuntime': pd.to_timedelta([1, 3, 10], unit='s'),
+        })
+        template = pd.DataFrame({
+            'Model': ['ETS', 'GLS', 'ARIMA', 'GLS'],
+            'ModelParameters': ['{}', '{"a": 2}', '{}', '{}'],
+            'TransformationParameters': ['{}', '{}', '{}', '{}'],
+            'Ensemble': 0,
+        })
+        # expected timeouts skipped, classes take turns, cheapest first, unseen last
+        scheduled = schedule_template(template, past, time_limit=5)
+        self.assertEqual(scheduled.index.tolist(), [3, 2, 1])
+        scheduled = schedule_template(template, past)
+        self.assertEqual(scheduled.index.tolist(), [3, 0, 2, 1])
+        # an expensive class is not left behind every cheap model
+        template = pd.DataFrame({
+            'Model': ['GLS'] * 5 + ['ETS'],
+            'ModelParameters': ['{}'] * 6,
+            'TransformationParameters': ['{}'] * 6,
+            'Ensemble': 0,
+        })
+        scheduled = schedule_template(template, past)
+        self.assertEqual(scheduled['Model'].tolist()[:2], ['GLS', 'ETS'])
+
+    def test_template_eval_object(self):
+        print("Starting test_template_eval_object")
+        import copy
+        import pickle
+        from autots.evaluator.auto_model import TemplateEvalObject
+
+        results = TemplateEvalObject()
+        for i in range(5):
+            new = TemplateEvalObject(
+                model_results=pd.DataFrame({'ID': [str(i)], 'smape': [float(i)]}),
+                per_series_mae=pd.DataFrame({'a': [i], 'b': [i * 2]}, index=[str(i)]),
+                model_count=1,
+            )
+            results = results.concat(new)
+            # later edits of the added object don't change accumulated results
+            new.model_results['smape'] = -1.0
+        self.assertEqual(results.model_count, 5)
+        self.assertEqual(results.model_results['smape'].tolist(), [0.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(results.model_results.index.tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(results.per_series_mae.index.tolist(), ['0', '1', '2', '3', '4'])
+        self.assertTrue(results.per_timestamp_smape.empty)
+        # materialized once, then reused until the next append
+        materialized = results.model_results
+        self.assertIs(results.model_results, materialized)
+        results.append_frame('model_results', pd.DataFrame({'ID': ['5']}))
+        self.assertIsNot(results.model_results, materialized)
+        self.assertEqual(results.model_results.shape[0], 6)
+        self.assertIs(results.model_results, results.model_results)
+        results.model_results = materialized
+        # in place edits persist, and a shallow copy can be reassigned independently
+        results.model_results['Score'] = 1
+        copied = copy.copy(results)
+        copied.model_results = copied.model_results.head(2)
+        self.assertEqual(results.model_results.shape, (5, 3))
+        loaded = pickle.loads(pickle.dumps(results))
+        self.assertTrue(loaded.model_results.equals(results.model_results))
+
+    def test_surrogate_pool(self):
+        print("Starting test_surrogate_pool")
+        from autots.evaluator.auto_model import surrogate_screen_template
+
+        df = load_daily(long=False).iloc[:, 0:5]
+        model = AutoTS(
+            forecast_length=7,
+            max_generations=2,
+            model_list=['LastValueNaive', 'SeasonalNaive', 'AverageValueNaive', 'GLS'],
+            transformer_list="superfast",
+            ensemble=None,
+            num_validations=1,
+            n_jobs=1,
+            verbose=-1,
+            surrogate_pool=3,
+        )
+        model = model.fit(df)
+        results = model.initial_results.model_results
+        self.assertEqual(results['Generation'].max(), 2)
+        candidates = results[results['Ensemble'] == 0][model.template_cols]
+        candidates = candidates.drop_duplicates()
+        chosen = surrogate_screen_template(candidates, results, n=10)
+        self.assertEqual(chosen.shape[0], 10)
+        self.assertEqual(chosen.index.nunique(), 10)
+
+    def test_fidelity_levels(self):
+        print("Starting test_fidelity_levels")
+        from autots.evaluator.auto_model import TemplateEvalObject
+
+        df = load_daily(long=False).iloc[:, 0:6]
+        model = AutoTS(
+            forecast_length=7,
+            max_generations=2,
+            model_list=['LastValueNaive', 'SeasonalNaive', 'AverageValueNaive', 'GLS'],
+            transformer_list="superfast",
+            ensemble=None,
+            num_validations=1,
+            n_jobs=1,
+            verbose=-1,
+            fidelity_levels=[0.5],
+        )
+        model = model.fit(df)
+        low = model.fidelity_results.model_results
+        full = model.initial_results.model_results
+        self.assertEqual(low['Fidelity'].unique().tolist(), [0.5])
+        for gen in [1, 2]:
+            n_low = (low['Generation'] == gen).sum()
+            n_full = ((full['Generation'] == gen) & (full['ValidationRound'] == 0)).sum()
+            self.assertLessEqual(n_full, np.ceil(n_low / 2))
+        self.assertEqual(model.predict(verbose=0).forecast.shape, (7, df.shape[1]))
+        # regressors come from the arguments, not from state set elsewhere in fit
+        df = df.ffill().bfill()
+        regressor = df.iloc[:, 0:1].rename(columns=lambda x: "regr")
+        model.future_regressor_train = None
+        template = pd.DataFrame({
+            'Model': ['DatepartRegression', 'LastValueNaive'],
+            'ModelParameters': [json.dumps({
+                'regression_model': {'model': 'ElasticNet', 'model_params': {}},
+                'datepart_method': 'simple',
+                'regression_type': 'User',
+            }), '{}'],
+            'TransformationParameters': ['{}', '{}'],
+            'Ensemble': 0,
+        })
+        model.fidelity_results = TemplateEvalObject()
+        promoted = model._fidelity_screen(
+            template,
+            df.iloc[:-7],
+            df.iloc[-7:],
+            weights={},
+            future_regressor_train=regressor.iloc[:-7],
+            future_regressor_forecast=regressor.iloc[-7:],
+        )
+        results = model.fidelity_results.model_results
+        self.assertTrue(results['Exceptions'].isna().all())
+        self.assertEqual(promoted.shape[0], 1)
+
+    def test_parallel_validation(self):
+        print("Starting test_parallel_validation")
+        df = load_daily(long=False).iloc[:, 0:4]
+        args = {
+            "forecast_length": 7,
+            "max_generations": 1,
+            "model_list": ['LastValueNaive', 'SeasonalNaive', 'AverageValueNaive'],
+            "transformer_list": "superfast",
+            "ensemble": None,
+            "num_validations": 2,
+            "n_jobs": 2,
+            "verbose": -1,
+            "random_seed": 2022,
+            # runtime would make scores differ between otherwise identical runs
+            "metric_weighting": {
+                "smape_weighting": 5,
+                "mae_weighting": 2,
+                "spl_weighting": 3,
+            },
+        }
+        model = AutoTS(parallel_validation=True, **args).fit(df)
+        res = model.initial_results.model_results
+        rounds = res.loc[res['ValidationRound'] > 0, 'ValidationRound'].tolist()
+        # merged in order of validation round, all candidates in each round
+        self.assertEqual(rounds, sorted(rounds))
+        self.assertEqual(rounds.count(1), rounds.count(2))
+        self.assertEqual(model.validation_results.model_results['Runs'].max(), 3)
+        self.assertEqual(model.predict(verbose=0).forecast.shape, (7, df.shape[1]))
+        # same results as running the validations one after another
+        sequential = AutoTS(parallel_validation=False, **args).fit(df)
+        cols = ['ID', 'ValidationRound', 'Score']
+        seq_res = sequential.initial_results.model_results[cols]
+        self.assertTrue(
+            res[cols].reset_index(drop=True).equals(seq_res.reset_index(drop=True))
+        )
+        self.assertEqual(model.best_model_id, sequential.best_model_id)
+        # not silently ignored when it cannot be used
+        with self.assertWarns(UserWarning):
+            AutoTS(parallel_validation=True, validation_pruning=0.5, **args)
+
+    def test_validation_pruning(self):
+        print("Starting test_validation_pruning")
+        df = load_daily(long=False).iloc[:, 0:5]
+        model = AutoTS(
+            forecast_length=7,
+            max_generations=1,
+            model_list=['LastValueNaive', 'SeasonalNaive', 'AverageValueNaive', 'GLS'],
+            transformer_list="superfast",
+            ensemble=["horizontal-max"],
+            num_validations=3,
+            models_to_validate=12,
+            validation_pruning=0.5,
+            n_jobs=1,
+            verbose=-1,
+        )
+        model = model.fit(df)
+        results = model.initial_results.model_results
+        rounds = results[results['Ensemble'] == 0].groupby('ValidationRound')['ID'].nunique()
+        self.assertLess(rounds[3], rounds[1])
+        self.assertTrue(set(results.loc[results['ValidationRound'] == 3, 'ID']).issubset(
+            results.loc[results['ValidationRound'] == 2, 'ID']
+        ))
+        self.assertEqual(model.predict(verbose=0).forecast.shape, (7, df.shape[1]))
+
     def test_all_models_load(self):
         print("Starting test_all_models_load")
         # make sure it can at least load a template of all models
@@ -494,6 +930,300 @@ class ModelTest(unittest.TestCase):
             )
         """
 
+    def test_motif_simulation(self):
+        print("Starting test_motif_simulation")
+        from autots.models.basics import MotifSimulation
+
+        df = load_monthly(long=False)[['CSUSHPISA', 'EMVOVERALLEMV', 'EXCAUS']].ffill().bfill()
+        for shared in [False, True]:
+            results = []
+            for block_size in [None, 1]:
+                np.random.seed(300)
+                model = MotifSimulation(
+                    phrase_len=10, shared=shared, block_size=block_size, verbose=0
+                ).fit(df)
+                results.append(model.predict(forecast_length=5))
+            prediction = results[0]
+            self.assertEqual(prediction.forecast.shape, (5, df.shape[1]))
+            self.assertFalse(prediction.forecast.isna().any().any())
+            self.assertTrue((prediction.upper_forecast >= prediction.lower_forecast).all().all())
+            # memory blocking does not change results
+            self.assertTrue(np.allclose(prediction.forecast, results[1].forecast))
+            self.assertTrue(np.allclose(prediction.upper_forecast, results[1].upper_forecast))
+
+    def test_back_forecast_parallel(self):
+        print("Starting test_back_forecast_parallel")
+        from autots.evaluator.auto_model import back_forecast
+
+        df = load_daily(long=False).iloc[:, 0:4]
+        args = {
+            'model_name': "SeasonalNaive",
+            'model_param_dict': {"method": "mean", "lag_1": 7, "lag_2": 1},
+            'model_transform_dict': {
+                "fillna": "ffill",
+                "transformations": {"0": "DifferencedTransformer"},
+                "transformation_params": {"0": {}},
+            },
+            'n_splits': 4,
+            'forecast_length': 14,
+            'n_jobs': 2,
+        }
+        sequential = back_forecast(df, **args)
+        parallel = back_forecast(df, parallel=True, **args)
+        self.assertTrue((sequential.forecast.index == df.index).all())
+        self.assertTrue(sequential.forecast.equals(parallel.forecast))
+        self.assertTrue(sequential.upper_forecast.equals(parallel.upper_forecast))
+        self.assertTrue(sequential.lower_forecast.equals(parallel.lower_forecast))
+
+    def test_naive_statistics(self):
+        print("Starting test_naive_statistics")
+        from autots.models.basics import naive_statistics, SeasonalNaive
+
+        df = load_monthly(long=False)[['CSUSHPISA', 'EMVOVERALLEMV', 'EXCAUS']]
+        stats = naive_statistics(df)
+        # identical data reuses the same statistics, changed data does not
+        median = stats.average("median")
+        self.assertIs(median, naive_statistics(df.copy()).average("median"))
+        self.assertFalse(median.flags.writeable)
+        df_changed = df.copy()
+        df_changed.iloc[-1, 0] = -999.0
+        self.assertIsNot(median, naive_statistics(df_changed).average("median"))
+        for method in ["mean", "median"]:
+            # matches grouping by position in the seasonal cycle
+            tile_index = np.tile(np.arange(12), int(np.ceil(df.shape[0] / 12)))
+            grouped = df.set_axis(tile_index[-df.shape[0]:]).groupby(level=0)
+            expected = grouped.mean() if method == "mean" else grouped.median()
+            self.assertTrue(
+                np.allclose(stats.seasonal(method, 12), expected, equal_nan=True)
+            )
+        self.assertTrue(
+            np.allclose(stats.average("median"), df.median(), equal_nan=True)
+        )
+        self.assertTrue(
+            np.allclose(
+                stats.average("mode"),
+                df.mode().iloc[0].fillna(df.median()),
+                equal_nan=True,
+            )
+        )
+        original = df.copy()
+        SeasonalNaive(lag_1=12, lag_2=3, method="mean").fit(df)
+        self.assertTrue(original.equals(df))
+
+    def test_statistic_cache(self):
+        print("Starting test_statistic_cache")
+        from autots.tools.cache import StatisticCache, data_key
+
+        cache = StatisticCache(max_bytes=2000)
+        arr = np.arange(100, dtype=float)
+        self.assertEqual(data_key(arr), data_key(arr.copy()))
+        self.assertNotEqual(data_key(arr), data_key(arr + 1))
+        first = cache.get("a", lambda: arr * 2)
+        self.assertIs(first, cache.get("a", lambda: arr * 3))
+        self.assertFalse(first.flags.writeable)
+        # least recently used entries are dropped to stay under max_bytes
+        cache.get("b", lambda: (arr, arr.copy()))
+        self.assertEqual(cache.nbytes, 1600)
+        self.assertEqual(len(cache), 1)
+        # results larger than the bound are returned but not stored
+        cache.get("c", lambda: np.zeros(1000))
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
+    def test_batch_decompose(self):
+        print("Starting test_batch_decompose")
+        from statsmodels.tsa.seasonal import seasonal_decompose
+        from autots.tools.seasonal import batch_decompose
+
+        df = load_daily(long=False).iloc[:, 0:5].ffill().bfill()
+        # small max_cells to also check chunking of columns
+        result = batch_decompose(df, "seasonal_decompose", max_cells=df.shape[0] * 2)
+        for part in ["trend", "seasonal", "resid"]:
+            expected = df.apply(lambda x: getattr(seasonal_decompose(x), part))
+            self.assertTrue(
+                np.allclose(result[part], expected, equal_nan=True), msg=part
+            )
+        result = batch_decompose(df.iloc[:, 0:2], "STL", seasonal=7, n_jobs=2)
+        total = result["trend"] + result["seasonal"] + result["resid"]
+        self.assertTrue(np.allclose(total, df.iloc[:, 0:2]))
+
+    def test_stl_filter_params(self):
+        print("Starting test_stl_filter_params")
+        from autots.tools.transform import GeneralTransformer, get_transformer_params
+
+        params = get_transformer_params("STLFilter")
+        self.assertIn("decomp_type", params)
+        transformer = GeneralTransformer.retrieve_transformer(
+            "STLFilter", {"decomp_type": "seasonal_decompose", "part": "trend"}
+        )
+        self.assertEqual(transformer.decomp_type, "seasonal_decompose")
+
+    def test_sintrend_vectorized(self):
+        print("Starting test_sintrend_vectorized")
+        from autots.tools.transform import (
+            SinTrend,
+            GeneralTransformer,
+            get_transformer_params,
+        )
+
+        t = np.arange(400)
+        df = pd.DataFrame(
+            {i: 3 * np.sin(2 * np.pi * t / (20 + i) + i) + 10 for i in range(5)},
+            index=pd.date_range("2020-01-01", periods=400, freq="D"),
+        )
+        transformer = SinTrend(method="fft")
+        result = transformer.fit_transform(df)
+        self.assertEqual(
+            transformer.sin_params.columns.tolist(),
+            ["amp", "omega", "phase", "offset"],
+        )
+        self.assertTrue(np.allclose(transformer.sin_params["amp"], 3, atol=0.05))
+        self.assertTrue(np.allclose(result, 10, atol=0.1))
+        self.assertTrue(np.allclose(transformer.inverse_transform(result), df))
+        # template params reach the transformer
+        self.assertEqual(get_transformer_params("SinTrend", "fast"), {"method": "fft"})
+        transformer = GeneralTransformer.retrieve_transformer(
+            "SinTrend", {"method": "fft"}
+        )
+        self.assertEqual(transformer.method, "fft")
+        transformer = GeneralTransformer(
+            fillna="ffill",
+            transformations={"0": "SinTrend"},
+            transformation_params={"0": {"method": "fft"}},
+        )
+        self.assertTrue(np.allclose(transformer.fit_transform(df), result))
+
+    def test_randomized_svt(self):
+        print("Starting test_randomized_svt")
+        from autots.models.matrix_var import svt_tnn, svt_tnn_randomized
+
+        rng = np.random.default_rng(0)
+        mat = rng.normal(size=(300, 5)) @ rng.normal(size=(5, 400)) * 10
+        mat += rng.normal(size=mat.shape) * 0.01
+        expected = svt_tnn(mat, 1.0, 1)
+        result, basis, rank = svt_tnn_randomized(mat, 1.0, 1, rank=2)
+        self.assertEqual(rank, 5)
+        self.assertTrue(np.allclose(result, expected, atol=1e-6))
+        # warm started from the previous subspace
+        result, _, _ = svt_tnn_randomized(mat, 1.0, 1, rank=rank, basis=basis)
+        self.assertTrue(np.allclose(result, expected, atol=1e-6))
+
+    def test_matrix_var_models(self):
+        print("Starting test_matrix_var_models")
+        from autots.models.matrix_var import RRVAR, MAR, TMF, LATC
+
+        df = load_daily(long=False).iloc[-200:, 0:6].ffill().bfill()
+        models = {
+            RRVAR: {},
+            MAR: {},
+            TMF: {},
+            LATC: {"svd_method": "randomized"},
+        }
+        for model_class, params in models.items():
+            with self.subTest(model=model_class.__name__):
+                prediction = model_forecast(
+                    model_name=model_class.__name__,
+                    model_param_dict=params,
+                    model_transform_dict={},
+                    df_train=df,
+                    forecast_length=7,
+                    verbose=0,
+                )
+                self.assertEqual(prediction.forecast.shape, (7, 6))
+                self.assertFalse(prediction.forecast.isnull().any().any())
+                self.assertEqual(
+                    set(prediction.model_parameters),
+                    set(model_class(**params).get_params()),
+                )
+
+    def test_nan_euclidean_window_distances(self):
+        print("Starting test_nan_euclidean_window_distances")
+        from sklearn.metrics.pairwise import nan_euclidean_distances
+        from autots.tools.window_functions import nan_euclidean_window_distances
+
+        rng = np.random.default_rng(0)
+        arr = rng.normal(size=(200, 4))
+        arr[rng.random(arr.shape) < 0.1] = np.nan
+        ends = np.arange(20, 180, 3)
+        # several window sizes computed in one pass, with small blocks
+        result = nan_euclidean_window_distances(arr, ends, [5, 20], max_cells=500)
+        for i, size in enumerate([5, 20]):
+            for col in range(arr.shape[1]):
+                expected = nan_euclidean_distances(
+                    np.stack([arr[e - size : e, col] for e in ends]),
+                    arr[-size:, col].reshape(1, -1),
+                )[:, 0]
+                self.assertTrue(
+                    np.allclose(result[i, :, col], expected, equal_nan=True)
+                )
+
+    def test_fused_transformers(self):
+        print("Starting test_fused_transformers")
+        from autots.tools.transform import GeneralTransformer
+
+        df = load_daily(long=False).iloc[:, 0:6]
+        params = {
+            "fillna": "ffill",
+            "transformations": {
+                0: "ClipOutliers",
+                1: "CenterLastValue",
+                2: "DifferencedTransformer",
+                3: "MinMaxScaler",
+            },
+            "transformation_params": {0: {"std_threshold": 3}, 1: {}, 2: {}, 3: {}},
+        }
+        results = []
+        for fused in [False, True]:
+            transformer = GeneralTransformer(**params, fused=fused)
+            transformed = transformer.fit_transform(df)
+            self.assertEqual(transformer.fused_fit, fused)
+            inversed = transformer.inverse_transform(transformed.tail(10) * 1.1)
+            results.append((transformed, transformer.transform(df), inversed))
+        for unfused, fused in zip(*results):
+            self.assertTrue(np.allclose(unfused, fused))
+            self.assertTrue(unfused.index.equals(fused.index))
+
+    def test_inverse_transform_stacked(self):
+        print("Starting test_inverse_transform_stacked")
+        from autots.tools.transform import GeneralTransformer
+
+        df = load_daily(long=False).iloc[:, 0:6].ffill().bfill()
+        train, test = df.iloc[:-14], df.iloc[-14:]
+        params = {
+            "fillna": "ffill",
+            "transformations": {
+                0: "Detrend",
+                1: "AlignLastValue",
+                2: "SeasonalDifference",
+                3: "QuantileTransformer",
+                4: "EWMAFilter",
+            },
+            "transformation_params": {
+                0: {},
+                1: {"method": "multiplicative", "strength": 0.7},
+                2: {"lag_1": 7},
+                3: {"n_quantiles": 100},
+                4: {"span": 3},
+            },
+        }
+        transformer = GeneralTransformer(**params).fit(train)
+        point = transformer.transform(test)
+        lower, upper = point * 0.9 - 1, point * 1.1 + 1
+        expected = [
+            transformer.inverse_transform(point),
+            transformer.inverse_transform(lower, fillzero=True, bounds=True),
+            transformer.inverse_transform(upper, fillzero=True, bounds=True),
+        ]
+        result = transformer.inverse_transform_stacked(
+            np.stack([point.to_numpy(), lower.to_numpy(), upper.to_numpy()]),
+            index=point.index,
+            columns=point.columns,
+        )
+        self.assertEqual(result.shape, (3, 14, 6))
+        for x, y in zip(expected, result):
+            self.assertTrue(np.allclose(x, y))
+
     def test_transforms(self):
         print("Starting test_transforms")
         n_jobs = 1
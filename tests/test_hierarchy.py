@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Test hierarchical reconciliation."""
+import unittest
+import numpy as np
+import pandas as pd
+from autots.tools.hierarchial import HierarchicalReconciler, summing_matrix
+from autots.models.base import PredictionObject
+
+
+class TestHierarchicalReconciler(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n_bottom = 24
+        self.hierarchy = pd.DataFrame(
+            {
+                "region": [f"r{i % 2}" for i in range(n_bottom)],
+                "store": [f"s{i % 6}" for i in range(n_bottom)],
+            },
+            index=[f"b{i}" for i in range(n_bottom)],
+        )
+        self.history = pd.DataFrame(
+            rng.gamma(2, 5, (60, n_bottom)), columns=self.hierarchy.index
+        )
+        self.noise = rng.normal(1, 0.1, (7, n_bottom + 9))
+
+    def test_summing_matrix(self):
+        S, agg_ids, bottom_ids = summing_matrix(self.hierarchy)
+        self.assertEqual(S.shape, (1 + 2 + 6 + 24, 24))
+        self.assertEqual(agg_ids[0], "total")
+        self.assertIn("region_r1", agg_ids)
+        self.assertEqual(bottom_ids, self.hierarchy.index.tolist())
+        self.assertTrue(np.all(np.asarray(S.sum(axis=1)).ravel()[:3] == [24, 12, 12]))
+
+    def test_reconcile_methods(self):
+        for method in HierarchicalReconciler.methods:
+            with self.subTest(method=method):
+                recon = HierarchicalReconciler(self.hierarchy, method=method)
+                all_nodes = recon.fit(self.history).transform(self.history)
+                forecast = all_nodes.iloc[-7:] * self.noise
+                result = recon.reconcile(forecast)
+                S = recon.S.toarray()
+                coherent = (S @ result[recon.bottom_ids].to_numpy().T).T
+                self.assertTrue(np.allclose(result.to_numpy(), coherent))
+                if method in ["ols", "wls_struct", "wls_var"]:
+                    # matches the dense generalized least squares solution
+                    W = np.diag(1 / recon.weights)
+                    y = forecast.to_numpy().T
+                    expected = np.linalg.solve(S.T @ W @ S, S.T @ W @ y).T
+                    self.assertTrue(
+                        np.allclose(result[recon.bottom_ids].to_numpy(), expected)
+                    )
+
+    def test_reconcile_prediction(self):
+        recon = HierarchicalReconciler(self.hierarchy, method="ols")
+        all_nodes = recon.fit(self.history).transform(self.history)
+        forecast = all_nodes.iloc[-7:] * self.noise
+        prediction = PredictionObject(
+            forecast=forecast,
+            upper_forecast=forecast * 1.2,
+            lower_forecast=forecast * 0.8,
+        )
+        prediction = recon.reconcile_prediction(prediction)
+        self.assertTrue((prediction.upper_forecast >= prediction.forecast).all().all())
+        self.assertTrue((prediction.lower_forecast <= prediction.forecast).all().all())
+        self.assertTrue(
+            np.allclose(
+                prediction.forecast["total"],
+                prediction.forecast[recon.bottom_ids].sum(axis=1),
+            )
+        )
+
+    def test_reconcile_prediction_quantiles(self):
+        recon = HierarchicalReconciler(self.hierarchy, method="ols")
+        all_nodes = recon.fit(self.history).transform(self.history)
+        # columns not in node order, as the reconciled output is reordered
+        forecast = (all_nodes.iloc[-7:] * self.noise).iloc[:, ::-1]
+        quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+        scale = np.array([0.7, 0.9, 1.0, 1.1, 1.3])[:, np.newaxis, np.newaxis]
+        prediction = PredictionObject(
+            forecast=forecast,
+            upper_forecast=forecast * 1.3,
+            lower_forecast=forecast * 0.7,
+            prediction_interval=0.9,
+        )
+        prediction.quantiles = quantiles
+        prediction.quantile_forecast = forecast.to_numpy() * scale
+        prediction = recon.reconcile_prediction(prediction)
+        levels = prediction.quantile_forecast
+        self.assertEqual(levels.shape, (5, 7, len(recon.node_ids)))
+        self.assertTrue(np.all(np.diff(levels, axis=0) >= 0))
+        self.assertTrue(np.allclose(prediction.quantile(0.5), prediction.forecast))
+        self.assertTrue(
+            np.allclose(prediction.quantile(0.95), prediction.upper_forecast)
+        )
+        self.assertTrue(
+            np.allclose(prediction.quantile(0.05), prediction.lower_forecast)
+        )
+        for q in quantiles:
+            level = prediction.quantile(q)
+            self.assertTrue(
+                np.allclose(level["total"], level[recon.bottom_ids].sum(axis=1))
+            )
+        # already coherent quantiles are unchanged, and labelled with their own series
+        coherent = all_nodes.iloc[-7:].iloc[:, ::-1]
+        prediction = PredictionObject(
+            forecast=coherent,
+            upper_forecast=coherent * 1.3,
+            lower_forecast=coherent * 0.7,
+            prediction_interval=0.9,
+        )
+        prediction.quantiles = quantiles
+        prediction.quantile_forecast = coherent.to_numpy() * scale
+        prediction = recon.reconcile_prediction(prediction)
+        self.assertTrue(
+            np.allclose(prediction.quantile(0.75), all_nodes.iloc[-7:] * 1.1)
+        )
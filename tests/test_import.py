@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Test lazy loading and import time of the package."""
+import os
+import subprocess
+import sys
+import unittest
+
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+heavy_modules = ["sklearn", "scipy", "statsmodels", "joblib"]
+
+
+def run_python(code):
+    """Run code in a fresh interpreter, as a short-lived worker would, and return stdout."""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=repo_dir,
+    ).stdout.strip()
+
+
+class TestImport(unittest.TestCase):
+    def test_lazy_namespace(self):
+        loaded = run_python(
+            "import sys, autots; "
+            "print([x for x in ['numpy', 'pandas'] + "
+            f"{heavy_modules} if x in sys.modules])"
+        )
+        self.assertEqual(loaded, "[]")
+        import autots
+        from autots.evaluator.auto_ts import AutoTS
+        from autots.tools.transform import GeneralTransformer
+
+        self.assertIs(autots.AutoTS, AutoTS)
+        self.assertIs(autots.TransformTS, GeneralTransformer)
+        self.assertTrue(set(autots.__all__).issubset(dir(autots)))
+        with self.assertRaises(AttributeError):
+            autots.not_a_real_attribute
+
+    def test_light_imports(self):
+        loaded = run_python(
+            "import sys; "
+            "from autots import AutoTS, GeneralTransformer, model_forecast, load_daily; "
+            "from autots.evaluator.auto_model import ModelMonster; "
+            "ModelMonster('LastValueNaive'); "
+            f"print([x for x in {heavy_modules} if x in sys.modules])"
+        )
+        self.assertEqual(loaded, "[]")
+
+    def test_import_time(self):
+        print("Starting test_import_time")
+        # reported only, relative to numpy and pandas, as wall clock varies by machine
+        code = (
+            "import timeit; start = timeit.default_timer(); import numpy, pandas; "
+            "middle = timeit.default_timer(); from autots import AutoTS; "
+            "print(middle - start, timeit.default_timer() - middle)"
+        )
+        runs = [[float(x) for x in run_python(code).split()] for _ in range(3)]
+        base, runtime = min(runs, key=lambda x: x[1])
+        print(
+            f"autots import time: {round(runtime, 4)}, "
+            f"{round(runtime / base, 2)}x that of numpy and pandas"
+        )
@@ -40,3 +40,26 @@ class TestImpute(unittest.TestCase):
             runtime_custom < runtime_np,
             "Failed to assert custom percentile was faster than numpy percentile. Rerun may fix."
         )
+
+    def test_quantile_options(self):
+        print("Starting test_quantile_options")
+        rng = np.random.default_rng(0)
+        arr = rng.normal(size=(50, 4, 6))
+        arr[rng.random(arr.shape) < 0.1] = np.nan
+        # only some columns contain NaN
+        arr[:, 0, :] = rng.normal(size=(50, 6))
+        original = arr.copy()
+        for axis in [0, 1, 2, -1]:
+            for method in ["linear", "nearest", "lower", "higher", "midpoint"]:
+                res1 = nan_quantile(arr, q=[0.1, 0.5, 0.9], method=method, axis=axis)
+                res2 = np.nanquantile(arr, [0.1, 0.5, 0.9], method=method, axis=axis)
+                self.assertTrue(np.allclose(res1, res2), msg=f"{method} {axis}")
+        self.assertEqual(nan_quantile(arr, q=0.5).shape, (4, 6))
+        # input is not modified, including the 2D case
+        self.assertTrue(np.array_equal(arr, original, equal_nan=True))
+        arr_2d = original[:, :, 0].copy()
+        nan_percentile(arr_2d, q=[25, 75])
+        self.assertTrue(np.array_equal(arr_2d, original[:, :, 0], equal_nan=True))
+        # all NaN series return NaN
+        arr_2d[:, 1] = np.nan
+        self.assertTrue(np.isnan(nan_quantile(arr_2d, q=0.5)[1]))
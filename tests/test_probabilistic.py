@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Test point to probabilistic bounds."""
+import unittest
+import numpy as np
+import pandas as pd
+from scipy.stats import percentileofscore
+from autots.tools.probabilistic import (
+    Point_to_Probability,
+    percentileofscore_array,
+    point_to_quantiles,
+)
+
+
+class TestProbabilistic(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.train = pd.DataFrame(
+            rng.gamma(2, 5, (200, 6)),
+            index=pd.date_range("2020-01-01", periods=200, freq="D"),
+        )
+        self.train.iloc[10:15, 2] = np.nan
+        self.forecast = pd.DataFrame(
+            rng.gamma(2, 5, (10, 6)),
+            index=pd.date_range("2020-07-19", periods=10, freq="D"),
+        )
+
+    def test_percentileofscore_array(self):
+        rng = np.random.default_rng(1)
+        a = rng.normal(size=(50, 5)).round(1)
+        a[rng.random(a.shape) < 0.1] = np.nan
+        scores = rng.normal(size=(8, 5)).round(1)
+        scores[0, 0] = np.nan
+        result = percentileofscore_array(a, scores, max_cells=100)
+        for col in range(a.shape[1]):
+            dist = a[:, col][~np.isnan(a[:, col])]
+            expected = [percentileofscore(dist, x, kind="rank") for x in scores[:, col]]
+            self.assertTrue(np.allclose(result[:, col], expected, equal_nan=True))
+
+    def test_point_to_quantiles(self):
+        for method in ["historic_quantile", "inferred_normal", "variable_pct_change"]:
+            with self.subTest(method=method):
+                upper, lower = Point_to_Probability(
+                    self.train, self.forecast, prediction_interval=0.8, method=method
+                )
+                self.assertTrue(upper.index.equals(self.forecast.index))
+                self.assertFalse(upper.isnull().any().any())
+                result = point_to_quantiles(
+                    self.train, self.forecast, [0.1, 0.5, 0.9], method=method
+                )
+                self.assertEqual(result.shape, (3, 10, 6))
+                self.assertTrue(np.allclose(result[0], lower))
+                self.assertTrue(np.allclose(result[1], self.forecast))
+                self.assertTrue(np.allclose(result[2], upper))
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Test data shaping."""
+import unittest
+import numpy as np
+import pandas as pd
+from autots.tools.shaping import long_to_wide, df_cleanup, NumericTransformer
+
+
+class TestShaping(unittest.TestCase):
+
+    def test_long_to_wide(self):
+        print("Starting test_long_to_wide")
+        rng = np.random.default_rng(2020)
+        n = 20000
+        dates = pd.date_range("2021-01-01", periods=200, freq="D")
+        df = pd.DataFrame({
+            "datetime": rng.choice(dates.astype(str), n),
+            "series_id": rng.choice([f"series_{i}" for i in range(50)], n),
+            "value": rng.normal(size=n),
+        })
+        df.loc[rng.choice(n, 200), "value"] = np.nan
+        df.loc[df["series_id"] == "series_3", "value"] = np.nan
+        df_dt = df.assign(datetime=pd.to_datetime(df["datetime"]))
+
+        for aggfunc in ["first", "last", "sum", "mean", "min", "max", "count", np.sum]:
+            with self.subTest(aggfunc=aggfunc):
+                result = long_to_wide(df, aggfunc=aggfunc)
+                expected = df_dt.pivot_table(
+                    values="value", index="datetime", columns="series_id", aggfunc=aggfunc
+                ).sort_index()
+                self.assertTrue(result.index.equals(expected.index))
+                self.assertTrue(result.columns.equals(expected.columns))
+                self.assertTrue(
+                    np.allclose(result.to_numpy(), expected.to_numpy(dtype=float), equal_nan=True)
+                )
+
+        result = long_to_wide(df, dtype="float32")
+        self.assertTrue((result.dtypes == np.float32).all())
+        # categorical values still use pivot_table
+        result = long_to_wide(df.assign(value=df["value"].round(0).astype(str)))
+        self.assertEqual(result.shape, expected.shape)
+
+        try:
+            import pyarrow as pa
+        except Exception:
+            return
+        table = pa.Table.from_pandas(df)
+        self.assertTrue(long_to_wide(table).equals(long_to_wide(df)))
+
+    def test_df_cleanup(self):
+        print("Starting test_df_cleanup")
+        index = pd.date_range("2021-01-01", periods=100, freq="D")
+        df = pd.DataFrame(np.arange(200).reshape(100, 2), index=index, columns=["a", "b"])
+        df = df.drop(index[[5, 10, 11]])
+        for aggfunc in ["first", "sum"]:
+            with self.subTest(aggfunc=aggfunc):
+                result = df_cleanup(df, frequency="infer", aggfunc=aggfunc, verbose=0)
+                expected = df.resample("D").apply(aggfunc)
+                self.assertTrue(result.equals(expected))
+
+    def test_numeric_transformer(self):
+        print("Starting test_numeric_transformer")
+        rng = np.random.default_rng(2021)
+        index = pd.date_range("2021-01-01", periods=60, freq="D")
+        df = pd.DataFrame(rng.normal(size=(60, 5)), index=index)
+        df.columns = [f"num_{i}" for i in range(5)]
+        df["category"] = rng.choice(["a", "b", "c", ""], 60)
+        df["numeric_str"] = rng.normal(size=60).round(2).astype(str)
+        df["mixed"] = df["numeric_str"].where(rng.random(60) > 0.2, "x")
+
+        transformer = NumericTransformer(chunk_size=2)
+        result = transformer.fit_transform(df.copy())
+        self.assertTrue((result.dtypes == float).all())
+        self.assertEqual(transformer.categorical_features, ["category", "mixed"])
+        self.assertTrue(
+            np.allclose(result["numeric_str"], df["numeric_str"].astype(float))
+        )
+        self.assertTrue(transformer.transform(df.copy()).equals(result))
+
+        inverse = transformer.inverse_transform(result)
+        self.assertTrue((inverse["mixed"] == df["mixed"]).all())
+        # empty strings are treated as NaN and filled
+        filled = df["category"] != ""
+        self.assertTrue((inverse["category"][filled] == df["category"][filled]).all())